@@ -5,6 +5,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 from rest_framework.permissions import AllowAny
 from rest_framework.permissions import IsAdminUser
 from rest_framework.permissions import IsAuthenticated
@@ -73,6 +74,7 @@ DJANGO_APPS = [
     "django.contrib.staticfiles",
     # "django.contrib.humanize", # Handy template tags
     "django.contrib.admin",
+    "django.contrib.postgres",
     "django.forms",
 ]
 THIRD_PARTY_APPS = [
@@ -90,6 +92,7 @@ THIRD_PARTY_APPS = [
     "rest_framework.authtoken",
     "corsheaders",
     "drf_spectacular",
+    "import_export",
     # "cloudinary",
     # "cloudinary_storage",
     "channels",
@@ -285,6 +288,51 @@ LOGGING = {
 REDIS_URL = env("REDIS_URL", default="redis://redis:6379/0")
 REDIS_SSL = REDIS_URL.startswith("rediss://")
 
+# Celery
+# ------------------------------------------------------------------------------
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-timezone
+CELERY_TIMEZONE = TIME_ZONE
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-broker_url
+CELERY_BROKER_URL = REDIS_URL
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#redis-backend-use-ssl
+CELERY_BROKER_USE_SSL = {"ssl_cert_reqs": "none"} if REDIS_SSL else None
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-result_backend
+CELERY_RESULT_BACKEND = REDIS_URL
+CELERY_REDIS_BACKEND_USE_SSL = CELERY_BROKER_USE_SSL
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-extended
+CELERY_RESULT_EXTENDED = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-accept_content
+CELERY_ACCEPT_CONTENT = ["json"]
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-task_serializer
+CELERY_TASK_SERIALIZER = "json"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-result_serializer
+CELERY_RESULT_SERIALIZER = "json"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-time-limit
+CELERY_TASK_TIME_LIMIT = 30 * 60
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#task-soft-time-limit
+CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
+CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
+CELERY_WORKER_SEND_TASK_EVENTS = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
+CELERY_TASK_SEND_SENT_EVENT = True
+# Periodic tasks; DatabaseScheduler copies these into django_celery_beat on start.
+CELERY_BEAT_SCHEDULE = {
+    "rebuild-similar-properties": {
+        "task": "core.applications.property.tasks.rebuild_similar_properties",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    "repair-engagement-counters": {
+        "task": "core.applications.property.tasks.repair_engagement_counters",
+        "schedule": crontab(hour=3, minute=30),
+    },
+    "expire-featured-listings": {
+        "task": "core.applications.subscriptions.tasks.expire_featured_listings",
+        "schedule": crontab(minute="*/5"),
+    },
+}
+
 
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -457,6 +505,50 @@ SITE_URL = env("SITE_URL", default="http://localhost:8000/")
 # Default property image URL
 DEFAULT_PROPERTY_IMAGE_URL = "/static/images/placeholder.jpg"
 
+# Minimum pg_trgm score for fuzzy location matches ("Lekki Phse 1" → "Lekki Phase 1").
+# Also set as each connection's pg_trgm operator thresholds, so the trigram
+# GIN indexes pre-filter at the same score (property/signals.py).
+PROPERTY_LOCATION_SIMILARITY_THRESHOLD = env.float(
+    "PROPERTY_LOCATION_SIMILARITY_THRESHOLD",
+    default=0.4,
+)
+
+# Paginated list counts (core.helpers.paginations.CachedCountPaginator), used
+# by the public property list / search; other endpoints count exactly.
+# Counts are cached per filter set for this many seconds; result sets larger
+# than the threshold report a Postgres estimate and set "approximate": true.
+PAGINATION_COUNT_CACHE_TIMEOUT = env.int("PAGINATION_COUNT_CACHE_TIMEOUT", default=60)
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = env.int(
+    "PAGINATION_COUNT_ESTIMATE_THRESHOLD",
+    default=10_000,
+)
+
+# Nominatim requires an identifying User-Agent (manage.py geocode_properties).
+GEOCODER_USER_AGENT = env("GEOCODER_USER_AGENT", default="rem-property-geocoder")
+
+# Filter-sidebar facet counts are cached per normalised filter set.
+PROPERTY_FACETS_CACHE_TIMEOUT = env.int("PROPERTY_FACETS_CACHE_TIMEOUT", default=120)
+# Map clusters are cached per geohash cell and filter set.
+PROPERTY_CLUSTER_CACHE_TIMEOUT = env.int("PROPERTY_CLUSTER_CACHE_TIMEOUT", default=300)
+# Home page payload / agent strip cache (core.applications.property.home_page).
+HOME_PAGE_CACHE_TIMEOUT = env.int("HOME_PAGE_CACHE_TIMEOUT", default=300)
+HOME_AGENT_STRIP_LIMIT = env.int("HOME_AGENT_STRIP_LIMIT", default=8)
+# Boosts flipped to inactive per transaction by the featured-listing sweeper
+# (subscriptions.services.boost.deactivate_expired_boosts).
+FEATURED_EXPIRY_BATCH_SIZE = env.int("FEATURED_EXPIRY_BATCH_SIZE", default=500)
+# "Similar properties" neighbours precomputed per listing (similarity.py).
+PROPERTY_SIMILAR_TOP_K = env.int("PROPERTY_SIMILAR_TOP_K", default=8)
+# Rows saved per transaction by the bulk property importer (importer.py).
+PROPERTY_IMPORT_CHUNK_SIZE = env.int("PROPERTY_IMPORT_CHUNK_SIZE", default=500)
+# Concurrent storage writes per gallery batch upload (gallery.py).
+PROPERTY_IMAGE_UPLOAD_WORKERS = env.int("PROPERTY_IMAGE_UPLOAD_WORKERS", default=4)
+# Rows fetched per server-side cursor round trip by streaming CSV / NDJSON
+# exports (core/helpers/exports.py).
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", default=2000)
+# Render full listing cards from values() rows instead of PropertyCardSerializer
+# (card_renderer.py); the JSON is identical, this is only an escape hatch.
+PROPERTY_CARD_FAST_PATH = env.bool("PROPERTY_CARD_FAST_PATH", default=True)
+
 
 # Paystack Keys and integrations
 PAYSTACK_SECRET_KEY = env("PAYSTACK_SECRET_KEY", default="")
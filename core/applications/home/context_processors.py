@@ -1,8 +1,10 @@
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 
 from core.applications.notifications.models import Announcement
 from core.applications.notifications.models import Notification
 from core.applications.property.models import FavoriteProperty, Lead, Property, PropertyViewing
+from core.applications.property.models import ListingCategoryCounter
 from core.helpers.enums import ICON_CLASSES, IMAGE_PATHS
 from core.helpers.enums import PropertyTypeChoices
 from django.db.models import Count, Sum
@@ -33,10 +35,10 @@ def user_context(request):
             }
             for choice in PropertyTypeChoices
         ],
-        "property_listing_type_counts": {
-            choice.value: PropertyTypeChoices.choices.count(choice)
-            for choice in PropertyTypeChoices
-        },
+        # Lazy: only pages rendering the category grid read the counters.
+        "property_listing_type_counts": SimpleLazyObject(
+            ListingCategoryCounter.objects.by_property_type,
+        ),
     }
 
     # Add user-specific data if authenticated
@@ -89,6 +91,9 @@ def agent_dashboard_context(request):
     - Active listings
     - Property views
     - Property overview list
+
+    The counts are AgentProfile counter columns (see
+    core.applications.property.counters), so no COUNT query runs.
     """
 
     if not request.user.is_authenticated or not hasattr(request.user, "agent_profile"):
@@ -96,21 +101,6 @@ def agent_dashboard_context(request):
 
     agent = request.user.agent_profile
 
-    # Total properties listed by agent
-    total_properties = Property.objects.filter(agent=agent).count()
-
-    # Active listings
-    active_listings = Property.objects.filter(agent=agent, is_available=True).count()
-
-    # Total property views
-    total_views = PropertyViewing.objects.filter(property__agent=agent).count()
-
-    # Total deals closed
-    total_deals = Lead.objects.filter(
-        property_link__agent=agent,
-        status__in=["closed", "completed"]
-    ).count()
-
     # Total commission earned (placeholder)
     total_commission = 0
 
@@ -121,10 +111,10 @@ def agent_dashboard_context(request):
     )
 
     return {
-        "total_properties": total_properties,
-        "active_listings": active_listings,
-        "total_property_views": total_views,
-        "total_deals_closed": total_deals,
+        "total_properties": agent.total_listings,
+        "active_listings": agent.active_listings,
+        "total_property_views": agent.total_viewings,
+        "total_deals_closed": agent.closed_deals,
         "total_commission_earned": total_commission,
         "property_overview": property_overview,
     }
@@ -22,6 +22,7 @@ from django.views.generic import TemplateView
 from django.views.generic.edit import FormView
 
 from core.applications.home.forms import ContactForm
+from core.applications.property import home_page
 from core.applications.property.models import FavoriteProperty
 from core.applications.property.models import Property
 from core.applications.property.models import PropertyImage
@@ -38,8 +39,8 @@ class HomeView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["properties"] = Property.objects.available().featured_first()[:6]
-        context["agents_profile"] = AgentProfile.objects.filter(verified=True)
+        context["properties"] = home_page.get_featured_properties()
+        context["agents_profile"] = home_page.get_agent_strip()
         context["property_types"] = PropertyTypeChoices.choices
         return context
 
@@ -91,6 +91,12 @@ class Notification(TitleTimeBasedModel):
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "is_read", "-created_at"],
+                name="notif_user_read_recent_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} for {self.user}"
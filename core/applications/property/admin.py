@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from import_export.admin import ImportExportModelAdmin
 
 from core.applications.property.models import Amenity
 from core.applications.property.models import FavoriteProperty
@@ -8,6 +9,7 @@ from core.applications.property.models import Property
 from core.applications.property.models import PropertyImage
 from core.applications.property.models import PropertySubscription
 from core.applications.property.models import PropertyType
+from core.applications.property.resources import PropertyResource
 
 # Register your models here.
 
@@ -18,7 +20,8 @@ class PropertyImageInline(admin.TabularInline):
 
 
 @admin.register(Property)
-class PropertyAdmin(admin.ModelAdmin):
+class PropertyAdmin(ImportExportModelAdmin):
+    resource_classes = [PropertyResource]
     inlines = [PropertyImageInline]
     list_display = ["id", "title", "price", "location", "is_available"]
     search_fields = ["title", "location"]
@@ -67,6 +67,13 @@ for authenticated favorite annotation.)
                             "is_featured": True,
                             "is_favorited": False,
                             "main_image_url": "https://example.com/media/properties/villa.jpg",
+                            "main_image_srcset": {
+                                "webp": (
+                                    "https://example.com/media/properties/villa-card.webp 400w, "
+                                    "https://example.com/media/properties/villa-gallery.webp 1024w, "
+                                    "https://example.com/media/properties/villa-hero.webp 1920w"
+                                ),
+                            },
                             "agent": {
                                 "id": "7cb4a123-9abc-4def-8123-4d5e6f7a8b9c",
                                 "full_name": "Emeka Okafor",
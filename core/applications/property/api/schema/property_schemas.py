@@ -6,8 +6,67 @@ from drf_spectacular.utils import extend_schema_view
 from core.applications.property.api.serializers import AgentSummarySerializer
 from core.applications.property.api.serializers import PropertyCardSerializer
 from core.applications.property.api.serializers import PropertyDetailSerializer
+from core.applications.property.api.serializers import PropertyGalleryUploadSerializer
+from core.applications.property.api.serializers import PropertyImageSerializer
+from core.applications.property.api.serializers import PropertyImportReportSerializer
+from core.applications.property.api.serializers import PropertyImportSerializer
 from core.applications.property.api.serializers import PropertyWriteSerializer
 
+# Filters shared by the list and facets endpoints.
+LISTING_FILTER_PARAMETERS = [
+    OpenApiParameter("listing_type", OpenApiTypes.STR, description="Sale, Rent, Short-let"),
+    OpenApiParameter("property_type", OpenApiTypes.STR, description="Apartment, Duplex, etc."),
+    OpenApiParameter("location", OpenApiTypes.STR),
+    OpenApiParameter(
+        "location_match", OpenApiTypes.STR,
+        description="fuzzy (default, typo-tolerant) or contains",
+    ),
+    OpenApiParameter("min_price", OpenApiTypes.NUMBER),
+    OpenApiParameter("max_price", OpenApiTypes.NUMBER),
+    OpenApiParameter("min_bedrooms", OpenApiTypes.INT),
+    OpenApiParameter("max_bedrooms", OpenApiTypes.INT),
+    OpenApiParameter("min_bathrooms", OpenApiTypes.INT),
+    OpenApiParameter("amenities", OpenApiTypes.STR, description="Comma-separated IDs"),
+    OpenApiParameter(
+        "amenity_match", OpenApiTypes.STR,
+        description="any (default) — has at least one of the amenities; all — has every one",
+    ),
+    OpenApiParameter("is_available", OpenApiTypes.BOOL),
+    OpenApiParameter(
+        "search", OpenApiTypes.STR,
+        description="Full-text query (websearch syntax); results are relevance-ranked unless ordering is set",
+    ),
+    OpenApiParameter("search_mode", OpenApiTypes.STR, description="fts (default) or contains"),
+    OpenApiParameter("lat", OpenApiTypes.NUMBER, description="Latitude of the search centre (with lng)"),
+    OpenApiParameter("lng", OpenApiTypes.NUMBER, description="Longitude of the search centre (with lat)"),
+    OpenApiParameter("radius_km", OpenApiTypes.NUMBER, description="Only listings within this distance of lat/lng"),
+    OpenApiParameter(
+        "bbox", OpenApiTypes.STR,
+        description="Map viewport as 'west,south,east,north' (Leaflet toBBoxString order)",
+    ),
+]
+
+SPARSE_FIELDSET_PARAMETERS = [
+    OpenApiParameter(
+        "fields", OpenApiTypes.STR,
+        description="Comma-separated top-level fields to return (e.g. id,title,price); others are skipped",
+    ),
+    OpenApiParameter("omit", OpenApiTypes.STR, description="Comma-separated top-level fields to leave out"),
+]
+
+# Column choice and format for the streaming export endpoints.
+EXPORT_PARAMETERS = [
+    OpenApiParameter("fields", OpenApiTypes.STR, description="Comma-separated columns to export (default: all)"),
+    OpenApiParameter("omit", OpenApiTypes.STR, description="Comma-separated columns to leave out"),
+    OpenApiParameter("file_format", OpenApiTypes.STR, description="csv (default) or ndjson"),
+]
+
+# Streamed file bodies, not JSON documents.
+EXPORT_RESPONSES = {
+    (200, "text/csv"): OpenApiTypes.STR,
+    (200, "application/x-ndjson"): OpenApiTypes.STR,
+}
+
 PropertyViewSetSchema = extend_schema_view(
     # ------------------------------------------------------------------
     # LIST
@@ -25,18 +84,21 @@ This endpoint powers:
 Supports extensive filtering, search, and ordering.
         """,
         parameters=[
-            OpenApiParameter("listing_type", OpenApiTypes.STR, description="Sale, Rent, Short-let"),
-            OpenApiParameter("property_type", OpenApiTypes.STR, description="Apartment, Duplex, etc."),
-            OpenApiParameter("location", OpenApiTypes.STR),
-            OpenApiParameter("min_price", OpenApiTypes.NUMBER),
-            OpenApiParameter("max_price", OpenApiTypes.NUMBER),
-            OpenApiParameter("min_bedrooms", OpenApiTypes.INT),
-            OpenApiParameter("max_bedrooms", OpenApiTypes.INT),
-            OpenApiParameter("min_bathrooms", OpenApiTypes.INT),
-            OpenApiParameter("amenities", OpenApiTypes.STR, description="Comma-separated IDs"),
-            OpenApiParameter("is_available", OpenApiTypes.BOOL),
-            OpenApiParameter("search", OpenApiTypes.STR),
-            OpenApiParameter("ordering", OpenApiTypes.STR),
+            *LISTING_FILTER_PARAMETERS,
+            *SPARSE_FIELDSET_PARAMETERS,
+            OpenApiParameter(
+                "ordering", OpenApiTypes.STR,
+                description="price, created_at, bedrooms, sqft, title or distance (needs lat/lng); prefix '-' for descending",
+            ),
+            OpenApiParameter(
+                "pagination", OpenApiTypes.STR,
+                description="'cursor' for keyset pagination (next/previous cursors, no total)",
+            ),
+            OpenApiParameter("cursor", OpenApiTypes.STR, description="Opaque cursor from a previous next/previous link"),
+            OpenApiParameter(
+                "source", OpenApiTypes.STR,
+                description="property (default) or document — read the flattened search-document table",
+            ),
         ],
         responses={200: PropertyCardSerializer(many=True)},
         tags=["Properties"],
@@ -57,6 +119,7 @@ Includes:
 - Agent info
 - Similar properties (pre-fetched, no extra query)
         """,
+        parameters=SPARSE_FIELDSET_PARAMETERS,
         responses={200: PropertyDetailSerializer()},
         tags=["Properties"],
     ),
@@ -78,6 +141,104 @@ Create a new property listing.
         tags=["Properties"],
     ),
 
+    # ------------------------------------------------------------------
+    # CUSTOM ACTION: BULK IMPORT
+    # ------------------------------------------------------------------
+    import_listings=extend_schema(
+        summary="Bulk Import Properties",
+        description="""
+Import many listings for the authenticated agent from one file.
+
+- `file`: `.csv`, `.json` (an array of objects) or `.ndjson` / `.jsonl`
+- Columns / keys are the create fields; `amenities` holds amenity names and
+  `images` / `cover_image` name files already in media storage (CSV cells
+  separate list items with `|`)
+- Rows are saved in chunks; invalid rows, and rows past the plan's listing
+  limit, are skipped and reported by row number
+- `dry_run=true` validates without saving
+        """,
+        request={"multipart/form-data": PropertyImportSerializer()},
+        responses={200: PropertyImportReportSerializer()},
+        tags=["Properties"],
+    ),
+
+    # ------------------------------------------------------------------
+    # CUSTOM ACTION: GALLERY UPLOAD
+    # ------------------------------------------------------------------
+    upload_images=extend_schema(
+        summary="Upload Gallery Images",
+        description="""
+Append a batch of images to a listing's gallery. Only the owning agent may upload.
+
+- `images`: one or more image files (repeat the field)
+- New images are placed after the existing ones
+- The whole batch is rejected when it would exceed the plan's
+  images-per-property limit
+- Returns once the files are stored; `srcset` stays empty until the
+  WebP / AVIF renditions are generated in the background
+        """,
+        request={"multipart/form-data": PropertyGalleryUploadSerializer()},
+        responses={201: PropertyImageSerializer(many=True)},
+        tags=["Properties"],
+    ),
+
+    # ------------------------------------------------------------------
+    # CUSTOM ACTIONS: EXPORTS
+    # ------------------------------------------------------------------
+    export_listings=extend_schema(
+        summary="Export Agent Listings",
+        description="""
+Download every listing owned by the authenticated agent.
+
+- Streamed as CSV (header row first) or NDJSON, one row per listing
+- Columns: id, title, slug, property_type, property_listing, price,
+  location, latitude, longitude, bedrooms, bathrooms, sqft, is_available,
+  visible, is_featured, featured_until, lead_count, viewing_count,
+  favorite_count, created_at, updated_at
+- `ordering` as on the agent dashboard table
+        """,
+        parameters=[
+            *EXPORT_PARAMETERS,
+            OpenApiParameter("ordering", OpenApiTypes.STR),
+        ],
+        responses=EXPORT_RESPONSES,
+        tags=["Properties"],
+    ),
+    export_leads=extend_schema(
+        summary="Export Agent Leads",
+        description="""
+Download the leads on the authenticated agent's listings.
+
+- Streamed as CSV or NDJSON, newest first
+- Columns: id, status, message, notes, last_contact, user_name,
+  user_email, user_phone_number, property_id, property_title,
+  property_slug, created_at
+        """,
+        parameters=[
+            *EXPORT_PARAMETERS,
+            OpenApiParameter("status", OpenApiTypes.STR, description="Only leads in this pipeline status"),
+        ],
+        responses=EXPORT_RESPONSES,
+        tags=["Properties"],
+    ),
+    export_viewings=extend_schema(
+        summary="Export Agent Viewings",
+        description="""
+Download the viewings booked on the authenticated agent's listings.
+
+- Streamed as CSV or NDJSON, latest scheduled time first
+- Columns: id, status, scheduled_time, notes, cancellation_reason,
+  user_name, user_email, user_phone_number, property_id, property_title,
+  property_slug, lead_id, created_at
+        """,
+        parameters=[
+            *EXPORT_PARAMETERS,
+            OpenApiParameter("status", OpenApiTypes.STR, description="Only viewings in this status"),
+        ],
+        responses=EXPORT_RESPONSES,
+        tags=["Properties"],
+    ),
+
     # ------------------------------------------------------------------
     # UPDATE
     # ------------------------------------------------------------------
@@ -87,6 +248,10 @@ Create a new property listing.
 Fully update a property.
 
 - Only the owning agent can update
+- `images`, when sent, is the whole gallery: each entry is the `id` of an
+  existing image or a new `image` file, with an optional `order`; images
+  left out are removed, and a file identical to one already in the
+  gallery is not stored again
         """,
         request={"multipart/form-data": PropertyWriteSerializer()},
         responses={200: PropertyDetailSerializer()},
@@ -102,6 +267,10 @@ Fully update a property.
 Partially update a property.
 
 - Only the owning agent can update
+- `images`, when sent, is the whole gallery: each entry is the `id` of an
+  existing image or a new `image` file, with an optional `order`; images
+  left out are removed, and a file identical to one already in the
+  gallery is not stored again
         """,
         request={"multipart/form-data": PropertyWriteSerializer()},
         responses={200: PropertyDetailSerializer()},
@@ -122,6 +291,50 @@ Delete a property listing.
         tags=["Properties"],
     ),
 
+    # ------------------------------------------------------------------
+    # CUSTOM ACTION: FACETS
+    # ------------------------------------------------------------------
+    facets=extend_schema(
+        summary="Listing Filter Facets",
+        description="""
+Counts for the listing filter sidebar, computed for the current filter set.
+
+Accepts the same filters as the list endpoint and returns counts per:
+- Listing type and property type
+- Bedrooms (1, 2, 3, 4, 5+) and bathrooms (1+ … 4+)
+- Amenity
+- Price band, per listing type
+
+Computed in one aggregate query and cached briefly per filter set.
+        """,
+        parameters=LISTING_FILTER_PARAMETERS,
+        responses={200: OpenApiTypes.OBJECT},
+        tags=["Properties"],
+    ),
+
+    # ------------------------------------------------------------------
+    # CUSTOM ACTION: CLUSTERS
+    # ------------------------------------------------------------------
+    clusters=extend_schema(
+        summary="Map Clusters",
+        description="""
+Clustered map pins for a viewport.
+
+Returns one entry per non-empty geohash cell covering `bbox`, with:
+- `geohash`, `bounds` ([west, south, east, north]) and centroid `latitude` / `longitude`
+- `count`, `min_price` and `max_price` of matching listings
+
+`zoom` (0-22) sets the cell size. Accepts the same filters as the list
+endpoint. Cells are cached individually per filter set.
+        """,
+        parameters=[
+            *LISTING_FILTER_PARAMETERS,
+            OpenApiParameter("zoom", OpenApiTypes.INT, required=True, description="Map zoom level, 0-22"),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+        tags=["Properties"],
+    ),
+
     # ------------------------------------------------------------------
     # CUSTOM ACTION: SIMILAR
     # ------------------------------------------------------------------
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from rest_framework import serializers
 
 from core.applications.property.models import Amenity
@@ -7,8 +9,10 @@ from core.applications.property.models import FavoriteProperty
 from core.applications.property.models import Lead
 from core.applications.property.models import Property
 from core.applications.property.models import PropertyImage
+from core.applications.property.models import PropertySearchDocument
 from core.applications.property.models import PropertySubscription
 from core.applications.property.models import PropertyViewing
+from core.applications.property.renditions import srcset
 
 # ---------------------------------------------------------------------------
 # Shared mixin
@@ -26,6 +30,69 @@ class AbsoluteURLMixin:
         request = self.context.get("request")
         return request.build_absolute_uri(path) if request else path
 
+    def _srcset(self, renditions: dict, storage) -> dict[str, str]:
+        """``{format: srcset}`` for image ``renditions`` saved in ``storage``."""
+        return srcset(renditions, lambda name: self._absolute_url(storage.url(name)))
+
+
+@dataclass(frozen=True)
+class SparseFieldset:
+    """
+    Field selection from ``?fields=id,title,price`` (keep only these) and /
+    or ``?omit=agent,images`` (drop these).  Names are top-level serializer
+    field names; unknown names are ignored.
+    """
+
+    fields: frozenset[str] | None
+    omit: frozenset[str]
+
+    @classmethod
+    def from_request(cls, request) -> SparseFieldset | None:
+        params = getattr(request, "query_params", None) or {}
+        fields = {name.strip() for name in params.get("fields", "").split(",") if name.strip()}
+        omit = {name.strip() for name in params.get("omit", "").split(",") if name.strip()}
+        if not fields and not omit:
+            return None
+        return cls(frozenset(fields) if fields else None, frozenset(omit))
+
+    def wants(self, name: str) -> bool:
+        return (self.fields is None or name in self.fields) and name not in self.omit
+
+    def select(self, names) -> set[str]:
+        """The subset of ``names`` this selection keeps."""
+        return {name for name in names if self.wants(name)}
+
+
+class SparseFieldsMixin:
+    """
+    Trims the serializer to ``context["sparse_fields"]`` (a
+    ``SparseFieldset``, set by the API views' ``_ctx()``), so unrequested
+    fields — and the method fields / nested serializers behind them — are
+    never evaluated.
+
+    Only the outermost serializer (or the child of an outermost
+    ``many=True`` list) is trimmed; nested serializers keep their full
+    shape.  Serializers built by hand inside a method field should be given
+    ``self.nested_context``.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.context.get("sparse_fields")
+        if selection is None or not self._is_outermost():
+            return fields
+        return {name: field for name, field in fields.items() if selection.wants(name)}
+
+    def _is_outermost(self) -> bool:
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    @property
+    def nested_context(self) -> dict:
+        return {key: value for key, value in self.context.items() if key != "sparse_fields"}
+
 
 
 class AmenitySerializer(serializers.ModelSerializer):
@@ -43,19 +110,25 @@ class AmenitySerializer(serializers.ModelSerializer):
 class PropertyImageSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
     """
     One gallery image row.  ``url`` is built from the already-loaded
-    ImageField — zero database hits.
+    ImageField — zero database hits.  ``srcset`` maps each rendition
+    format (avif, webp) to an ``<img srcset>`` value; empty until the
+    renditions are generated.
     """
 
     url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = PropertyImage
-        fields = ("id", "url", "order")
+        fields = ("id", "url", "srcset", "order")
         read_only_fields = fields
 
     def get_url(self, obj: PropertyImage) -> str:
         return self._absolute_url(obj.image.url) if obj.image else ""
 
+    def get_srcset(self, obj: PropertyImage) -> dict[str, str]:
+        return self._srcset(obj.renditions, obj.image.storage) if obj.image else {}
+
 
 
 class AgentSummarySerializer(AbsoluteURLMixin, serializers.Serializer):
@@ -73,7 +146,8 @@ class AgentSummarySerializer(AbsoluteURLMixin, serializers.Serializer):
     verified = serializers.BooleanField(read_only=True)
     rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
     years_of_experience = serializers.IntegerField(read_only=True)
-    total_listings = serializers.SerializerMethodField()
+    # Counter column maintained by core.applications.property.counters.
+    total_listings = serializers.IntegerField(read_only=True)
 
     def get_full_name(self, obj) -> str:
         user = getattr(obj, "user", None)
@@ -90,12 +164,9 @@ class AgentSummarySerializer(AbsoluteURLMixin, serializers.Serializer):
         image = getattr(obj, "profile_picture", None)
         return self._absolute_url(image.url) if image else None
 
-    def get_total_listings(self, obj) -> int:
-        return obj.properties.count()
-
 
 
-class PropertyCardSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
+class PropertyCardSerializer(SparseFieldsMixin, AbsoluteURLMixin, serializers.ModelSerializer):
     """
     Compact property card.  Used on:
       • Home page featured grid
@@ -108,9 +179,13 @@ class PropertyCardSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
 
     ``is_favorited`` must be annotated by the queryset before serialization:
         PropertyQuerySet.with_favorite_annotation(user=request.user)
+
+    ``main_image_srcset`` is ``{format: srcset}`` over the card / gallery /
+    hero renditions (renditions.py); ``main_image_url`` stays the original.
     """
 
     main_image_url = serializers.SerializerMethodField()
+    main_image_srcset = serializers.SerializerMethodField()
     price_display = serializers.CharField(read_only=True)
     price_suffix = serializers.CharField(read_only=True)
     availability_label = serializers.CharField(read_only=True)
@@ -123,6 +198,8 @@ class PropertyCardSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
     agent = AgentSummarySerializer(read_only=True)
     is_favorited = serializers.BooleanField(read_only=True, default=False)
     is_featured = serializers.BooleanField(read_only=True)
+    # Only present on geo queries (?lat=&lng=) — annotated by with_distance().
+    distance_km = serializers.FloatField(read_only=True, default=None)
 
     class Meta:
         model = Property
@@ -131,6 +208,9 @@ class PropertyCardSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
             "title",
             "slug",
             "location",
+            "latitude",
+            "longitude",
+            "distance_km",
             "price",
             "price_display",
             "price_suffix",
@@ -146,6 +226,7 @@ class PropertyCardSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
             "is_featured",
             "is_favorited",
             "main_image_url",
+            "main_image_srcset",
             "agent",
             "created_at",
         )
@@ -161,10 +242,107 @@ class PropertyCardSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
             return self._absolute_url(images[0].image.url)
         return "/static/images/placeholder.jpg"
 
+    def get_main_image_srcset(self, obj: Property) -> dict[str, str]:
+        image = obj.get_main_image()
+        return self._srcset(obj.get_main_image_renditions(), image.storage) if image else {}
+
+
+
+
+class AgentPropertySerializer(PropertyCardSerializer):
+    """
+    Row of the agent dashboard listings table: the card plus the
+    engagement counter columns.
+    """
+
+    class Meta(PropertyCardSerializer.Meta):
+        fields = (
+            *PropertyCardSerializer.Meta.fields,
+            "lead_count",
+            "viewing_count",
+            "favorite_count",
+        )
+        read_only_fields = fields
+
+
+class PropertySearchDocumentSerializer(SparseFieldsMixin, AbsoluteURLMixin, serializers.ModelSerializer):
+    """
+    Listing card read from ``PropertySearchDocument`` (``?source=document``).
+
+    Same card fields as PropertyCardSerializer, except ``agent`` is the
+    compact id / name / avatar triple stored on the document, and
+    ``price_per_sqft`` is added.  Every value is a column on the row.
+    """
+
+    id = serializers.UUIDField(source="property_id", read_only=True)
+    main_image_url = serializers.SerializerMethodField()
+    main_image_srcset = serializers.SerializerMethodField()
+    price_display = serializers.CharField(read_only=True)
+    price_suffix = serializers.CharField(read_only=True)
+    availability_label = serializers.CharField(read_only=True)
+    listing_type_display = serializers.CharField(
+        source="get_property_listing_display", read_only=True
+    )
+    property_type_display = serializers.CharField(
+        source="get_property_type_display", read_only=True
+    )
+    agent = serializers.SerializerMethodField()
+    is_favorited = serializers.BooleanField(read_only=True, default=False)
+    distance_km = serializers.FloatField(read_only=True, default=None)
+
+    class Meta:
+        model = PropertySearchDocument
+        fields = (
+            "id",
+            "title",
+            "slug",
+            "location",
+            "latitude",
+            "longitude",
+            "distance_km",
+            "price",
+            "price_display",
+            "price_suffix",
+            "price_per_sqft",
+            "property_type",
+            "property_type_display",
+            "property_listing",
+            "listing_type_display",
+            "bedrooms",
+            "bathrooms",
+            "sqft",
+            "is_available",
+            "availability_label",
+            "is_featured",
+            "is_favorited",
+            "main_image_url",
+            "main_image_srcset",
+            "agent",
+            "created_at",
+        )
+        read_only_fields = fields
+
+    def get_main_image_url(self, obj: PropertySearchDocument) -> str:
+        if obj.cover_image_url:
+            return self._absolute_url(obj.cover_image_url)
+        return "/static/images/placeholder.jpg"
 
+    def get_main_image_srcset(self, obj: PropertySearchDocument) -> dict[str, str]:
+        return srcset(obj.cover_renditions, self._absolute_url)
+
+    def get_agent(self, obj: PropertySearchDocument) -> dict:
+        return {
+            "id": obj.agent_id,
+            "full_name": obj.agent_name,
+            "avatar_url": (
+                self._absolute_url(obj.agent_avatar_url)
+                if obj.agent_avatar_url
+                else None
+            ),
+        }
 
 
-class PropertyDetailSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
+class PropertyDetailSerializer(SparseFieldsMixin, AbsoluteURLMixin, serializers.ModelSerializer):
     """
     Full property detail page payload.
 
@@ -179,6 +357,7 @@ class PropertyDetailSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
     """
 
     main_image_url = serializers.SerializerMethodField()
+    main_image_srcset = serializers.SerializerMethodField()
     price_display = serializers.CharField(read_only=True)
     price_suffix = serializers.CharField(read_only=True)
     availability_label = serializers.CharField(read_only=True)
@@ -203,6 +382,8 @@ class PropertyDetailSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
             "slug",
             "description",
             "location",
+            "latitude",
+            "longitude",
             "price",
             "price_display",
             "price_suffix",
@@ -218,6 +399,7 @@ class PropertyDetailSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
             "is_featured",
             "is_favorited",
             "main_image_url",
+            "main_image_srcset",
             "images",
             "amenities",
             "agent",
@@ -233,19 +415,38 @@ class PropertyDetailSerializer(AbsoluteURLMixin, serializers.ModelSerializer):
         images = obj.images.all()
         return self._absolute_url(images[0].image.url) if images else "/static/images/placeholder.jpg"
 
+    def get_main_image_srcset(self, obj: Property) -> dict[str, str]:
+        image = obj.get_main_image()
+        return self._srcset(obj.get_main_image_renditions(), image.storage) if image else {}
+
     def get_similar_properties(self, obj: Property) -> list:
         similar = self.context.get("similar_properties", [])
-        return PropertyCardSerializer(similar, many=True, context=self.context).data
+        return PropertyCardSerializer(similar, many=True, context=self.nested_context).data
 
 
 class PropertyImageWriteSerializer(serializers.ModelSerializer):
+    """
+    One submitted gallery entry: a new ``image`` file, or — on update — the
+    ``id`` of an image already in the gallery.  ``order`` defaults to the
+    entry's position.
+    """
+
+    id = serializers.UUIDField(required=False)
+
     class Meta:
         model = PropertyImage
-        fields = ("image", "order")
+        fields = ("id", "image", "order")
         extra_kwargs = {
-            "order": {"required": False}
+            "image": {"required": False},
+            "order": {"required": False},
         }
 
+    def validate(self, attrs):
+        if ("id" in attrs) == ("image" in attrs):
+            msg = "Provide either an image file or the id of an existing image."
+            raise serializers.ValidationError(msg)
+        return attrs
+
 
 class PropertyWriteSerializer(serializers.ModelSerializer):
     amenity_ids = serializers.PrimaryKeyRelatedField(
@@ -271,6 +472,8 @@ class PropertyWriteSerializer(serializers.ModelSerializer):
             "property_listing",
             "price",
             "location",
+            "latitude",
+            "longitude",
             "bedrooms",
             "bathrooms",
             "sqft",
@@ -280,6 +483,15 @@ class PropertyWriteSerializer(serializers.ModelSerializer):
             "images",
         )
 
+    def validate(self, attrs):
+        """Coordinates are a pair — reject one without the other."""
+        lat = attrs.get("latitude", getattr(self.instance, "latitude", None))
+        lng = attrs.get("longitude", getattr(self.instance, "longitude", None))
+        if (lat is None) != (lng is None):
+            msg = "latitude and longitude must be provided together."
+            raise serializers.ValidationError(msg)
+        return attrs
+
     def validate_images(self, value):
         """
         Optional guard: cap gallery size so agents can't upload 50 images.
@@ -287,9 +499,70 @@ class PropertyWriteSerializer(serializers.ModelSerializer):
         if len(value) > 10:
             msg = "You can upload a maximum of 10 gallery images."
             raise serializers.ValidationError(msg)
+        if self.instance is None and any("id" in item for item in value):
+            msg = "Existing images can only be referenced when updating a property."
+            raise serializers.ValidationError(msg)
         return value
 
 
+def _validate_media_name(value: str) -> None:
+    """A storage name relative to MEDIA_ROOT — no absolute paths or ``..``."""
+    segments = value.replace("\\", "/").split("/")
+    if value.startswith("/") or ".." in segments or ":" in segments[0]:
+        msg = "Must be a file name relative to the media root."
+        raise serializers.ValidationError(msg)
+
+
+class PropertyImportRowSerializer(PropertyWriteSerializer):
+    """
+    One row of a bulk import (importer.py).  Same columns as
+    ``PropertyWriteSerializer``, except that amenities are given by name
+    and the cover / gallery images as names of files already in media
+    storage — rows carry no uploads.
+    """
+
+    amenity_ids = None
+    amenities = serializers.ListField(child=serializers.CharField(), required=False)
+    cover_image = serializers.CharField(
+        max_length=100,
+        required=False,
+        allow_blank=True,
+        validators=[_validate_media_name],
+    )
+    images = serializers.ListField(
+        child=serializers.CharField(max_length=100, validators=[_validate_media_name]),
+        required=False,
+    )
+
+    class Meta(PropertyWriteSerializer.Meta):
+        fields = (
+            *(name for name in PropertyWriteSerializer.Meta.fields if name != "amenity_ids"),
+            "amenities",
+        )
+
+
+class PropertyGalleryUploadSerializer(serializers.Serializer):
+    """Batch of gallery images appended to a listing (``images`` repeated)."""
+
+    images = serializers.ListField(child=serializers.ImageField(), allow_empty=False)
+
+
+class PropertyImportSerializer(serializers.Serializer):
+    """Upload for the bulk import endpoint; the format comes from the file name."""
+
+    file = serializers.FileField()
+    dry_run = serializers.BooleanField(default=False)
+
+
+class PropertyImportReportSerializer(serializers.Serializer):
+    """Outcome of a bulk import: counts plus the rejected rows."""
+
+    rows = serializers.IntegerField()
+    created = serializers.IntegerField()
+    dry_run = serializers.BooleanField()
+    errors = serializers.ListField(child=serializers.DictField())
+
+
 
 
 
@@ -468,7 +741,7 @@ class ViewingCreateSerializer(serializers.Serializer):
         return attrs
 
 
-class ViewingSerializer(serializers.ModelSerializer):
+class ViewingSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Read representation of a viewing.
     Returned after creation and in the user's viewing history list.
@@ -529,7 +802,7 @@ class LeadCreateSerializer(serializers.Serializer):
         return value
 
 
-class LeadSerializer(serializers.ModelSerializer):
+class LeadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     Full lead payload — returned after "Contact Agent" and used in the
     agent CRM dashboard.
@@ -584,7 +857,7 @@ class LeadSerializer(serializers.ModelSerializer):
         viewing = cache[0] if cache else obj.upcoming_viewing
         if viewing is None:
             return None
-        return ViewingSerializer(viewing, context=self.context).data
+        return ViewingSerializer(viewing, context=self.nested_context).data
 
 
 class LeadStatusUpdateSerializer(serializers.Serializer):
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.utils.http import quote_etag
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.mixins import CreateModelMixin
 from rest_framework.mixins import DestroyModelMixin
@@ -20,9 +26,18 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework.viewsets import ReadOnlyModelViewSet
 from rest_framework.viewsets import ViewSet
 
+from core.applications.property import gallery
+from core.applications.property import home_page
+from core.applications.property import importer
+from core.applications.property.card_renderer import card_rows
+from core.applications.property.card_renderer import render_cards
+from core.applications.property.exports import LEAD_EXPORT_COLUMNS
+from core.applications.property.exports import PROPERTY_EXPORT_COLUMNS
+from core.applications.property.exports import VIEWING_EXPORT_COLUMNS
 from core.applications.property import services
 from core.applications.property.api.schema.home_schema import HomePageViewSchema
 from core.applications.property.api.schema.property_schemas import PropertyViewSetSchema
+from core.applications.property.api.serializers import AgentPropertySerializer
 from core.applications.property.api.serializers import AgentSummarySerializer, AmenitySerializer
 from core.applications.property.api.serializers import FavoritePropertySerializer
 from core.applications.property.api.serializers import FavoriteToggleSerializer
@@ -32,8 +47,14 @@ from core.applications.property.api.serializers import LeadSerializer
 from core.applications.property.api.serializers import LeadStatusUpdateSerializer
 from core.applications.property.api.serializers import PropertyCardSerializer
 from core.applications.property.api.serializers import PropertyDetailSerializer
+from core.applications.property.api.serializers import PropertyGalleryUploadSerializer
+from core.applications.property.api.serializers import PropertyImageSerializer
+from core.applications.property.api.serializers import PropertyImportReportSerializer
+from core.applications.property.api.serializers import PropertyImportSerializer
+from core.applications.property.api.serializers import PropertySearchDocumentSerializer
 from core.applications.property.api.serializers import PropertySubscriptionSerializer
 from core.applications.property.api.serializers import PropertyWriteSerializer
+from core.applications.property.api.serializers import SparseFieldset
 from core.applications.property.api.serializers import ViewingCancelSerializer
 from core.applications.property.api.serializers import ViewingCreateSerializer
 from core.applications.property.api.serializers import ViewingSerializer
@@ -47,6 +68,11 @@ from core.applications.property.permissions import IsObjectOwner
 from core.applications.property.permissions import IsPropertyOwnerAgent
 from core.applications.property.permissions import IsVerifiedAgent
 from core.applications.property.permissions import IsViewingOwnerOrPropertyAgent
+from core.helpers.exports import select_columns
+from core.helpers.exports import streaming_export
+from core.helpers.geo import parse_bbox
+from core.helpers.paginations import CachedCountPagination
+from core.helpers.paginations import KeysetPagination
 
 
 def _ctx(request: Request) -> dict:
@@ -54,8 +80,69 @@ def _ctx(request: Request) -> dict:
     Builds the standard serializer context.
     Every serializer must receive this so AbsoluteURLMixin can construct
     correct absolute media URLs and so DRF's HyperlinkedRelatedField works.
+    ``sparse_fields`` carries any ``?fields=`` / ``?omit=`` selection to
+    SparseFieldsMixin.
     """
-    return {"request": request}
+    return {"request": request, "sparse_fields": SparseFieldset.from_request(request)}
+
+
+def _sparse_fields(request: Request, serializer_class) -> set[str] | None:
+    """
+    Top-level ``serializer_class`` fields kept by ``?fields=`` / ``?omit=``,
+    for narrowing the queryset; None when the request asks for everything.
+    """
+    selection = SparseFieldset.from_request(request)
+    if selection is None:
+        return None
+    return selection.select(serializer_class.Meta.fields)
+
+
+def _not_modified(request: Request, validator) -> tuple[Response | None, dict]:
+    """
+    Evaluates ``If-None-Match`` / ``If-Modified-Since`` against a
+    ``(etag, last_modified)`` validator.  Returns ``(304 response or None,
+    headers)``; the headers go on whichever response is sent.
+    """
+    etag, last_modified = validator
+    etag = quote_etag(etag)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    headers = {"ETag": etag}
+    if timestamp is not None:
+        headers["Last-Modified"] = http_date(timestamp)
+
+    conditional = get_conditional_response(
+        request._request,
+        etag=etag,
+        last_modified=timestamp,
+    )
+    if conditional is None:
+        return None, headers
+    response = Response(status=conditional.status_code)
+    return response, headers
+
+
+def _export(request: Request, queryset, columns: dict, *, name: str):
+    """
+    Streams ``queryset`` as CSV, or NDJSON with ``?file_format=ndjson``,
+    limited to the ``?fields=`` / ``?omit=`` columns.
+    """
+    try:
+        return streaming_export(
+            queryset,
+            select_columns(columns, SparseFieldset.from_request(request)),
+            file_format=request.query_params.get("file_format", "csv"),
+            name=name,
+        )
+    except ValueError as exc:
+        raise ValidationError({"detail": str(exc)})
+
+
+def _apply_validators(response: Response, headers: dict) -> Response:
+    for name, value in headers.items():
+        response[name] = value
+    # Clients may store the response but must revalidate before reuse.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 def _agent_or_403(request: Request):
@@ -85,6 +172,26 @@ def _parse_bool(value: str | None) -> bool | None:
     return value.lower() in ("true", "1", "yes")
 
 
+def _parse_geo(params) -> dict:
+    """
+    Parses the geo query params — ``?lat=&lng=&radius_km=`` and
+    ``?bbox=west,south,east,north`` — into service keywords.
+    Raises ValidationError (400) for malformed values.
+    """
+    try:
+        lat = float(params["lat"]) if params.get("lat") else None
+        lng = float(params["lng"]) if params.get("lng") else None
+        radius_km = float(params["radius_km"]) if params.get("radius_km") else None
+        bbox = parse_bbox(params["bbox"]) if params.get("bbox") else None
+    except ValueError as exc:
+        raise ValidationError({"detail": f"Invalid geo filter: {exc}"})
+    if (lat is None) != (lng is None):
+        raise ValidationError({"detail": "lat and lng must be supplied together."})
+    if radius_km is not None and (lat is None or radius_km <= 0):
+        raise ValidationError({"detail": "radius_km needs lat/lng and must be positive."})
+    return {"lat": lat, "lng": lng, "radius_km": radius_km, "bbox": bbox}
+
+
 
 @HomePageViewSchema
 class HomePageView(ViewSet):
@@ -92,31 +199,51 @@ class HomePageView(ViewSet):
     GET /
     Aggregates featured properties + category cards in one network call.
     Fully public — no authentication required.
+
+    The anonymous payload is served from cache (see ``home_page.py``),
+    keyed by host because media URLs are absolute; signed-in users get
+    their favourite flags overlaid with one extra query.
     """
 
     permission_classes = [AllowAny]
 
     def list(self, request: Request) -> Response:
-        user = request.user if request.user.is_authenticated else None
-        data = services.get_home_page_data(user=user)
-        serializer = HomePageSerializer(data, context=_ctx(request))
-        return Response(serializer.data)
+        payload = home_page.cached(
+            "api",
+            lambda: HomePageSerializer(
+                services.get_home_page_data(),
+                context=_ctx(request),
+            ).data,
+            request.build_absolute_uri("/"),
+        )
+        if request.user.is_authenticated:
+            payload = {
+                **payload,
+                "featured_properties": home_page.overlay_favorites(
+                    payload["featured_properties"],
+                    user=request.user,
+                ),
+            }
+        return Response(payload)
 
 
 class AgentPropertyListView(ListModelMixin, GenericViewSet):
     """
     GET /properties/agent/
-    Returns the authenticated agent's listings annotated with
-    lead_count and viewing_count for the agent dashboard table.
+    Returns the authenticated agent's listings with lead_count,
+    viewing_count and favorite_count for the agent dashboard table.
+    ``?ordering=`` accepts those counters (``-`` for descending) as well
+    as the public listing orderings.
     """
 
     permission_classes = [IsAgentUser]
-    serializer_class = PropertyCardSerializer
+    serializer_class = AgentPropertySerializer
 
     def get_queryset(self):
         return services.get_agent_properties(
             agent=self.request.user.agent_profile,
             user=self.request.user,
+            ordering=self.request.query_params.get("ordering"),
         )
 
     def get_serializer_context(self):
@@ -133,16 +260,24 @@ class PropertyViewSet(ModelViewSet):
 
     """
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = CachedCountPagination
     lookup_field = "slug"
 
     permission_classes_by_action = {
         "list": [AllowAny],
         "retrieve": [AllowAny],
         "similar": [AllowAny],
+        "facets": [AllowAny],
+        "clusters": [AllowAny],
         "create": [IsVerifiedAgent],
+        "import_listings": [IsVerifiedAgent],
+        "export_listings": [IsAgentUser],
+        "export_leads": [IsAgentUser],
+        "export_viewings": [IsAgentUser],
         "update": [IsPropertyOwnerAgent],
         "partial_update": [IsPropertyOwnerAgent],
         "destroy": [IsPropertyOwnerAgent],
+        "upload_images": [IsPropertyOwnerAgent],
         "agent_info": [IsAuthenticated],
     }
 
@@ -151,8 +286,10 @@ class PropertyViewSet(ModelViewSet):
         "similar": PropertyCardSerializer,
         "retrieve": PropertyDetailSerializer,
         "create": PropertyWriteSerializer,
+        "import_listings": PropertyImportSerializer,
         "update": PropertyWriteSerializer,
         "partial_update": PropertyWriteSerializer,
+        "upload_images": PropertyGalleryUploadSerializer,
         "agent_info": AgentSummarySerializer,
     }
 
@@ -173,6 +310,8 @@ class PropertyViewSet(ModelViewSet):
         Resolve serializer class dynamically based on action.
         Falls back to PropertyCardSerializer.
         """
+        if self.action == "list" and self._listing_source() == "document":
+            return PropertySearchDocumentSerializer
         return self.serializer_class_by_action.get(
             self.action,
             PropertyCardSerializer,
@@ -185,6 +324,63 @@ class PropertyViewSet(ModelViewSet):
             **_ctx(self.request),
         }
 
+    def _listing_filters(self) -> dict:
+        """Listing filter keywords parsed from the query string."""
+        params = self.request.query_params
+
+        amenity_ids = [
+            a.strip()
+            for a in params.get("amenities", "").split(",")
+            if a.strip()
+        ]
+
+        return {
+            "listing_type": params.get("listing_type"),
+            "property_type": params.get("property_type"),
+            "location": params.get("location"),
+            "location_match": params.get("location_match", "fuzzy"),
+            "min_price": params.get("min_price"),
+            "max_price": params.get("max_price"),
+            "min_bedrooms": params.get("min_bedrooms"),
+            "max_bedrooms": params.get("max_bedrooms"),
+            "min_bathrooms": params.get("min_bathrooms"),
+            "amenity_ids": amenity_ids or None,
+            "amenity_match": params.get("amenity_match", "any"),
+            "is_available": _parse_bool(params.get("is_available")),
+            "search": params.get("search"),
+            "search_mode": params.get("search_mode", "fts"),
+            **_parse_geo(params),
+        }
+
+    def _listing_source(self) -> str:
+        return self.request.query_params.get("source", "property")
+
+    def _fast_cards(self) -> bool:
+        """Full property cards render from values() rows (card_renderer.py)."""
+        return (
+            settings.PROPERTY_CARD_FAST_PATH
+            and self._listing_source() != "document"
+            and SparseFieldset.from_request(self.request) is None
+        )
+
+    @property
+    def paginator(self):
+        """
+        ``?pagination=cursor`` (or any ``?cursor=``) switches the list to
+        keyset pagination for infinite scroll; page-number stays the default,
+        with cached / estimated totals (``CachedCountPagination``) since the
+        public list and search are the endpoints large enough to need them.
+        """
+        if not hasattr(self, "_paginator"):
+            params = self.request.query_params
+            if self.action == "list" and (
+                params.get("pagination") == "cursor" or "cursor" in params
+            ):
+                self._paginator = KeysetPagination()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
     def get_queryset(self):
         """
         Returns filtered queryset for list endpoints.
@@ -199,28 +395,13 @@ class PropertyViewSet(ModelViewSet):
 
         request = self.request
         user = request.user if request.user.is_authenticated else None
-        params = request.query_params
-
-        amenity_ids = [
-            a.strip()
-            for a in params.get("amenities", "").split(",")
-            if a.strip()
-        ]
 
         return services.get_property_list(
             user=user,
-            listing_type=params.get("listing_type"),
-            property_type=params.get("property_type"),
-            location=params.get("location"),
-            min_price=params.get("min_price"),
-            max_price=params.get("max_price"),
-            min_bedrooms=params.get("min_bedrooms"),
-            max_bedrooms=params.get("max_bedrooms"),
-            min_bathrooms=params.get("min_bathrooms"),
-            amenity_ids=amenity_ids or None,
-            is_available=_parse_bool(params.get("is_available")),
-            search=params.get("search"),
-            ordering=params.get("ordering", "-created_at"),
+            ordering=request.query_params.get("ordering"),
+            source=self._listing_source(),
+            fields=_sparse_fields(request, self.get_serializer_class()),
+            **self._listing_filters(),
         )
 
     # ------------------------------------------------------------------
@@ -228,29 +409,69 @@ class PropertyViewSet(ModelViewSet):
     # ------------------------------------------------------------------
 
     def list(self, request: Request, *args, **kwargs) -> Response:
-        """Paginated property card list."""
+        """
+        Paginated property card list.
+
+        Supports conditional GET: the validator (the cached listing version
+        token, see ``search_documents.listing_version()``) is checked before
+        the page is fetched or serialized, so an unchanged list costs no
+        listing query at all.
+
+        Full property cards are built from a values() projection by
+        ``card_renderer`` rather than PropertyCardSerializer — same JSON,
+        a fraction of the CPU.
+        """
         queryset = self.get_queryset()
-        page = self.paginate_queryset(queryset)
+        user = request.user if request.user.is_authenticated else None
 
-        serializer = self.get_serializer(
-            page if page is not None else queryset,
-            many=True,
+        not_modified, headers = _not_modified(
+            request,
+            services.get_property_list_validator(
+                queryset,
+                query=request.META.get("QUERY_STRING", ""),
+                user=user,
+            ),
         )
+        if not_modified is not None:
+            return _apply_validators(not_modified, headers)
+
+        if self._fast_cards():
+            queryset = card_rows(queryset)
+            page = self.paginate_queryset(queryset)
+            data = render_cards(page if page is not None else queryset, request=request)
+        else:
+            page = self.paginate_queryset(queryset)
+            data = self.get_serializer(
+                page if page is not None else queryset,
+                many=True,
+            ).data
 
         if page is not None:
-            return self.get_paginated_response(serializer.data)
+            return _apply_validators(self.get_paginated_response(data), headers)
 
-        return Response(serializer.data)
+        return _apply_validators(Response(data), headers)
 
     def retrieve(self, request: Request, *args, **kwargs) -> Response:
         """
         Retrieve a property with pre-fetched similar properties.
+
+        Supports conditional GET: a matching ``If-None-Match`` /
+        ``If-Modified-Since`` gets a 304 after one small validator query,
+        before the detail and similar-properties queries run.
         """
         user = request.user if request.user.is_authenticated else None
 
+        headers = {}
+        validator = services.get_property_detail_validator(slug=kwargs["slug"], user=user)
+        if validator is not None:
+            not_modified, headers = _not_modified(request, validator)
+            if not_modified is not None:
+                return _apply_validators(not_modified, headers)
+
         prop, similar = services.get_property_detail(
             slug=kwargs["slug"],
             user=user,
+            fields=_sparse_fields(request, PropertyDetailSerializer),
         )
 
         self.check_object_permissions(request, prop)
@@ -263,7 +484,7 @@ class PropertyViewSet(ModelViewSet):
             },
         )
 
-        return Response(serializer.data)
+        return _apply_validators(Response(serializer.data), headers)
 
     def create(self, request: Request, *args, **kwargs) -> Response:
         """Create a new property listing."""
@@ -322,6 +543,88 @@ class PropertyViewSet(ModelViewSet):
     # Extra actions
     # ------------------------------------------------------------------
 
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_listings(self, request: Request) -> Response:
+        """Bulk-import listings from an uploaded CSV / JSON / NDJSON file."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+
+        try:
+            report = importer.import_properties(
+                upload,
+                agent=_agent_or_403(request),
+                file_format=importer.detect_format(upload.name),
+                dry_run=serializer.validated_data["dry_run"],
+            )
+        except importer.ImportFormatError as exc:
+            raise ValidationError({"file": [str(exc)]}) from exc
+
+        return Response(PropertyImportReportSerializer(report).data)
+
+    @action(detail=True, methods=["post"], url_path="images")
+    def upload_images(self, request: Request, slug=None) -> Response:
+        """Append a batch of images to the listing's gallery."""
+        prop = self._get_owned_property()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        images = gallery.add_gallery_images(prop, serializer.validated_data["images"])
+
+        output = PropertyImageSerializer(
+            images,
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        return Response(output.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export_listings(self, request: Request):
+        """Stream the agent's listings (dashboard table columns) as CSV / NDJSON."""
+        queryset = services.get_agent_properties(
+            agent=_agent_or_403(request),
+            ordering=request.query_params.get("ordering"),
+        )
+        return _export(request, queryset, PROPERTY_EXPORT_COLUMNS, name="listings")
+
+    @action(detail=False, methods=["get"], url_path="export/leads")
+    def export_leads(self, request: Request):
+        """Stream the leads on the agent's listings (optional ?status=)."""
+        queryset = services.get_agent_lead_export(
+            agent=_agent_or_403(request),
+            status=request.query_params.get("status"),
+        )
+        return _export(request, queryset, LEAD_EXPORT_COLUMNS, name="leads")
+
+    @action(detail=False, methods=["get"], url_path="export/viewings")
+    def export_viewings(self, request: Request):
+        """Stream the viewings booked on the agent's listings (optional ?status=)."""
+        queryset = services.get_agent_viewings(
+            agent=_agent_or_403(request),
+            status=request.query_params.get("status"),
+        )
+        return _export(request, queryset, VIEWING_EXPORT_COLUMNS, name="viewings")
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request: Request) -> Response:
+        """Filter-sidebar counts for the same filters the list accepts."""
+        return Response(services.get_property_facets(**self._listing_filters()))
+
+    @action(detail=False, methods=["get"])
+    def clusters(self, request: Request) -> Response:
+        """Geohash-cell clusters for a map viewport (?bbox=&zoom=)."""
+        filters = self._listing_filters()
+        bbox = filters.pop("bbox")
+        try:
+            zoom = int(request.query_params["zoom"])
+        except (KeyError, ValueError):
+            zoom = None
+        if bbox is None or zoom is None or not 0 <= zoom <= 22:
+            raise ValidationError({"detail": "bbox and zoom (0-22) are required."})
+        return Response(
+            services.get_property_clusters(bbox=bbox, zoom=zoom, **filters),
+        )
+
     @action(detail=True, methods=["get"])
     def similar(self, request: Request, slug=None) -> Response:
         """Return similar properties."""
@@ -435,7 +738,10 @@ class LeadViewSet(
         Default queryset scoped to the requesting user's own leads.
         The ``agent_leads`` extra action uses its own service call.
         """
-        return services.get_user_leads(user=self.request.user)
+        return services.get_user_leads(
+            user=self.request.user,
+            fields=_sparse_fields(self.request, LeadSerializer),
+        )
 
     def get_object(self):
         """
@@ -508,6 +814,7 @@ class LeadViewSet(
         queryset = services.get_agent_leads(
             agent=agent,
             status=request.query_params.get("status"),
+            fields=_sparse_fields(request, LeadSerializer),
         )
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -576,7 +883,10 @@ class PropertyViewingViewSet(
         return {**super().get_serializer_context(), **_ctx(self.request)}
 
     def get_queryset(self):
-        return services.get_user_viewings(user=self.request.user)
+        return services.get_user_viewings(
+            user=self.request.user,
+            fields=_sparse_fields(self.request, ViewingSerializer),
+        )
 
     def get_object(self):
         """
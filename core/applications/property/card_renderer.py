@@ -0,0 +1,228 @@
+"""
+Fast path for property cards: builds the ``PropertyCardSerializer``
+payload straight from a ``values()`` projection.
+
+A listing page of cards spends most of its CPU time in DRF — a model
+instance (through auto_prefetch) per row, then per-field
+``get_attribute`` / ``to_representation`` and method-field dispatch, plus
+the nested agent serializer.  Here each card is one dict literal filled
+from a row tuple; the few conversions that must match DRF exactly
+(decimals, datetimes) reuse the serializer's own field instances, and
+media URLs are a precomputed absolute prefix plus the file name.
+
+Besides the page query, one batched lookup per page fetches the first
+gallery image (and its renditions) of cards without a cover.
+
+The output is byte-identical to the serializer's once rendered —
+``manage.py benchmark_card_rendering`` checks that and times both paths.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+
+from django.contrib.auth import get_user_model
+from django.core.files.storage import FileSystemStorage
+from django.utils.encoding import filepath_to_uri
+
+from core.applications.property.api.serializers import AgentSummarySerializer
+from core.applications.property.api.serializers import PropertyCardSerializer
+from core.applications.property.models import ListingDisplayMixin
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.renditions import srcset
+from core.applications.users.models import AgentProfile
+
+PLACEHOLDER_IMAGE_URL = "/static/images/placeholder.jpg"
+
+# values() columns a card reads; annotations on the queryset
+# (is_favorited, distance_km, search_rank, …) are appended.
+CARD_COLUMNS = (
+    "id",
+    "title",
+    "slug",
+    "location",
+    "latitude",
+    "longitude",
+    "price",
+    "property_type",
+    "property_listing",
+    "bedrooms",
+    "bathrooms",
+    "sqft",
+    "is_available",
+    "is_featured",
+    "cover_image",
+    "cover_renditions",
+    "created_at",
+    "agent_id",
+    "agent__profile_picture",
+    "agent__office_phone_no",
+    "agent__agent_type",
+    "agent__company_name",
+    "agent__verified",
+    "agent__rating",
+    "agent__years_of_experience",
+    "agent__total_listings",
+    "agent__user__email",
+)
+
+
+def card_rows(queryset):
+    """``values()`` projection of a card queryset, for ``render_cards()``."""
+    return queryset.prefetch_related(None).values(*CARD_COLUMNS, *queryset.query.annotations)
+
+
+@cache
+def _serializer_fields():
+    """The serializers' own field instances, for exact decimal / datetime output."""
+    return PropertyCardSerializer().fields, AgentSummarySerializer().fields
+
+
+def _media_url(storage, absolute):
+    """
+    ``name → absolute(storage.url(name))``.  For filesystem storage that is
+    the absolute ``MEDIA_URL`` plus the quoted name, so the prefix is
+    built once; names the URL join would rewrite (dot segments, a
+    scheme-like first segment) and other storages take the slow path.
+    """
+    if not isinstance(storage, FileSystemStorage):
+        return lambda name: absolute(storage.url(name))
+
+    prefix = absolute(storage.base_url)
+
+    def url(name: str) -> str:
+        path = filepath_to_uri(name).lstrip("/")
+        segments = path.split("/")
+        if ":" in segments[0] or "." in segments or ".." in segments:
+            return absolute(storage.url(name))
+        return prefix + path
+
+    return url
+
+
+def _choice_labels(field_name: str) -> dict:
+    field = Property._meta.get_field(field_name)
+    return {value: str(label) for value, label in field.flatchoices}
+
+
+class CardRenderer:
+    """
+    Renders ``card_rows()`` dicts as ``PropertyCardSerializer`` output.
+    Build one per request: URL prefixes and choice labels depend on the
+    request host and active language.
+    """
+
+    def __init__(self, request=None):
+        absolute = request.build_absolute_uri if request is not None else (lambda path: path)
+        self.cover_url = _media_url(Property._meta.get_field("cover_image").storage, absolute)
+        self.image_url = _media_url(PropertyImage._meta.get_field("image").storage, absolute)
+        self.avatar_url = _media_url(
+            AgentProfile._meta.get_field("profile_picture").storage,
+            absolute,
+        )
+        self.type_labels = _choice_labels("property_type")
+        self.listing_labels = _choice_labels("property_listing")
+
+        card_fields, agent_fields = _serializer_fields()
+        self.decimal = {
+            name: card_fields[name].to_representation
+            for name in ("latitude", "longitude", "price")
+        }
+        self.datetime = card_fields["created_at"].to_representation
+        self.rating = agent_fields["rating"].to_representation
+
+        # AgentSummarySerializer.get_full_name formats user.first_name /
+        # user.last_name, which the User model replaces with None.
+        user_model = get_user_model()
+        self.full_name = f"{user_model.first_name} {user_model.last_name}".strip()
+
+    def render(self, rows) -> list[dict]:
+        rows = list(rows)
+        if not rows:
+            return []
+        first_images = self._first_images([row["id"] for row in rows if not row["cover_image"]])
+        return [self._card(row, first_images) for row in rows]
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _first_images(property_ids: list) -> dict:
+        if not property_ids:
+            return {}
+        rows = (
+            PropertyImage.objects.filter(property_id__in=property_ids)
+            .order_by("property_id", "order", "created_at")
+            .distinct("property_id")
+            .values_list("property_id", "image", "renditions")
+        )
+        return {property_id: (image, renditions) for property_id, image, renditions in rows}
+
+    def _main_image_url(self, row: dict, first_images: dict) -> str:
+        if row["cover_image"]:
+            return self.cover_url(row["cover_image"])
+        image, _ = first_images.get(row["id"], (None, None))
+        if image:
+            return self.image_url(image)
+        return PLACEHOLDER_IMAGE_URL
+
+    def _main_image_srcset(self, row: dict, first_images: dict) -> dict:
+        if row["cover_image"]:
+            return srcset(row["cover_renditions"], self.cover_url)
+        image, renditions = first_images.get(row["id"], (None, None))
+        if image:
+            return srcset(renditions, self.image_url)
+        return {}
+
+    def _card(self, row: dict, first_images: dict) -> dict:
+        decimal = self.decimal
+        latitude, longitude, distance = row["latitude"], row["longitude"], row.get("distance_km")
+        property_type, property_listing = row["property_type"], row["property_listing"]
+        avatar, rating = row["agent__profile_picture"], row["agent__rating"]
+        email = row["agent__user__email"]
+
+        # Keys in PropertyCardSerializer.Meta.fields / AgentSummarySerializer order.
+        return {
+            "id": str(row["id"]),
+            "title": row["title"],
+            "slug": row["slug"],
+            "location": row["location"],
+            "latitude": None if latitude is None else decimal["latitude"](latitude),
+            "longitude": None if longitude is None else decimal["longitude"](longitude),
+            "distance_km": None if distance is None else float(distance),
+            "price": decimal["price"](row["price"]),
+            "price_display": ListingDisplayMixin.price_display_for(row["price"], property_listing),
+            "price_suffix": ListingDisplayMixin.price_suffix_for(property_listing),
+            "property_type": property_type,
+            "property_type_display": self.type_labels.get(property_type, property_type),
+            "property_listing": property_listing,
+            "listing_type_display": self.listing_labels.get(property_listing, property_listing),
+            "bedrooms": row["bedrooms"],
+            "bathrooms": row["bathrooms"],
+            "sqft": row["sqft"],
+            "is_available": row["is_available"],
+            "availability_label": ListingDisplayMixin.availability_label_for(row["is_available"]),
+            "is_featured": row["is_featured"],
+            "is_favorited": bool(row.get("is_favorited", False)),
+            "main_image_url": self._main_image_url(row, first_images),
+            "main_image_srcset": self._main_image_srcset(row, first_images),
+            "agent": {
+                "id": str(row["agent_id"]),
+                "full_name": self.full_name or email,
+                "avatar_url": self.avatar_url(avatar) if avatar else None,
+                "phone": row["agent__office_phone_no"],
+                "email": email,
+                "agent_type": row["agent__agent_type"],
+                "company_name": row["agent__company_name"],
+                "verified": row["agent__verified"],
+                "rating": None if rating is None else self.rating(rating),
+                "years_of_experience": row["agent__years_of_experience"],
+                "total_listings": row["agent__total_listings"],
+            },
+            "created_at": self.datetime(row["created_at"]),
+        }
+
+
+def render_cards(rows, *, request=None) -> list[dict]:
+    """Serialize ``card_rows()`` dicts exactly as ``PropertyCardSerializer`` would."""
+    return CardRenderer(request).render(rows)
@@ -0,0 +1,267 @@
+"""
+Counter caches kept in step with the Property, Lead and PropertyViewing
+tables:
+
+- ``ListingCategoryCounter`` — a property is counted under its
+  ``(property_listing, property_type)`` pair while it is visible and
+  available.
+- ``AgentProfile`` counter columns — total / available listings, leads,
+  closed deals and viewings per agent.
+- ``Property`` engagement columns — leads, viewings and favourites per
+  listing.
+
+The post_save / post_delete handlers in signals.py compare the tracked
+previous values with the current ones and move the counts with ``F()``
+updates, inside the same transaction as the write that caused them.
+
+Bulk ``QuerySet.update()`` calls bypass the signals; call the
+``rebuild_*`` functions (or ``manage.py rebuild_category_counters`` /
+``rebuild_agent_counters``) after them to repair the drift.  Rows inserted
+with ``bulk_create()`` (importer.py) are counted with
+``count_new_listings()`` instead.  The
+engagement columns are also repaired nightly by
+``tasks.repair_engagement_counters``.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections import Counter
+from collections import defaultdict
+from functools import reduce
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+from core.applications.property.models import FavoriteProperty
+from core.applications.property.models import Lead
+from core.applications.property.models import ListingCategoryCounter
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyViewing
+from core.applications.users.models import AgentProfile
+from core.helpers.enums import Lead_Status_Choices
+
+CategoryKey = tuple[str, str]
+
+# Property columns ``category_key()`` reads.
+CATEGORY_FIELDS = ("visible", "is_available", "property_listing", "property_type")
+
+
+def category_key(*, visible, is_available, property_listing, property_type) -> CategoryKey | None:
+    """The counter pair a property with these values counts under, if any."""
+    if not (visible and is_available):
+        return None
+    return property_listing, property_type or ""
+
+
+def _adjust(key: CategoryKey, delta: int) -> None:
+    property_listing, property_type = key
+    ListingCategoryCounter.objects.bulk_create(
+        [ListingCategoryCounter(property_listing=property_listing, property_type=property_type)],
+        ignore_conflicts=True,
+    )
+    ListingCategoryCounter.objects.filter(
+        property_listing=property_listing,
+        property_type=property_type,
+    ).update(count=F("count") + delta)
+
+
+def move_category_count(old: CategoryKey | None, new: CategoryKey | None) -> None:
+    """Move one property's count from pair ``old`` to pair ``new``."""
+    if old == new:
+        return
+    with transaction.atomic():
+        if old is not None:
+            _adjust(old, -1)
+        if new is not None:
+            _adjust(new, 1)
+
+
+def rebuild_category_counters() -> int:
+    """
+    Recount every pair from the Property table and replace the counters.
+    Returns the number of counter rows written.
+    """
+    with transaction.atomic():
+        # Lock the counters first so concurrent F() adjustments queue
+        # behind the rebuild instead of being overwritten by it.
+        list(ListingCategoryCounter.objects.select_for_update())
+
+        rows = (
+            Property.objects.visible()
+            .available()
+            .order_by()
+            .values("property_listing", "property_type")
+            .annotate(total=Count("pk"))
+        )
+        totals: dict[CategoryKey, int] = {}
+        for row in rows:
+            key = (row["property_listing"], row["property_type"] or "")
+            totals[key] = totals.get(key, 0) + row["total"]
+
+        ListingCategoryCounter.objects.all().delete()
+        ListingCategoryCounter.objects.bulk_create(
+            [
+                ListingCategoryCounter(
+                    property_listing=property_listing,
+                    property_type=property_type,
+                    count=count,
+                )
+                for (property_listing, property_type), count in totals.items()
+            ],
+        )
+    return len(totals)
+
+
+# ---------------------------------------------------------------------------
+# Agent counters
+# ---------------------------------------------------------------------------
+
+# (agent_id, flag) — the agent a listing / lead counts for, plus whether it
+# is available / a closed deal.
+AgentKey = tuple[object, bool]
+
+
+def adjust_agent_counters(agent_id, **deltas: int) -> None:
+    """Add ``deltas`` (e.g. ``total_leads=1``) to one agent's counter columns."""
+    changes = {name: F(name) + delta for name, delta in deltas.items() if delta}
+    if agent_id is not None and changes:
+        AgentProfile.objects.filter(pk=agent_id).update(**changes)
+
+
+def _apply(deltas: dict[object, Counter]) -> None:
+    with transaction.atomic():
+        for agent_id, counts in deltas.items():
+            adjust_agent_counters(agent_id, **counts)
+
+
+def move_listing(old: AgentKey | None, new: AgentKey | None, *, viewings: int = 0) -> None:
+    """
+    Move one property's listing counts from ``old`` to ``new``
+    ``(agent_id, is_available)``.  A property handed to another agent takes
+    its ``viewings`` with it.
+    """
+    if old == new:
+        return
+    deltas: dict[object, Counter] = defaultdict(Counter)
+    if old is not None:
+        deltas[old[0]].update(total_listings=-1, active_listings=-int(old[1]))
+    if new is not None:
+        deltas[new[0]].update(total_listings=1, active_listings=int(new[1]))
+    if old is not None and new is not None and old[0] != new[0]:
+        deltas[old[0]]["total_viewings"] -= viewings
+        deltas[new[0]]["total_viewings"] += viewings
+    _apply(deltas)
+
+
+def move_lead(old: AgentKey | None, new: AgentKey | None) -> None:
+    """Move one lead's counts from ``old`` to ``new`` ``(agent_id, is_closed)``."""
+    if old == new:
+        return
+    deltas: dict[object, Counter] = defaultdict(Counter)
+    if old is not None:
+        deltas[old[0]].update(total_leads=-1, closed_deals=-int(old[1]))
+    if new is not None:
+        deltas[new[0]].update(total_leads=1, closed_deals=int(new[1]))
+    _apply(deltas)
+
+
+def is_closed_deal(status) -> bool:
+    return status == Lead_Status_Choices.CLOSED
+
+
+def adjust_viewing_count(property_id, delta: int) -> None:
+    """Add ``delta`` to ``total_viewings`` of the agent who owns ``property_id``."""
+    AgentProfile.objects.filter(properties=property_id).update(
+        total_viewings=F("total_viewings") + delta,
+    )
+
+
+def _count_per(queryset, path: str):
+    """Correlated ``COUNT`` of ``queryset`` rows whose ``path`` is the outer row."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{path: OuterRef("pk")})
+            .order_by()
+            .values(path)
+            .annotate(total=Count("pk"))
+            .values("total"),
+        ),
+        0,
+    )
+
+
+def count_new_listings(properties) -> None:
+    """
+    Category and agent listing counts for ``properties`` inserted with
+    ``bulk_create()``, which sends no post_save: one ``F()`` update per
+    category pair and per agent rather than per property.
+    """
+    categories: Counter = Counter()
+    agents: dict[object, Counter] = defaultdict(Counter)
+    for prop in properties:
+        key = category_key(**{name: getattr(prop, name) for name in CATEGORY_FIELDS})
+        if key is not None:
+            categories[key] += 1
+        agents[prop.agent_id].update(total_listings=1, active_listings=int(prop.is_available))
+    with transaction.atomic():
+        for key, count in categories.items():
+            _adjust(key, count)
+        _apply(agents)
+
+
+def rebuild_agent_counters() -> int:
+    """
+    Recount every agent's counters from the source tables in one UPDATE.
+    Returns the number of agents updated.
+    """
+    return AgentProfile.objects.update(
+        total_listings=_count_per(Property.objects.all(), "agent"),
+        active_listings=_count_per(Property.objects.filter(is_available=True), "agent"),
+        total_leads=_count_per(Lead.objects.all(), "agent"),
+        closed_deals=_count_per(
+            Lead.objects.filter(status=Lead_Status_Choices.CLOSED),
+            "agent",
+        ),
+        total_viewings=_count_per(PropertyViewing.objects.all(), "property__agent"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Property engagement counters
+# ---------------------------------------------------------------------------
+
+
+def adjust_engagement_counters(property_id, **deltas: int) -> None:
+    """Add ``deltas`` (e.g. ``lead_count=1``) to one property's counter columns."""
+    changes = {name: F(name) + delta for name, delta in deltas.items() if delta}
+    if property_id is not None and changes:
+        Property.objects.filter(pk=property_id).update(**changes)
+
+
+def _engagement_counts() -> dict:
+    return {
+        "lead_count": _count_per(Lead.objects.all(), "property_link"),
+        "viewing_count": _count_per(PropertyViewing.objects.all(), "property"),
+        "favorite_count": _count_per(FavoriteProperty.objects.all(), "property"),
+    }
+
+
+def repair_engagement_counters() -> int:
+    """
+    Recount the engagement columns of every property whose stored counts
+    have drifted from the source tables.  Rows that are already right are
+    not rewritten.  Returns the number of properties repaired.
+    """
+    counts = _engagement_counts()
+    drifted = Property.objects.annotate(
+        **{f"actual_{name}": expression for name, expression in counts.items()},
+    ).filter(
+        reduce(operator.or_, (~Q(**{name: F(f"actual_{name}")}) for name in counts)),
+    )
+    return Property.objects.filter(pk__in=drifted.values("pk")).update(**_engagement_counts())
@@ -0,0 +1,61 @@
+"""
+Export columns for the agent dashboard downloads (see
+``core.helpers.exports``).  Each map is ``{column name: ORM lookup}``;
+``?fields=`` / ``?omit=`` pick columns by name.  Only plain columns and
+to-one joins — nothing that needs a prefetch per row.
+"""
+
+PROPERTY_EXPORT_COLUMNS = {
+    "id": "id",
+    "title": "title",
+    "slug": "slug",
+    "property_type": "property_type",
+    "property_listing": "property_listing",
+    "price": "price",
+    "location": "location",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "bedrooms": "bedrooms",
+    "bathrooms": "bathrooms",
+    "sqft": "sqft",
+    "is_available": "is_available",
+    "visible": "visible",
+    "is_featured": "is_featured",
+    "featured_until": "featured_until",
+    "lead_count": "lead_count",
+    "viewing_count": "viewing_count",
+    "favorite_count": "favorite_count",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+LEAD_EXPORT_COLUMNS = {
+    "id": "id",
+    "status": "status",
+    "message": "message",
+    "notes": "notes",
+    "last_contact": "last_contact",
+    "user_name": "user__name",
+    "user_email": "user__email",
+    "user_phone_number": "user__phone_number",
+    "property_id": "property_link_id",
+    "property_title": "property_link__title",
+    "property_slug": "property_link__slug",
+    "created_at": "created_at",
+}
+
+VIEWING_EXPORT_COLUMNS = {
+    "id": "id",
+    "status": "status",
+    "scheduled_time": "scheduled_time",
+    "notes": "notes",
+    "cancellation_reason": "cancellation_reason",
+    "user_name": "user__name",
+    "user_email": "user__email",
+    "user_phone_number": "user__phone_number",
+    "property_id": "property_id",
+    "property_title": "property__title",
+    "property_slug": "property__slug",
+    "lead_id": "lead_id",
+    "created_at": "created_at",
+}
@@ -0,0 +1,248 @@
+"""
+Listing gallery writes: batch uploads and diff-based edits.
+
+``add_gallery_images()`` is what the API upload action and the dashboard
+forms call instead of one ``PropertyImage.objects.create()`` per file:
+
+- one query locks the property row and reads its gallery size and last
+  ``order``, and the batch is checked against the plan's
+  ``images_per_property`` cap before any bytes are written;
+- the files are written to media storage concurrently
+  (``PROPERTY_IMAGE_UPLOAD_WORKERS`` threads) — with a remote storage the
+  request waits for the slowest upload, not the sum of them;
+- one ``bulk_create`` inserts the rows, appended after the existing images;
+- renditions, the search document and the home-page cache are refreshed
+  after commit, as the PropertyImage post_save handlers would have done.
+
+``sync_gallery()`` applies an edited gallery (``update_property()``).
+Submitted entries are matched to existing rows by id, or by the SHA-256
+of an uploaded file (``PropertyImage.content_hash``), so only what changed
+is written: order changes in one ``bulk_update``, removed rows in one
+DELETE, and only genuinely new files are stored.  It takes the same
+property-row lock as ``add_gallery_images()``.
+
+Files already written are deleted again if the batch fails.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Max
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.functions import Now
+
+from core.applications.property.home_page import invalidate_home_page
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.search_documents import schedule_document_sync
+from core.applications.property.tasks import schedule_renditions
+from core.applications.subscriptions.features import get_limit
+from core.helpers.enums import SubscriptionPlan
+from core.helpers.media import MediaHelper
+from core.helpers.service_errors import ServiceValidationError
+from core.helpers.service_errors import SubscriptionLimitError
+
+
+def _lock_gallery(prop: Property) -> tuple[int, int]:
+    """
+    ``(image count, last order)`` of ``prop``'s gallery, read with the
+    property row locked so concurrent batches and edits can't both pass
+    the cap.
+    """
+    gallery = PropertyImage.objects.filter(property=OuterRef("pk")).order_by().values("property")
+    return (
+        Property.objects.select_for_update(no_key=True)
+        .filter(pk=prop.pk)
+        .annotate(
+            image_count=Coalesce(Subquery(gallery.annotate(total=Count("pk")).values("total")), 0),
+            last_order=Coalesce(Subquery(gallery.annotate(last=Max("order")).values("last")), -1),
+        )
+        .values_list("image_count", "last_order")
+        .get()
+    )
+
+
+def check_gallery_limit(prop: Property, *, current_count: int, adding: int) -> None:
+    """
+    Raise ``SubscriptionLimitError`` unless ``adding`` more images fit in
+    ``prop``'s gallery on its agent's plan.
+    """
+    subscription = prop.agent.current_subscription
+    plan = subscription.plan if subscription else SubscriptionPlan.FREE
+    limit = get_limit(plan, "images_per_property")
+    if limit is None or current_count + adding <= limit:
+        return
+    if current_count >= limit:
+        msg = (
+            f"You have reached your images per property limit ({limit}) "
+            f"for the {plan} plan. Please upgrade your subscription."
+        )
+    else:
+        msg = (
+            f"This listing has room for {limit - current_count} more image(s) "
+            f"on the {plan} plan; {adding} were uploaded."
+        )
+    raise SubscriptionLimitError(msg)
+
+
+def store_uploads(files: Sequence, *, prop: Property) -> list[str]:
+    """
+    Write ``files`` to the gallery's storage concurrently; returns the
+    stored names in input order.  On failure nothing is left behind.
+    """
+    field = PropertyImage._meta.get_field("image")
+    instance = PropertyImage(property=prop)
+
+    def save(upload) -> str:
+        name = field.generate_filename(instance, upload.name)
+        return field.storage.save(name, upload, max_length=field.max_length)
+
+    workers = max(1, min(settings.PROPERTY_IMAGE_UPLOAD_WORKERS, len(files)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(save, upload) for upload in files]
+    stored = [future.result() for future in futures if future.exception() is None]
+    if len(stored) < len(futures):
+        discard_uploads(stored)
+        # Re-raise the first failure.
+        next(future for future in futures if future.exception() is not None).result()
+    return stored
+
+
+def discard_uploads(names: Sequence[str]) -> None:
+    """Delete gallery files written by ``store_uploads()``."""
+    storage = PropertyImage._meta.get_field("image").storage
+    for name in names:
+        storage.delete(name)
+
+
+def insert_images(
+    prop: Property,
+    files: Sequence,
+    *,
+    orders: Sequence[int],
+    hashes: Sequence[str] | None = None,
+) -> list[PropertyImage]:
+    """
+    Store ``files`` and insert their rows at ``orders`` with one
+    ``bulk_create``; renditions are queued for after commit.  ``hashes``
+    are the files' ``content_hash`` values when already computed.
+    """
+    if hashes is None:
+        hashes = [MediaHelper.content_hash(upload) for upload in files]
+    names = store_uploads(files, prop=prop)
+    try:
+        images = PropertyImage.objects.bulk_create(
+            [
+                PropertyImage(property=prop, image=name, content_hash=digest, order=order)
+                for name, digest, order in zip(names, hashes, orders)
+            ],
+        )
+    except Exception:
+        discard_uploads(names)
+        raise
+    # bulk_create sends no post_save; queue the renditions here.
+    schedule_renditions(image_ids=[image.pk for image in images])
+    return images
+
+
+def _gallery_changed(prop: Property) -> None:
+    """The PropertyImage post_save handlers' work, for bulk writes."""
+    Property.objects.filter(pk=prop.pk).update(updated_at=Now())
+    schedule_document_sync([prop.pk])
+    transaction.on_commit(invalidate_home_page)
+
+
+def add_gallery_images(prop: Property, files: Sequence) -> list[PropertyImage]:
+    """
+    Append ``files`` (uploaded images) to ``prop``'s gallery.  Raises
+    ``SubscriptionLimitError`` — before anything is stored — when the batch
+    would exceed the plan's ``images_per_property``.
+    """
+    if not files:
+        return []
+
+    with transaction.atomic():
+        count, last_order = _lock_gallery(prop)
+        check_gallery_limit(prop, current_count=count, adding=len(files))
+        images = insert_images(
+            prop,
+            files,
+            orders=range(last_order + 1, last_order + 1 + len(files)),
+        )
+        _gallery_changed(prop)
+    return images
+
+
+def sync_gallery(prop: Property, items: Sequence[dict]) -> None:
+    """
+    Make ``prop``'s gallery exactly ``items``: ``{"id": <uuid>}`` keeps an
+    existing image, ``{"image": <upload>}`` adds one, each with an optional
+    ``order`` (default: its position in ``items``).  An upload whose bytes
+    match an image already in the gallery keeps that row rather than
+    storing the file again; images not listed are deleted.
+
+    Raises ``ServiceValidationError`` for an id that isn't in this gallery
+    and ``SubscriptionLimitError`` when the new uploads would exceed the
+    plan's ``images_per_property``.
+    """
+    with transaction.atomic():
+        # The same lock as add_gallery_images(), so a concurrent upload
+        # can't land between reading the gallery and checking the cap.
+        _lock_gallery(prop)
+        existing = {image.pk: image for image in PropertyImage.objects.filter(property=prop)}
+
+        keep: dict = {}
+        uploads = []
+        errors = []
+        for position, item in enumerate(items):
+            order = item.get("order", position)
+            if "id" not in item:
+                uploads.append((item["image"], order))
+            elif item["id"] in existing and item["id"] not in keep:
+                keep[item["id"]] = order
+            else:
+                errors.append(f"Image {item['id']} is not in this gallery or is listed twice.")
+        if errors:
+            raise ServiceValidationError({"images": errors})
+
+        unclaimed: dict[str, list] = {}
+        for image in existing.values():
+            if image.pk not in keep and image.content_hash:
+                unclaimed.setdefault(image.content_hash, []).append(image)
+        new_files, new_hashes, new_orders = [], [], []
+        for upload, order in uploads:
+            digest = MediaHelper.content_hash(upload)
+            if unclaimed.get(digest):
+                keep[unclaimed[digest].pop().pk] = order
+            else:
+                new_files.append(upload)
+                new_hashes.append(digest)
+                new_orders.append(order)
+
+        if new_files:
+            check_gallery_limit(prop, current_count=len(keep), adding=len(new_files))
+
+        removed = [pk for pk in existing if pk not in keep]
+        reordered = []
+        for pk, order in keep.items():
+            image = existing[pk]
+            if image.order != order:
+                image.order = order
+                reordered.append(image)
+
+        if removed:
+            # post_delete handlers refresh the parent for these.
+            PropertyImage.objects.filter(pk__in=removed).delete()
+        if reordered:
+            PropertyImage.objects.bulk_update(reordered, ["order"])
+        if new_files:
+            insert_images(prop, new_files, orders=new_orders, hashes=new_hashes)
+        if reordered or new_files:
+            _gallery_changed(prop)
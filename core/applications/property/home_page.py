@@ -0,0 +1,107 @@
+"""
+Cached home-page assembly for the API ``HomePageView`` and the HTML
+``HomeView``.
+
+Everything on the home page apart from favourite flags is the same for
+every visitor, so it is built once and cached under a version token.
+Signal handlers call ``invalidate_home_page()`` whenever a Property,
+PropertyImage, FeaturedListing or AgentProfile row changes, which swaps the
+token and orphans every cached entry at once — including the featured-
+listing sweeper when it expires boosts.  Entries also expire after
+``HOME_PAGE_CACHE_TIMEOUT`` as a backstop.
+
+Per-user ``is_favorited`` flags are overlaid on the cached cards with a
+single indexed lookup.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from core.applications.property.models import FavoriteProperty
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.users.models import AgentProfile
+
+HOME_PAGE_VERSION_KEY = "home-page:version"
+
+
+def _version() -> int:
+    version = cache.get(HOME_PAGE_VERSION_KEY)
+    if version is None:
+        # A time-based token can't collide with entries written under an
+        # evicted one.
+        cache.add(HOME_PAGE_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(HOME_PAGE_VERSION_KEY)
+    return version
+
+
+def invalidate_home_page() -> None:
+    """Orphan every cached home-page entry."""
+    cache.set(HOME_PAGE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def cached(name: str, build: Callable[[], Any], *parts: str) -> Any:
+    """
+    Return the cached value for ``name`` (and ``parts``, e.g. the host the
+    absolute URLs were built for), calling ``build`` on a miss.
+    """
+    key = ":".join(["home-page", str(_version()), name, *parts])
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value, settings.HOME_PAGE_CACHE_TIMEOUT)
+    return value
+
+
+def overlay_favorites(cards: list[dict], *, user) -> list[dict]:
+    """
+    Copies of serialized ``cards`` with ``is_favorited`` set for ``user``.
+    The cached cards themselves are never mutated.
+    """
+    if not (user and user.is_authenticated) or not cards:
+        return cards
+    favorited = {
+        str(pk)
+        for pk in FavoriteProperty.objects.filter(
+            user=user,
+            property_id__in=[card["id"] for card in cards],
+        ).values_list("property_id", flat=True)
+    }
+    return [{**card, "is_favorited": str(card["id"]) in favorited} for card in cards]
+
+
+# ---------------------------------------------------------------------------
+# HTML home page
+# ---------------------------------------------------------------------------
+
+
+def get_featured_properties() -> list[Property]:
+    """Featured-first property strip, with images prefetched before caching."""
+    return cached(
+        "html-properties",
+        lambda: list(
+            Property.objects.available()
+            .featured_first()
+            .prefetch_related(
+                Prefetch("images", queryset=PropertyImage.objects.ordered()),
+            )[:6],
+        ),
+    )
+
+
+def get_agent_strip() -> list[AgentProfile]:
+    """Verified agents for the "local agents" strip, capped at ``HOME_AGENT_STRIP_LIMIT``."""
+    return cached(
+        "html-agents",
+        lambda: list(
+            AgentProfile.objects.filter(verified=True)
+            .select_related("user")[: settings.HOME_AGENT_STRIP_LIMIT],
+        ),
+    )
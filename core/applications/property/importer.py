@@ -0,0 +1,394 @@
+"""
+Bulk property import for agencies: CSV, JSON (one array of objects) or
+NDJSON files, read as a stream so the whole file is never in memory.
+
+Rows are validated one at a time with ``PropertyImportRowSerializer`` and
+the model's own field validation, then saved ``PROPERTY_IMPORT_CHUNK_SIZE``
+at a time.  Each chunk is one transaction:
+
+- slugs from one ``allocate_slugs()`` query, allocated again if a
+  concurrent create wins one of them;
+- one ``bulk_create`` each for the properties, the amenity through-rows
+  and the gallery images, with ``geohash`` / ``amenity_ids`` filled in
+  up front;
+- one UPDATE for the search vectors, one ``F()`` update per category
+  pair and per agent for the counter caches, and one search-document sync
+  and home-page invalidation after commit.
+
+What ``create_property()`` pays per listing — the plan-limit COUNT, the
+M2M ``set()``, the post_save handlers — is paid once per import or per
+chunk instead.  Similar-property lists are rebuilt once the import
+commits.
+
+Rows that fail validation, or would take the agent past their plan's
+listing limit, are reported with their row number (1-based, CSV header
+excluded) and never stop the rest of the import.  A file that can't be
+parsed at all raises ``ImportFormatError``; chunks saved before that
+point stay saved unless the caller's transaction rolls back.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.db import transaction
+
+from core.applications.property.api.serializers import PropertyImportRowSerializer
+from core.applications.property.counters import count_new_listings
+from core.applications.property.home_page import invalidate_home_page
+from core.applications.property.models import Amenity
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.search_documents import schedule_document_sync
+from core.applications.property.slugs import SLUG_ATTEMPTS
+from core.applications.property.slugs import allocate_slugs
+from core.applications.property.tasks import rebuild_similar_properties
+from core.applications.property.tasks import schedule_renditions
+from core.applications.subscriptions.features import check_limit
+from core.helpers.enums import SubscriptionPlan
+from core.helpers.service_errors import SubscriptionLimitError
+
+IMPORT_FORMATS = ("csv", "json", "ndjson")
+# CSV cells holding lists (amenity names, gallery file names) separate
+# their items with "|".
+LIST_COLUMNS = ("amenities", "images")
+LIST_SEPARATOR = "|"
+
+_JSON_READ_SIZE = 64 * 1024
+
+
+class ImportFormatError(ValueError):
+    """The file can't be read in the requested format."""
+
+
+@dataclass
+class ImportReport:
+    """``created`` counts the rows saved — or, for a dry run, that would be."""
+
+    rows: int = 0
+    created: int = 0
+    dry_run: bool = False
+    errors: list[dict] = field(default_factory=list)
+
+    def reject(self, row: int, errors: dict) -> None:
+        self.errors.append({"row": row, "errors": errors})
+
+
+@dataclass
+class PendingListing:
+    """A validated, unsaved property with its amenity PKs and gallery file names."""
+
+    property: Property
+    amenity_ids: list = field(default_factory=list)
+    images: list[str] = field(default_factory=list)
+
+
+class _Malformed(NamedTuple):
+    message: str
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+
+def detect_format(name: str) -> str:
+    """Import format for a file name (``.csv``, ``.json``, ``.ndjson`` / ``.jsonl``)."""
+    suffix = Path(name).suffix.lower().lstrip(".")
+    file_format = "ndjson" if suffix == "jsonl" else suffix
+    if file_format not in IMPORT_FORMATS:
+        msg = f"Unsupported import file type {suffix or name!r}; use csv, json or ndjson."
+        raise ImportFormatError(msg)
+    return file_format
+
+
+def split_list_cells(row: dict) -> dict:
+    """Split the ``LIST_COLUMNS`` cells of a flat (CSV / spreadsheet) row into lists."""
+    for column in LIST_COLUMNS:
+        value = row.get(column)
+        if isinstance(value, str):
+            row[column] = [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+    return row
+
+
+def _csv_rows(stream) -> Iterator[dict | _Malformed]:
+    for row in csv.DictReader(stream):
+        if None in row:
+            yield _Malformed("The row has more cells than the header.")
+            continue
+        # Empty cells fall back to the field defaults.
+        yield split_list_cells(
+            {
+                column.strip(): value.strip()
+                for column, value in row.items()
+                if column and value is not None and value.strip()
+            },
+        )
+
+
+def _ndjson_rows(stream) -> Iterator[dict | _Malformed]:
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as exc:
+            yield _Malformed(f"Invalid JSON: {exc}")
+
+
+def _json_rows(stream) -> Iterator[dict | _Malformed]:
+    """Elements of a top-level JSON array, decoded as the file is read."""
+    decoder = json.JSONDecoder()
+    buffer, pos, state = "", 0, "start"
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos == len(buffer):
+            chunk = stream.read(_JSON_READ_SIZE)
+            if not chunk:
+                if state != "done":
+                    msg = "Unexpected end of the JSON array."
+                    raise ImportFormatError(msg)
+                return
+            buffer, pos = chunk, 0
+            continue
+
+        char = buffer[pos]
+        if state == "start":
+            if char != "[":
+                msg = "Expected a JSON array of objects."
+                raise ImportFormatError(msg)
+            pos, state = pos + 1, "first"
+        elif state == "first" and char == "]":
+            pos, state = pos + 1, "done"
+        elif state in ("first", "item"):
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                # Most likely an element cut off at the end of the buffer.
+                chunk = stream.read(_JSON_READ_SIZE)
+                if not chunk:
+                    msg = f"Invalid JSON: {exc}"
+                    raise ImportFormatError(msg) from exc
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            pos, state = end, "separator"
+            yield value
+        elif state == "separator" and char in ",]":
+            pos, state = pos + 1, "item" if char == "," else "done"
+        else:
+            msg = "Unexpected data in the JSON array."
+            raise ImportFormatError(msg)
+
+
+_READERS = {"csv": _csv_rows, "json": _json_rows, "ndjson": _ndjson_rows}
+
+
+def read_rows(stream, file_format: str) -> Iterator[dict | _Malformed]:
+    """Rows of a text ``stream``; unparseable rows come back as ``_Malformed``."""
+    return _READERS[file_format](stream)
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+def amenity_index() -> dict[str, object]:
+    """Amenity PK by name (case-insensitive) and by PK string, read in one query."""
+    index = {}
+    for pk, name in Amenity.objects.values_list("pk", "name"):
+        index[name.casefold()] = pk
+        index[str(pk)] = pk
+    return index
+
+
+def resolve_amenities(names, amenities: dict) -> list:
+    """Sorted amenity PKs for ``names``; raises ValidationError for unknown ones."""
+    unknown = [name for name in names if name.casefold() not in amenities]
+    if unknown:
+        raise ValidationError({"amenities": [f"Unknown amenity: {name}" for name in unknown]})
+    return sorted({amenities[name.casefold()] for name in names})
+
+
+def prepare_listing(prop: Property, amenity_ids: list, images: list[str]) -> PendingListing:
+    """Fill in what ``Property.save()`` and the m2m_changed handler would have set."""
+    prop.geohash = prop.compute_geohash()
+    prop.amenity_ids = amenity_ids
+    return PendingListing(property=prop, amenity_ids=amenity_ids, images=images)
+
+
+def _validate(row, *, agent, amenities: dict) -> tuple[PendingListing | None, dict | None]:
+    if isinstance(row, _Malformed):
+        return None, {"non_field_errors": [row.message]}
+    if not isinstance(row, dict):
+        return None, {"non_field_errors": ["Expected an object."]}
+
+    serializer = PropertyImportRowSerializer(data=row)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    data = dict(serializer.validated_data)
+    names = data.pop("amenities", [])
+    images = data.pop("images", [])
+
+    prop = Property(agent=agent, **data)
+    try:
+        amenity_ids = resolve_amenities(names, amenities)
+        # Slugs are allocated per chunk; no other unique columns to check.
+        prop.full_clean(exclude=["slug"], validate_unique=False)
+    except ValidationError as exc:
+        return None, exc.message_dict
+    return prepare_listing(prop, amenity_ids, images), None
+
+
+class _ListingAllowance:
+    """The agent's plan limit, from one COUNT at the start of the import."""
+
+    def __init__(self, agent):
+        subscription = agent.current_subscription
+        self.plan = subscription.plan if subscription else SubscriptionPlan.FREE
+        self.count = Property.objects.filter(agent=agent).count()
+
+    def take(self) -> dict | None:
+        """Claim one listing; the row's errors when the plan has none left."""
+        try:
+            check_limit(
+                plan=self.plan,
+                feature="properties",
+                current_count=self.count,
+                label="property listings",
+            )
+        except SubscriptionLimitError as exc:
+            return {"non_field_errors": [str(exc)]}
+        self.count += 1
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Saving
+# ---------------------------------------------------------------------------
+
+
+def _insert(pending: list[PendingListing]) -> None:
+    properties = [item.property for item in pending]
+    Property.objects.bulk_create(properties)
+
+    through = Property.amenities.through
+    through.objects.bulk_create(
+        [
+            through(property_id=item.property.pk, amenity_id=amenity_id)
+            for item in pending
+            for amenity_id in item.amenity_ids
+        ],
+    )
+    images = PropertyImage.objects.bulk_create(
+        [
+            PropertyImage(property=item.property, image=name, order=order)
+            for item in pending
+            for order, name in enumerate(item.images)
+        ],
+    )
+
+    property_ids = [prop.pk for prop in properties]
+    Property.objects.filter(pk__in=property_ids).refresh_search_vector()
+    count_new_listings(properties)
+    schedule_document_sync(property_ids)
+    schedule_renditions(
+        image_ids=[image.pk for image in images],
+        property_ids=[prop.pk for prop in properties if prop.cover_image],
+    )
+    transaction.on_commit(invalidate_home_page)
+
+
+def insert_listings(pending: list[PendingListing]) -> list[Property]:
+    """
+    Save one chunk of validated listings in a single transaction (see the
+    module docstring).  Returns the saved properties.
+    """
+    properties = [item.property for item in pending]
+    lost: set[str] = set()
+    for attempt in range(1, SLUG_ATTEMPTS + 1):
+        slugs = allocate_slugs(Property.objects, [prop.title for prop in properties], exclude=lost)
+        for prop, slug in zip(properties, slugs):
+            prop.slug = slug
+        try:
+            with transaction.atomic():
+                _insert(pending)
+        except IntegrityError:
+            taken = set(Property.objects.filter(slug__in=slugs).values_list("slug", flat=True))
+            if attempt == SLUG_ATTEMPTS or not taken:
+                raise
+            lost |= taken
+        else:
+            break
+    return properties
+
+
+def schedule_similarity_rebuild() -> None:
+    """Rebuild the similar-property lists once the import commits."""
+    transaction.on_commit(lambda: rebuild_similar_properties.delay())
+
+
+def import_properties(
+    stream,
+    *,
+    agent,
+    file_format: str,
+    chunk_size: int | None = None,
+    dry_run: bool = False,
+) -> ImportReport:
+    """
+    Import the listings in the binary file object ``stream`` (UTF-8, in
+    ``file_format``) for ``agent``.  With ``dry_run`` rows are only
+    validated.  Returns the ``ImportReport``.
+    """
+    chunk_size = chunk_size or settings.PROPERTY_IMPORT_CHUNK_SIZE
+    report = ImportReport(dry_run=dry_run)
+    amenities = amenity_index()
+    allowance = _ListingAllowance(agent)
+
+    def flush(chunk: list[PendingListing]) -> None:
+        if not dry_run:
+            insert_listings(chunk)
+        report.created += len(chunk)
+        chunk.clear()
+
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        chunk: list[PendingListing] = []
+        for number, row in enumerate(read_rows(text, file_format), start=1):
+            report.rows += 1
+            listing, errors = _validate(row, agent=agent, amenities=amenities)
+            if errors is None:
+                errors = allowance.take()
+            if errors is not None:
+                report.reject(number, errors)
+                continue
+            chunk.append(listing)
+            if len(chunk) >= chunk_size:
+                flush(chunk)
+        if chunk:
+            flush(chunk)
+    except UnicodeDecodeError as exc:
+        msg = f"The file is not valid UTF-8: {exc}"
+        raise ImportFormatError(msg) from exc
+    except csv.Error as exc:
+        msg = f"Invalid CSV: {exc}"
+        raise ImportFormatError(msg) from exc
+    finally:
+        # Leave the caller's file open.
+        text.detach()
+
+    if report.created and not dry_run:
+        schedule_similarity_rebuild()
+    return report
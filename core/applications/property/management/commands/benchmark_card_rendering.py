@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from core.applications.property.api.serializers import PropertyCardSerializer
+from core.applications.property.card_renderer import card_rows
+from core.applications.property.card_renderer import render_cards
+from core.applications.property.models import Property
+
+
+class Command(BaseCommand):
+    help = (
+        "Time a page of listing cards through PropertyCardSerializer and "
+        "through the values()-based card renderer, and check both render "
+        "byte-identical JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--cards",
+            type=int,
+            default=100,
+            help="Cards per page (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Timed runs per path; the best run is reported (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--host",
+            default=None,
+            help="Build absolute media URLs for this host, as the API does "
+            "(default: relative URLs).",
+        )
+
+    def handle(self, *args, **options):
+        cards, repeat = options["cards"], options["repeat"]
+        request = None
+        if options["host"]:
+            request = RequestFactory().get("/", HTTP_HOST=options["host"])
+        context = {"request": request} if request is not None else {}
+
+        queryset = (
+            Property.objects.visible()
+            .with_card_relations()
+            .with_favorite_annotation(user=None)
+            .safe_order("-created_at")
+        )
+
+        def serializer_path():
+            return PropertyCardSerializer(list(queryset[:cards]), many=True, context=context).data
+
+        def fast_path():
+            return render_cards(card_rows(queryset)[:cards], request=request)
+
+        renderer = JSONRenderer()
+        expected, actual = renderer.render(serializer_path()), renderer.render(fast_path())
+        if expected != actual:
+            msg = "The card renderer's JSON differs from PropertyCardSerializer's."
+            raise CommandError(msg)
+
+        rendered = len(queryset[:cards])
+        if not rendered:
+            self.stdout.write("No visible properties to render.")
+            return
+        self.stdout.write(f"{rendered} cards, identical JSON ({len(actual)} bytes).")
+
+        results = {}
+        for name, build in (("serializer", serializer_path), ("values()", fast_path)):
+            best = float("inf")
+            for _ in range(repeat):
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    build()
+                    best = min(best, time.perf_counter() - started)
+            results[name] = best
+            self.stdout.write(
+                f"  {name:<10}  {best * 1000:8.2f} ms/page  "
+                f"{best / rendered * 1e6:8.1f} µs/card  {len(queries)} queries",
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"values() path is {results['serializer'] / results['values()']:.1f}x faster.",
+            ),
+        )
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from geopy.exc import GeopyError
+from geopy.extra.rate_limiter import RateLimiter
+from geopy.geocoders import Nominatim
+
+from core.applications.property.models import Property
+
+_QUANT = Decimal("0.000001")
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill Property.latitude/longitude from the free-text location via "
+        "Nominatim (rate-limited to one request per second)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Geocode at most this many properties.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-geocode properties that already have coordinates.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the results without saving them.",
+        )
+
+    def handle(self, *args, **options):
+        geolocator = Nominatim(user_agent=settings.GEOCODER_USER_AGENT)
+        geocode = RateLimiter(geolocator.geocode, min_delay_seconds=1, max_retries=2)
+
+        qs = Property.objects.order_by("created_at")
+        if not options["all"]:
+            qs = qs.filter(latitude__isnull=True)
+        if options["limit"]:
+            qs = qs[: options["limit"]]
+
+        found = missed = 0
+        for prop in qs.only("id", "location", "latitude", "longitude").iterator():
+            try:
+                result = geocode(prop.location)
+            except GeopyError as exc:
+                self.stderr.write(f"  {prop.pk}: {exc}")
+                missed += 1
+                continue
+            if result is None:
+                self.stdout.write(self.style.WARNING(f"  no match: {prop.location!r}"))
+                missed += 1
+                continue
+
+            lat = Decimal(str(result.latitude)).quantize(_QUANT)
+            lng = Decimal(str(result.longitude)).quantize(_QUANT)
+            self.stdout.write(f"  {prop.location!r} -> {lat}, {lng}")
+            if not options["dry_run"]:
+                prop.latitude, prop.longitude = lat, lng
+                # Full post_save so search documents pick up the coordinates.
+                prop.save(update_fields=["latitude", "longitude", "updated_at"])
+            found += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Geocoded {found}, unmatched {missed}."))
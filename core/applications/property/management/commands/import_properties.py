@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from core.applications.property.importer import IMPORT_FORMATS
+from core.applications.property.importer import ImportFormatError
+from core.applications.property.importer import detect_format
+from core.applications.property.importer import import_properties
+from core.applications.users.models import AgentProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-import property listings for one agent from a CSV, JSON (array) "
+        "or NDJSON file. Rows are validated individually and saved in chunks; "
+        "rejected rows are listed with their errors."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument(
+            "--agent",
+            required=True,
+            help="E-mail address of the agent who will own the listings.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            default=None,
+            help="File format (default: from the file extension).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Rows saved per transaction (default: PROPERTY_IMPORT_CHUNK_SIZE).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without saving anything.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            agent = AgentProfile.objects.select_related("user").get(
+                user__email__iexact=options["agent"],
+            )
+        except AgentProfile.DoesNotExist:
+            msg = f"No agent profile for {options['agent']}."
+            raise CommandError(msg)
+
+        try:
+            file_format = options["format"] or detect_format(options["path"])
+            with open(options["path"], "rb") as stream:
+                report = import_properties(
+                    stream,
+                    agent=agent,
+                    file_format=file_format,
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                )
+        except (OSError, ImportFormatError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for rejected in report.errors:
+            self.stderr.write(f"Row {rejected['row']}: {json.dumps(rejected['errors'])}")
+
+        verb = "Would import" if report.dry_run else "Imported"
+        summary = f"{verb} {report.created} of {report.rows} rows; {len(report.errors)} rejected."
+        style = self.style.SUCCESS if not report.errors else self.style.WARNING
+        self.stdout.write(style(summary))
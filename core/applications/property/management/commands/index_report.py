@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+UNUSED_INDEXES_SQL = """
+    SELECT s.relname, s.indexrelname, s.idx_scan,
+           pg_size_pretty(pg_relation_size(s.indexrelid))
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.idx_scan <= %s
+      AND NOT i.indisunique
+      AND NOT i.indisprimary
+    ORDER BY pg_relation_size(s.indexrelid) DESC
+"""
+
+EXISTING_INDEXES_SQL = """
+    SELECT indexname FROM pg_indexes WHERE schemaname = current_schema()
+"""
+
+SEQ_SCAN_SQL = """
+    SELECT relname, seq_scan, COALESCE(idx_scan, 0), n_live_tup
+    FROM pg_stat_user_tables
+    WHERE n_live_tup >= %s
+      AND seq_scan > COALESCE(idx_scan, 0)
+    ORDER BY seq_scan DESC
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Report unused indexes (pg_stat_user_indexes), indexes declared in "
+        "Meta.indexes but missing from the database, and large tables read "
+        "mostly by sequential scan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to inspect (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--max-scans",
+            type=int,
+            default=0,
+            help="Report indexes scanned at most this many times (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--min-rows",
+            type=int,
+            default=1000,
+            help="Ignore tables smaller than this in the seq-scan report "
+            "(default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        with connection.cursor() as cursor:
+            cursor.execute(UNUSED_INDEXES_SQL, [options["max_scans"]])
+            unused = cursor.fetchall()
+            cursor.execute(EXISTING_INDEXES_SQL)
+            existing = {row[0] for row in cursor.fetchall()}
+            cursor.execute(SEQ_SCAN_SQL, [options["min_rows"]])
+            seq_heavy = cursor.fetchall()
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Unused indexes"))
+        if not unused:
+            self.stdout.write("  none")
+        for table, index, scans, size in unused:
+            self.stdout.write(f"  {table}.{index}  scans={scans}  size={size}")
+
+        missing = [
+            (model._meta.label, index.name)
+            for model in apps.get_models()
+            if model._meta.managed and not model._meta.proxy
+            for index in model._meta.indexes
+            if index.name not in existing
+        ]
+        self.stdout.write(self.style.MIGRATE_HEADING("Declared but missing indexes"))
+        if not missing:
+            self.stdout.write("  none")
+        for label, name in missing:
+            self.stdout.write(self.style.WARNING(f"  {label}: {name}"))
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Tables read mostly by seq scan"))
+        if not seq_heavy:
+            self.stdout.write("  none")
+        for table, seq_scans, idx_scans, rows in seq_heavy:
+            self.stdout.write(
+                f"  {table}  seq_scan={seq_scans}  idx_scan={idx_scans}  rows={rows}",
+            )
+
+        self.stdout.write(
+            "\nIndex statistics accumulate since the last pg_stat_reset(); "
+            "check a replica that has served real traffic before dropping anything.",
+        )
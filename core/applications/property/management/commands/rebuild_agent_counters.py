@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.applications.property.counters import rebuild_agent_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount every AgentProfile counter column (listings, available "
+        "listings, leads, closed deals, viewings) from the source tables."
+    )
+
+    def handle(self, *args, **options):
+        updated = rebuild_agent_counters()
+        self.stdout.write(self.style.SUCCESS(f"Recounted {updated} agent profiles."))
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.applications.property.counters import rebuild_category_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount visible, available properties per listing type and property "
+        "type and replace the ListingCategoryCounter rows."
+    )
+
+    def handle(self, *args, **options):
+        written = rebuild_category_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} category counters."))
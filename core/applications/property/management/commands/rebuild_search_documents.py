@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.applications.property.search_documents import rebuild_documents
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild PropertySearchDocument rows for every visible property and "
+        "drop documents for hidden or deleted ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Properties synced per batch (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_documents(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} search documents."))
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.applications.property.similarity import rebuild_similar
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the precomputed 'similar properties' neighbours for every "
+        "visible, available listing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=None,
+            help="Neighbours stored per property (default: PROPERTY_SIMILAR_TOP_K).",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_similar(k=options["top_k"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} similar-property rows."))
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.tasks import generate_cover_renditions
+from core.applications.property.tasks import generate_image_renditions
+
+
+def _batches(ids, size):
+    batch = []
+    for pk in ids.iterator(chunk_size=size):
+        batch.append(str(pk))
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue WebP / AVIF rendition generation for gallery and cover images "
+        "that have none yet (e.g. uploaded before renditions existed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-render every image, not just those without renditions.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Images per queued task (default: %(default)s).",
+        )
+
+    def handle(self, *args, **options):
+        images = PropertyImage.objects.exclude(image="")
+        covers = Property.objects.exclude(cover_image="").exclude(cover_image__isnull=True)
+        if not options["all"]:
+            images = images.filter(renditions={})
+            covers = covers.filter(cover_renditions={})
+
+        queued = 0
+        for batch in _batches(images.order_by("pk").values_list("pk", flat=True), options["batch_size"]):
+            generate_image_renditions.delay(batch)
+            queued += len(batch)
+        for batch in _batches(covers.order_by("pk").values_list("pk", flat=True), options["batch_size"]):
+            generate_cover_renditions.delay(batch)
+            queued += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Queued renditions for {queued} images."))
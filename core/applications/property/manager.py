@@ -5,7 +5,14 @@ from core.applications.property.querysets.property_queryset import (
     FavoritePropertyQuerySet,
 )
 from core.applications.property.querysets.property_queryset import LeadQuerySet
+from core.applications.property.querysets.property_queryset import PropertyImageQuerySet
+from core.applications.property.querysets.property_queryset import (
+    ListingCategoryCounterQuerySet,
+)
 from core.applications.property.querysets.property_queryset import PropertyQuerySet
+from core.applications.property.querysets.property_queryset import (
+    PropertySearchDocumentQuerySet,
+)
 from core.applications.property.querysets.property_queryset import (
     PropertySubscriptionQuerySet,
 )
@@ -14,8 +21,15 @@ from core.applications.property.querysets.property_queryset import (
 )
 
 PropertyManager = models.Manager.from_queryset(PropertyQuerySet)
+PropertyImageManager = models.Manager.from_queryset(PropertyImageQuerySet)
 LeadManager = models.Manager.from_queryset(LeadQuerySet)
 PropertyViewingManager = models.Manager.from_queryset(PropertyViewingQuerySet)
 FavoritePropertyManager = models.Manager.from_queryset(FavoritePropertyQuerySet)
 PropertySubscriptionManager = models.Manager.from_queryset(PropertySubscriptionQuerySet)
 AmenityManager = models.Manager.from_queryset(AmenityQuerySet)
+PropertySearchDocumentManager = models.Manager.from_queryset(
+    PropertySearchDocumentQuerySet,
+)
+ListingCategoryCounterManager = models.Manager.from_queryset(
+    ListingCategoryCounterQuerySet,
+)
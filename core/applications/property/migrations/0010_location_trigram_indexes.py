@@ -0,0 +1,27 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:44
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0009_property_search_vector'),
+        ('users', '0006_alter_agentprofile_verification_status_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='property',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['location'], name='property_location_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='propertysubscription',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['location'], name='prop_sub_location_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
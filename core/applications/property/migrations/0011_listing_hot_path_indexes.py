@@ -0,0 +1,40 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0010_location_trigram_indexes'),
+        ('users', '0006_alter_agentprofile_verification_status_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['agent', 'status', '-created_at'], name='lead_agent_status_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_available', True), ('visible', True)), fields=['-created_at', '-id'], name='prop_live_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_available', True), ('visible', True)), fields=['property_listing', '-created_at', '-id'], name='prop_live_listing_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_available', True), ('visible', True)), fields=['property_listing', 'property_type', 'price'], name='prop_live_listing_type_price'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_available', True), ('visible', True)), fields=['property_listing', 'bedrooms'], name='prop_live_listing_beds_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyviewing',
+            index=models.Index(fields=['user', '-scheduled_time'], name='viewing_user_scheduled_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:50
+
+import auto_prefetch
+import core.applications.property.models
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+import django.db.models.manager
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0011_listing_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertySearchDocument',
+            fields=[
+                ('property', auto_prefetch.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='property.property')),
+                ('title', models.CharField(blank=True, max_length=50, null=True)),
+                ('slug', models.SlugField(max_length=255)),
+                ('location', models.CharField(max_length=255)),
+                ('property_type', models.CharField(blank=True, choices=[('apartment', 'Apartment'), ('house', 'House'), ('studio', 'Studio'), ('villa', 'Villa'), ('duplex', 'Duplex'), ('bungalow', 'Bungalow'), ('penthouse', 'Penthouse'), ('townhouse', 'Townhouse'), ('condo', 'Condominium'), ('land', 'Land'), ('office', 'Office Space'), ('shop', 'Shop'), ('warehouse', 'Warehouse'), ('farm', 'Farm / Agricultural'), ('other', 'Other')], max_length=50, null=True)),
+                ('property_listing', models.CharField(choices=[('Rent', 'Rent'), ('For Sale', 'For Sale'), ('Short Let', 'Short Let')], max_length=200)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=20)),
+                ('price_per_sqft', models.DecimalField(blank=True, decimal_places=2, max_digits=20, null=True)),
+                ('bedrooms', models.PositiveIntegerField()),
+                ('bathrooms', models.PositiveIntegerField()),
+                ('sqft', models.PositiveIntegerField()),
+                ('is_available', models.BooleanField(default=True)),
+                ('is_featured', models.BooleanField(default=False)),
+                ('cover_image_url', models.CharField(blank=True, max_length=500)),
+                ('agent_id', models.CharField(db_index=True, max_length=120)),
+                ('agent_name', models.CharField(blank=True, max_length=255)),
+                ('agent_avatar_url', models.CharField(blank=True, max_length=500)),
+                ('amenity_ids', django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), blank=True, default=list, size=None)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Property Search Document',
+                'verbose_name_plural': 'Property Search Documents',
+                'ordering': ['-created_at', '-pk'],
+                'abstract': False,
+                'base_manager_name': 'prefetch_manager',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='propdoc_search_vector_gin'), django.contrib.postgres.indexes.GinIndex(fields=['amenity_ids'], name='propdoc_amenity_ids_gin'), django.contrib.postgres.indexes.GinIndex(fields=['location'], name='propdoc_location_trgm', opclasses=['gin_trgm_ops']), models.Index(fields=['property_listing', '-created_at', '-property'], name='propdoc_listing_recent_idx'), models.Index(fields=['property_listing', 'property_type', 'price'], name='propdoc_listing_type_price')],
+            },
+            bases=(core.applications.property.models.ListingDisplayMixin, models.Model),
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:52
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import migrations, models
+from django.db.models import OuterRef
+
+
+def backfill_amenity_ids(apps, schema_editor):
+    Property = apps.get_model("property", "Property")
+    Through = Property.amenities.through
+    Property.objects.update(
+        amenity_ids=ArraySubquery(
+            Through.objects.filter(property_id=OuterRef("pk"))
+            .order_by("amenity_id")
+            .values("amenity_id"),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0012_property_search_document'),
+        ('users', '0006_alter_agentprofile_verification_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='amenity_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.UUIDField(), blank=True, default=list, editable=False, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['amenity_ids'], name='property_amenity_ids_gin'),
+        ),
+        migrations.RunPython(backfill_amenity_ids, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:55
+
+from django.db import migrations, models
+
+from core.helpers.geo import geohash_encode
+
+
+def backfill_geohash(apps, schema_editor):
+    Property = apps.get_model("property", "Property")
+    batch = []
+    located = Property.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    for prop in located.only("id", "latitude", "longitude").iterator(chunk_size=1000):
+        prop.geohash = geohash_encode(float(prop.latitude), float(prop.longitude))
+        batch.append(prop)
+        if len(batch) >= 1000:
+            Property.objects.bulk_update(batch, ["geohash"])
+            batch = []
+    Property.objects.bulk_update(batch, ["geohash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0014_property_coordinates'),
+        ('users', '0006_alter_agentprofile_verification_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='geohash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('visible', True), models.Q(('geohash', ''), _negated=True)), fields=['geohash'], name='prop_live_geohash_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:59
+
+import auto_prefetch
+import django.db.models.deletion
+import django.db.models.manager
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0015_property_geohash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SimilarProperty',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('property', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='similar_entries', to='property.property')),
+                ('similar', auto_prefetch.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbour_of', to='property.property')),
+            ],
+            options={
+                'verbose_name': 'Similar Property',
+                'verbose_name_plural': 'Similar Properties',
+                'ordering': ['property', 'rank'],
+                'abstract': False,
+                'base_manager_name': 'prefetch_manager',
+                'indexes': [models.Index(fields=['property', 'rank'], name='similar_property_rank_idx')],
+            },
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='similarproperty',
+            constraint=models.UniqueConstraint(fields=('property', 'similar'), name='similar_property_unique_pair'),
+        ),
+    ]
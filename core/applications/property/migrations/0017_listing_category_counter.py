@@ -0,0 +1,62 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:02
+
+import django.db.models.manager
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    Property = apps.get_model("property", "Property")
+    ListingCategoryCounter = apps.get_model("property", "ListingCategoryCounter")
+    totals = {}
+    rows = (
+        Property.objects.filter(visible=True, is_available=True)
+        .order_by()
+        .values("property_listing", "property_type")
+        .annotate(total=Count("pk"))
+    )
+    for row in rows:
+        key = (row["property_listing"], row["property_type"] or "")
+        totals[key] = totals.get(key, 0) + row["total"]
+    ListingCategoryCounter.objects.bulk_create(
+        [
+            ListingCategoryCounter(property_listing=listing, property_type=ptype, count=count)
+            for (listing, ptype), count in totals.items()
+        ],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0016_similar_property'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingCategoryCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('property_listing', models.CharField(choices=[('Rent', 'Rent'), ('For Sale', 'For Sale'), ('Short Let', 'Short Let')], max_length=200)),
+                ('property_type', models.CharField(blank=True, choices=[('apartment', 'Apartment'), ('house', 'House'), ('studio', 'Studio'), ('villa', 'Villa'), ('duplex', 'Duplex'), ('bungalow', 'Bungalow'), ('penthouse', 'Penthouse'), ('townhouse', 'Townhouse'), ('condo', 'Condominium'), ('land', 'Land'), ('office', 'Office Space'), ('shop', 'Shop'), ('warehouse', 'Warehouse'), ('farm', 'Farm / Agricultural'), ('other', 'Other')], max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Listing Category Counter',
+                'verbose_name_plural': 'Listing Category Counters',
+                'ordering': ['property_listing', 'property_type'],
+                'abstract': False,
+                'base_manager_name': 'prefetch_manager',
+            },
+            managers=[
+                ('objects', django.db.models.manager.Manager()),
+                ('prefetch_manager', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='listingcategorycounter',
+            constraint=models.UniqueConstraint(fields=('property_listing', 'property_type'), name='listing_category_counter_pair'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
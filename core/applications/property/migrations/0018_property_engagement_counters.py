@@ -0,0 +1,69 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:14
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count_per(queryset, path):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{path: OuterRef("pk")})
+            .order_by()
+            .values(path)
+            .annotate(total=Count("pk"))
+            .values("total"),
+        ),
+        0,
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    Property = apps.get_model("property", "Property")
+    Lead = apps.get_model("property", "Lead")
+    PropertyViewing = apps.get_model("property", "PropertyViewing")
+    FavoriteProperty = apps.get_model("property", "FavoriteProperty")
+    Property.objects.update(
+        lead_count=_count_per(Lead.objects.all(), "property_link"),
+        viewing_count=_count_per(PropertyViewing.objects.all(), "property"),
+        favorite_count=_count_per(FavoriteProperty.objects.all(), "property"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0017_listing_category_counter'),
+        ('users', '0007_agentprofile_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='favorite_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='lead_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='viewing_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['agent', 'lead_count', 'id'], name='prop_agent_leads_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['agent', 'viewing_count', 'id'], name='prop_agent_viewings_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['agent', 'favorite_count', 'id'], name='prop_agent_favorites_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
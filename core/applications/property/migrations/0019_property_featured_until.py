@@ -0,0 +1,45 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:17
+
+from django.db import migrations, models
+from django.db.models import Exists, F, OuterRef, Q, Subquery
+from django.db.models.functions import Now
+
+
+def backfill_featured(apps, schema_editor):
+    Property = apps.get_model("property", "Property")
+    FeaturedListing = apps.get_model("subscriptions", "FeaturedListing")
+    active = FeaturedListing.objects.filter(property=OuterRef("pk"), is_active=True).filter(
+        Q(end_date__isnull=True) | Q(end_date__gt=Now()),
+    )
+    Property.objects.update(
+        is_featured=Exists(active),
+        featured_until=Subquery(
+            active.order_by(F("end_date").desc(nulls_first=True)).values("end_date")[:1],
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0018_property_engagement_counters'),
+        ('subscriptions', '0004_alter_featuredlisting_property'),
+        ('users', '0007_agentprofile_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='featured_until',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_available', True)), fields=['-is_featured', '-created_at'], name='prop_featured_first_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_available', True)), fields=['property_listing', '-is_featured', '-created_at'], name='prop_listing_featured_idx'),
+        ),
+        migrations.RunPython(backfill_featured, migrations.RunPython.noop),
+    ]
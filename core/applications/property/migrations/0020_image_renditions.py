@@ -0,0 +1,28 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0019_property_featured_until'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='cover_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='propertysearchdocument',
+            name='cover_renditions',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0021_image_content_hash'),
+        ('users', '0007_agentprofile_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='property',
+            name='prop_live_recent_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='property',
+            name='prop_live_listing_recent_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='property',
+            name='prop_live_listing_type_price',
+        ),
+        migrations.RemoveIndex(
+            model_name='property',
+            name='prop_live_listing_beds_idx',
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['-created_at', '-id'], name='prop_live_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['property_listing', '-created_at', '-id'], name='prop_live_listing_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['property_listing', 'property_type', 'price'], name='prop_live_listing_type_price'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('visible', True)), fields=['property_listing', 'bedrooms'], name='prop_live_listing_beds_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.13 on 2026-10-18 10:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_description(apps, schema_editor):
+    Property = apps.get_model("property", "Property")
+    PropertySearchDocument = apps.get_model("property", "PropertySearchDocument")
+    PropertySearchDocument.objects.update(
+        description=Subquery(
+            Property.objects.filter(pk=OuterRef("property_id")).values("description")[:1],
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0022_listing_indexes_visible_only'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertysearchdocument',
+            name='description',
+            field=models.TextField(blank=True, default=''),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_description, migrations.RunPython.noop),
+    ]
@@ -2,18 +2,30 @@ from __future__ import annotations
 
 import auto_prefetch
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator
+from django.core.validators import MinValueValidator
+from django.db import IntegrityError
 from django.db import models
+from django.db import transaction
 from django.utils import timezone
 from django.utils.html import format_html
-from django.utils.text import slugify
+from model_utils import FieldTracker
 
 from core.applications.property.manager import AmenityManager
 from core.applications.property.manager import FavoritePropertyManager
 from core.applications.property.manager import LeadManager
+from core.applications.property.manager import ListingCategoryCounterManager
+from core.applications.property.manager import PropertyImageManager
 from core.applications.property.manager import PropertyManager
+from core.applications.property.manager import PropertySearchDocumentManager
 from core.applications.property.manager import PropertySubscriptionManager
 from core.applications.property.manager import PropertyViewingManager
+from core.applications.property.slugs import SLUG_ATTEMPTS
+from core.applications.property.slugs import allocate_slug
 from core.applications.subscriptions.features import FEATURE_LIMITS
 from core.helpers.enums import Lead_Status_Choices
 from core.helpers.enums import LeadStatus
@@ -21,15 +33,15 @@ from core.helpers.enums import PropertyListingType
 from core.helpers.enums import PropertyTypeChoices
 from core.helpers.enums import PropertyViewingChoices
 from core.helpers.enums import SubscriptionPlan
+from core.helpers.geo import geohash_encode
 from core.helpers.media import MediaHelper
 from core.helpers.models import TimeBasedModel
 from core.helpers.models import TitleTimeBasedModel
+from core.helpers.models import save_fields_except
 
 User = get_user_model()
 
 
-
-
 class PropertyType(TitleTimeBasedModel):
     """
     Lookup table for property categories rendered in the
@@ -64,7 +76,64 @@ class Amenity(TimeBasedModel):
 
 
 
-class Property(TitleTimeBasedModel):
+class ListingDisplayMixin:
+    """
+    Price / availability labels shared by ``Property`` and
+    ``PropertySearchDocument`` — both carry ``price``,
+    ``property_listing`` and ``is_available`` columns.
+
+    The static ``*_for`` helpers take the raw column values, so code
+    rendering cards from ``values()`` rows produces the same labels.
+    """
+
+    # ---- price display -----------------------------------------------------
+
+    @staticmethod
+    def price_suffix_for(property_listing) -> str:
+        """
+        Cadence label shown after the price on the detail page.
+          SHORT_LET → '/night'
+          RENT      → '/year'
+          SALE      → ''
+        """
+        mapping = {
+            PropertyListingType.SHORT_LET: "/night",
+            PropertyListingType.RENT: "/year",
+        }
+        return mapping.get(property_listing, "")
+
+    @staticmethod
+    def price_display_for(price, property_listing) -> str:
+        return f"${price:,.2f} {ListingDisplayMixin.price_suffix_for(property_listing)}".strip()
+
+    @staticmethod
+    def availability_label_for(is_available) -> str:
+        return "Available" if is_available else "Not Available"
+
+    @property
+    def formatted_price(self) -> str:
+        """e.g. '$43,000.00'"""
+        return f"${self.price:,.2f}"
+
+    @property
+    def price_suffix(self) -> str:
+        return self.price_suffix_for(self.property_listing)
+
+    @property
+    def price_display(self) -> str:
+        """Full string e.g. '$4,500 /night' or '$250,000'."""
+        return self.price_display_for(self.price, self.property_listing)
+
+    @property
+    def availability_label(self) -> str:
+        return self.availability_label_for(self.is_available)
+
+
+# Property counter columns, moved by core.applications.property.counters.
+PROPERTY_COUNTER_FIELDS = ("lead_count", "viewing_count", "favorite_count")
+
+
+class Property(ListingDisplayMixin, TitleTimeBasedModel):
     """
     Central listing model.  Supports all three listing types visible
     in the designs: For Sale, For Rent, and Short-let (nightly pricing).
@@ -92,6 +161,9 @@ class Property(TitleTimeBasedModel):
         null=True,
         blank=True,
     )
+    # Resized WebP / AVIF copies of cover_image, written by the rendition
+    # task after upload — see renditions.py.
+    cover_renditions = models.JSONField(default=dict, blank=True, editable=False)
     slug = models.SlugField(max_length=255, unique=True, blank=True)
     description = models.TextField()
     property_type = models.CharField(
@@ -111,6 +183,26 @@ class Property(TitleTimeBasedModel):
     # price_suffix and price_display expose the right label automatically.
     price = models.DecimalField(max_digits=20, decimal_places=2)
     location = models.CharField(max_length=255)
+    # WGS84 coordinates for radius / map-viewport search.  Plain decimals
+    # with a B-tree index: bounding-box pre-filter, haversine for the exact
+    # distance (see core.helpers.geo).  Backfill with ``manage.py geocode_properties``.
+    latitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )
+    longitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )
+    # Full-precision geohash of (latitude, longitude), derived in save().
+    # Map clustering groups on its prefixes — see get_property_clusters().
+    geohash = models.CharField(max_length=12, blank=True, default="", editable=False)
     bedrooms = models.PositiveIntegerField()
     bathrooms = models.PositiveIntegerField()
     sqft = models.PositiveIntegerField(help_text="Size in square feet.")
@@ -119,15 +211,98 @@ class Property(TitleTimeBasedModel):
         blank=True,
         related_name="properties",
     )
+    # Denormalised copy of ``amenities`` for single-lookup GIN filtering
+    # (``@>`` / ``&&``) — kept in sync by the m2m_changed handler in signals.py.
+    amenity_ids = ArrayField(models.UUIDField(), default=list, blank=True, editable=False)
     is_available = models.BooleanField(default=True)
+    # Denormalised from the active FeaturedListing boosts (latest end date;
+    # NULL while featured means open-ended) — kept in sync by
+    # subscriptions.services.boost.sync_featured_flags() and the expiry sweeper.
     is_featured = models.BooleanField(default=False)
+    featured_until = models.DateTimeField(null=True, blank=True, editable=False)
+    # Weighted tsvector (title > location > description) maintained by the
+    # post_save handler in signals.py — see PropertyQuerySet.refresh_search_vector().
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    # Engagement counters, kept current with F() updates by the Lead /
+    # PropertyViewing / FavoriteProperty handlers in signals.py; the
+    # agent dashboard table sorts on them (see counters.py).
+    # A stale instance must not write them back: full saves skip
+    # PROPERTY_COUNTER_FIELDS unless named in update_fields.
+    lead_count = models.IntegerField(default=0, editable=False)
+    viewing_count = models.IntegerField(default=0, editable=False)
+    favorite_count = models.IntegerField(default=0, editable=False)
 
     objects = PropertyManager()
+    # Previous values for the ListingCategoryCounter and AgentProfile
+    # counter handlers in signals.py; cover_image for the rendition handler.
+    tracker = FieldTracker(
+        fields=["visible", "is_available", "property_listing", "property_type", "agent", "cover_image"],
+    )
 
     class Meta(auto_prefetch.Model.Meta):
         ordering = ["-created_at", "-id"]
         verbose_name = "Property"
         verbose_name_plural = "Properties"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="property_search_vector_gin"),
+            GinIndex(
+                fields=["location"],
+                opclasses=["gin_trgm_ops"],
+                name="property_location_trgm",
+            ),
+            GinIndex(fields=["amenity_ids"], name="property_amenity_ids_gin"),
+            # Partial indexes for the public listing paths.  The listing
+            # shows unavailable rows too (labelled "Not Available"), so the
+            # condition is visible alone; ?is_available= filters on top.
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=models.Q(visible=True),
+                name="prop_live_recent_idx",
+            ),
+            models.Index(
+                fields=["property_listing", "-created_at", "-id"],
+                condition=models.Q(visible=True),
+                name="prop_live_listing_recent_idx",
+            ),
+            models.Index(
+                fields=["property_listing", "property_type", "price"],
+                condition=models.Q(visible=True),
+                name="prop_live_listing_type_price",
+            ),
+            models.Index(
+                fields=["property_listing", "bedrooms"],
+                condition=models.Q(visible=True),
+                name="prop_live_listing_beds_idx",
+            ),
+            models.Index(
+                fields=["latitude", "longitude"],
+                condition=models.Q(visible=True, latitude__isnull=False),
+                name="prop_live_lat_lng_idx",
+            ),
+            # varchar_pattern_ops so geohash__startswith (LIKE 'abc%') uses it.
+            models.Index(
+                fields=["geohash"],
+                opclasses=["varchar_pattern_ops"],
+                condition=models.Q(visible=True) & ~models.Q(geohash=""),
+                name="prop_live_geohash_idx",
+            ),
+            # featured_first() on the home page and the rent / buy lists.
+            models.Index(
+                fields=["-is_featured", "-created_at"],
+                condition=models.Q(is_available=True),
+                name="prop_featured_first_idx",
+            ),
+            models.Index(
+                fields=["property_listing", "-is_featured", "-created_at"],
+                condition=models.Q(is_available=True),
+                name="prop_listing_featured_idx",
+            ),
+            # Agent dashboard table sorted by an engagement counter; scanned
+            # backwards for descending order.
+            models.Index(fields=["agent", "lead_count", "id"], name="prop_agent_leads_idx"),
+            models.Index(fields=["agent", "viewing_count", "id"], name="prop_agent_viewings_idx"),
+            models.Index(fields=["agent", "favorite_count", "id"], name="prop_agent_favorites_idx"),
+        ]
 
 
     def __str__(self) -> str:
@@ -138,50 +313,57 @@ class Property(TitleTimeBasedModel):
         """
         Handles only persistence concerns:
         - slug generation
-        """
-
-        if not self.slug:
-            self.slug = self._generate_unique_slug()
+        - geohash derived from latitude / longitude
+        - a full save of an existing row leaves the engagement counters
+          out (see ``PROPERTY_COUNTER_FIELDS``)
 
-        super().save(*args, **kwargs)
-
-    def _generate_unique_slug(self) -> str:
-        base_slug = slugify(self.title)
-        slug, counter = base_slug, 1
-        while Property.objects.filter(slug=slug).exists():
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-        return slug
-
-    # ---- price display -----------------------------------------------------
-
-    @property
-    def formatted_price(self) -> str:
-        """e.g. '$43,000.00'"""
-        return f"${self.price:,.2f}"
+        That full save pins ``update_fields``, so saving an instance whose
+        row has been deleted raises ``DatabaseError`` rather than inserting
+        it again; use ``save(force_insert=True)`` to recreate a row.
+        """
 
-    @property
-    def price_suffix(self) -> str:
+        if (
+            kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not self._state.adding
+        ):
+            kwargs["update_fields"] = save_fields_except(self, PROPERTY_COUNTER_FIELDS)
+
+        self.geohash = self.compute_geohash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            self._save_with_new_slug(*args, **kwargs)
+
+    def compute_geohash(self) -> str:
+        """The ``geohash`` for the current coordinates ("" without a pair)."""
+        if self.latitude is None or self.longitude is None:
+            return ""
+        return geohash_encode(float(self.latitude), float(self.longitude))
+
+    def _save_with_new_slug(self, *args, **kwargs) -> None:
         """
-        Cadence label shown after the price on the detail page.
-          SHORT_LET → '/night'
-          RENT      → '/year'
-          SALE      → ''
+        Insert under a freshly allocated slug (see slugs.py).  A concurrent
+        create can claim the same slug between allocation and insert; the
+        unique constraint rejects ours and a new slug is allocated.
         """
-        mapping = {
-            PropertyListingType.SHORT_LET: "/night",
-            PropertyListingType.RENT: "/year",
-        }
-        return mapping.get(self.property_listing, "")
-
-    @property
-    def price_display(self) -> str:
-        """Full string e.g. '$4,500 /night' or '$250,000'."""
-        return f"{self.formatted_price} {self.price_suffix}".strip()
-
-    @property
-    def availability_label(self) -> str:
-        return "Available" if self.is_available else "Not Available"
+        lost: list[str] = []
+        for attempt in range(1, SLUG_ATTEMPTS + 1):
+            self.slug = allocate_slug(Property.objects, self.title, exclude=lost)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                taken = Property.objects.filter(slug=self.slug).exists()
+                if attempt == SLUG_ATTEMPTS or not taken:
+                    self.slug = ""
+                    raise
+                lost.append(self.slug)
 
     # ---- image helpers -----------------------------------------------------
 
@@ -198,6 +380,13 @@ class Property(TitleTimeBasedModel):
         first = self.images.all()[:1]
         return first[0].image if first else None
 
+    def get_main_image_renditions(self) -> dict:
+        """The renditions of ``get_main_image()`` (see renditions.py); {} until rendered."""
+        if self.cover_image:
+            return self.cover_renditions
+        first = self.images.all()[:1]
+        return first[0].renditions if first else {}
+
     @property
     def main_image_url(self) -> str:
         image = self.get_main_image()
@@ -216,10 +405,9 @@ class Property(TitleTimeBasedModel):
     @property
     def featured_status(self) -> bool:
         """Checks if the property has an active featured listing."""
-        return self.subscription_featured_listings.filter(
-            is_active=True,
-            end_date__gte=timezone.now(),
-        ).exists()
+        return self.is_featured and (
+            self.featured_until is None or self.featured_until > timezone.now()
+        )
 
     def is_favorited_by(self, user) -> bool:
         """
@@ -245,11 +433,20 @@ class PropertyImage(TimeBasedModel):
         related_name="images",
     )
     image = models.ImageField(upload_to=MediaHelper.get_image_upload_path)
+    # Resized WebP / AVIF copies, written by the rendition task after
+    # upload — see renditions.py.
+    renditions = models.JSONField(default=dict, blank=True, editable=False)
+    # SHA-256 of the uploaded bytes; lets a gallery edit recognise a
+    # re-submitted file without storing it again (gallery.py).
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
     order = models.PositiveSmallIntegerField(
         default=0,
         help_text="Lower numbers appear first in the gallery.",
     )
 
+    objects = PropertyImageManager()
+    tracker = FieldTracker(fields=["image"])
+
     class Meta(auto_prefetch.Model.Meta):
         ordering = ["order", "created_at"]
         verbose_name = "Property Image"
@@ -258,6 +455,195 @@ class PropertyImage(TimeBasedModel):
     def __str__(self) -> str:
         return f"Image for {self.property.title}"
 
+    def save(self, *args, **kwargs) -> None:
+        """Hashes a new upload before it is written to storage."""
+        if self.image and not self.image._committed:
+            self.content_hash = MediaHelper.content_hash(self.image)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "image" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
+
+
+class PropertySearchDocument(ListingDisplayMixin, auto_prefetch.Model):
+    """
+    Flattened read model for listing cards — one row per visible property.
+
+    Everything a card shows (cover URL, agent name/avatar, amenity ids,
+    featured flag, price per sqft) is copied here so listing pages read a
+    single table: no joins, prefetches or ``Exists`` subqueries beyond the
+    per-user ``is_favorited`` annotation.
+
+    Rows are maintained by ``core.applications.property.search_documents``
+    from Property, PropertyImage, FeaturedListing and AgentProfile signals;
+    ``manage.py rebuild_search_documents`` repairs any drift.
+    """
+
+    property = auto_prefetch.OneToOneField(
+        "property.Property",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    title = models.CharField(max_length=50, null=True, blank=True)
+    slug = models.SlugField(max_length=255)
+    location = models.CharField(max_length=255)
+    # Not shown on cards; copied for the ``search_mode=contains`` filter.
+    description = models.TextField(blank=True)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    property_type = models.CharField(
+        max_length=50,
+        choices=PropertyTypeChoices.choices,
+        null=True,
+        blank=True,
+    )
+    property_listing = models.CharField(
+        max_length=200,
+        choices=PropertyListingType.choices,
+    )
+    price = models.DecimalField(max_digits=20, decimal_places=2)
+    price_per_sqft = models.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        null=True,
+        blank=True,
+    )
+    bedrooms = models.PositiveIntegerField()
+    bathrooms = models.PositiveIntegerField()
+    sqft = models.PositiveIntegerField()
+    is_available = models.BooleanField(default=True)
+    is_featured = models.BooleanField(default=False)
+    # Storage-relative URLs; serializers make them absolute per request.
+    cover_image_url = models.CharField(max_length=500, blank=True)
+    # The cover's renditions with storage-relative URLs in place of names.
+    cover_renditions = models.JSONField(default=dict, blank=True)
+    agent_id = models.CharField(max_length=120, db_index=True)
+    agent_name = models.CharField(max_length=255, blank=True)
+    agent_avatar_url = models.CharField(max_length=500, blank=True)
+    amenity_ids = ArrayField(models.UUIDField(), default=list, blank=True)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    # Copied from Property so "newest first" sorts match the main table.
+    created_at = models.DateTimeField()
+    synced_at = models.DateTimeField(auto_now=True)
+
+    objects = PropertySearchDocumentManager()
+
+    class Meta(auto_prefetch.Model.Meta):
+        ordering = ["-created_at", "-pk"]
+        verbose_name = "Property Search Document"
+        verbose_name_plural = "Property Search Documents"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="propdoc_search_vector_gin"),
+            GinIndex(fields=["amenity_ids"], name="propdoc_amenity_ids_gin"),
+            GinIndex(
+                fields=["location"],
+                opclasses=["gin_trgm_ops"],
+                name="propdoc_location_trgm",
+            ),
+            models.Index(
+                fields=["property_listing", "-created_at", "-property"],
+                name="propdoc_listing_recent_idx",
+            ),
+            models.Index(
+                fields=["property_listing", "property_type", "price"],
+                name="propdoc_listing_type_price",
+            ),
+            models.Index(
+                fields=["latitude", "longitude"],
+                condition=models.Q(latitude__isnull=False),
+                name="propdoc_lat_lng_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Search document for {self.title}"
+
+
+class SimilarProperty(auto_prefetch.Model):
+    """
+    Precomputed "similar properties" for the detail page — the top
+    ``PROPERTY_SIMILAR_TOP_K`` neighbours of each listing, ranked by the
+    content similarity in ``core.applications.property.similarity``.
+
+    Refreshed per property by ``tasks.refresh_similar_properties`` after a
+    save and rebuilt nightly by ``tasks.rebuild_similar_properties``
+    (or ``manage.py rebuild_similar_properties``).
+    """
+
+    property = auto_prefetch.ForeignKey(
+        "property.Property",
+        on_delete=models.CASCADE,
+        related_name="similar_entries",
+    )
+    similar = auto_prefetch.ForeignKey(
+        "property.Property",
+        on_delete=models.CASCADE,
+        related_name="neighbour_of",
+    )
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta(auto_prefetch.Model.Meta):
+        ordering = ["property", "rank"]
+        verbose_name = "Similar Property"
+        verbose_name_plural = "Similar Properties"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["property", "similar"],
+                name="similar_property_unique_pair",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["property", "rank"], name="similar_property_rank_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.rank} for {self.property_id}: {self.similar_id}"
+
+
+class ListingCategoryCounter(auto_prefetch.Model):
+    """
+    Number of visible, available properties per (listing type, property type)
+    pair — at most a few dozen rows, summed per dimension by
+    ``category_counts()`` and the category grid context processor.
+
+    Adjusted in the same transaction as each Property create, delete or
+    visibility / availability / category change (see
+    ``core.applications.property.counters``);
+    ``manage.py rebuild_category_counters`` reconciles any drift.
+    """
+
+    property_listing = models.CharField(
+        max_length=200,
+        choices=PropertyListingType.choices,
+    )
+    # "" stands for properties with no property type.
+    property_type = models.CharField(
+        max_length=50,
+        choices=PropertyTypeChoices.choices,
+        blank=True,
+    )
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ListingCategoryCounterManager()
+
+    class Meta(auto_prefetch.Model.Meta):
+        ordering = ["property_listing", "property_type"]
+        verbose_name = "Listing Category Counter"
+        verbose_name_plural = "Listing Category Counters"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["property_listing", "property_type"],
+                name="listing_category_counter_pair",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.property_listing} / {self.property_type or '-'}: {self.count}"
+
 
 class FavoriteProperty(TimeBasedModel):
     """
@@ -316,6 +702,13 @@ class PropertySubscription(TimeBasedModel):
         unique_together = ("user", "location", "property_type")
         verbose_name = "Property Subscription"
         verbose_name_plural = "Property Subscriptions"
+        indexes = [
+            GinIndex(
+                fields=["location"],
+                opclasses=["gin_trgm_ops"],
+                name="prop_sub_location_trgm",
+            ),
+        ]
 
     def __str__(self) -> str:
         ptype = self.property_type or "any type"
@@ -365,12 +758,20 @@ class Lead(TimeBasedModel):
     )
 
     objects = LeadManager()
+    # Previous values for the AgentProfile counter handlers in signals.py.
+    tracker = FieldTracker(fields=["agent", "status"])
 
     class Meta(auto_prefetch.Model.Meta):
         unique_together = [("user", "property_link")]
         ordering = ["-created_at"]
         verbose_name = "Lead"
         verbose_name_plural = "Leads"
+        indexes = [
+            models.Index(
+                fields=["agent", "status", "-created_at"],
+                name="lead_agent_status_recent_idx",
+            ),
+        ]
 
     # ---- aliases & helpers -------------------------------------------------
 
@@ -464,6 +865,12 @@ class PropertyViewing(TimeBasedModel):
         ordering = ["-scheduled_time"]
         verbose_name = "Property Viewing"
         verbose_name_plural = "Property Viewings"
+        indexes = [
+            models.Index(
+                fields=["user", "-scheduled_time"],
+                name="viewing_user_scheduled_idx",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["property", "scheduled_time"],
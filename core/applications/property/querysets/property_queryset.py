@@ -1,18 +1,157 @@
 from __future__ import annotations
 
 import auto_prefetch
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.search import TrigramSimilarity
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.db.models import BooleanField
+from django.db.models import CharField
 from django.db.models import Count
 from django.db.models import Exists
+from django.db.models import ExpressionWrapper
+from django.db.models import F
 from django.db.models import OuterRef
 from django.db.models import Prefetch
 from django.db.models import Q
+from django.db.models import Sum
 from django.db.models import Value
+from django.db.models.functions import Greatest
 from django.db.models.functions import Now
 
 from core.applications.property import models as property_models
+from core.helpers.geo import bounding_box
+from core.helpers.geo import distance_km_expression
 from core.helpers.enums import PropertyViewingChoices
 
+# Text-search configuration shared by the stored vector and incoming queries —
+# both sides must stem identically or ranked matches silently disappear.
+SEARCH_CONFIG = "english"
+
+SEARCH_MODE_FTS = "fts"
+SEARCH_MODE_CONTAINS = "contains"
+
+LOCATION_MATCH_CONTAINS = "contains"
+LOCATION_MATCH_FUZZY = "fuzzy"
+
+AMENITY_MATCH_ANY = "any"
+AMENITY_MATCH_ALL = "all"
+
+LISTING_SOURCE_PROPERTY = "property"
+LISTING_SOURCE_DOCUMENT = "document"
+
+# Counter columns the agent dashboard table may sort on.
+ENGAGEMENT_ORDERINGS = frozenset({"lead_count", "viewing_count", "favorite_count"})
+
+
+def _location_threshold(threshold: float | None) -> float:
+    if threshold is None:
+        return settings.PROPERTY_LOCATION_SIMILARITY_THRESHOLD
+    return threshold
+
+
+def _featured_now() -> Q:
+    """An active boost: flagged, and open-ended or not yet past its end date."""
+    return Q(is_featured=True) & (Q(featured_until__isnull=True) | Q(featured_until__gt=Now()))
+
+
+def property_search_vector() -> SearchVector:
+    """
+    Weighted document for ``Property.search_vector``:
+    title (A) > location (B) > description (C).
+    Built fresh on each call — expressions must not be shared across queries.
+    """
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("location", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+# Model columns each card / detail serializer field reads (the primary key
+# is always loaded).  Used to narrow ``only()`` for ``?fields=`` / ``?omit=``.
+_LISTING_FIELD_COLUMNS = {
+    "title": ("title",),
+    "slug": ("slug",),
+    "location": ("location",),
+    "latitude": ("latitude",),
+    "longitude": ("longitude",),
+    "price": ("price",),
+    "price_display": ("price", "property_listing"),
+    "price_suffix": ("property_listing",),
+    "property_type": ("property_type",),
+    "property_type_display": ("property_type",),
+    "property_listing": ("property_listing",),
+    "listing_type_display": ("property_listing",),
+    "bedrooms": ("bedrooms",),
+    "bathrooms": ("bathrooms",),
+    "sqft": ("sqft",),
+    "is_available": ("is_available",),
+    "availability_label": ("is_available",),
+    "is_featured": ("is_featured",),
+    "created_at": ("created_at",),
+}
+PROPERTY_FIELD_COLUMNS = {
+    **_LISTING_FIELD_COLUMNS,
+    "description": ("description",),
+    "main_image_url": ("cover_image",),
+    "main_image_srcset": ("cover_image", "cover_renditions"),
+    "agent": ("agent",),
+    # The type-match fallback for similar listings reads these.
+    "similar_properties": ("property_listing", "property_type"),
+    "updated_at": ("updated_at",),
+}
+SEARCH_DOCUMENT_FIELD_COLUMNS = {
+    **_LISTING_FIELD_COLUMNS,
+    "price_per_sqft": ("price_per_sqft",),
+    "main_image_url": ("cover_image_url",),
+    "main_image_srcset": ("cover_renditions",),
+    "agent": ("agent_id", "agent_name", "agent_avatar_url"),
+}
+LEAD_FIELD_COLUMNS = {
+    "property": ("property_link",),
+    "user_email": ("user",),
+    "user_full_name": ("user",),
+    "message": ("message",),
+    "notes": ("notes",),
+    "status": ("status",),
+    "status_display": ("status",),
+    "last_contact": ("last_contact",),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+}
+VIEWING_FIELD_COLUMNS = {
+    "property_title": ("property__title",),
+    "property_slug": ("property__slug",),
+    "property_location": ("property__location",),
+    "scheduled_time": ("scheduled_time",),
+    "status": ("status",),
+    "status_display": ("status",),
+    "notes": ("notes",),
+    "cancellation_reason": ("cancellation_reason",),
+    "created_at": ("created_at",),
+}
+
+
+def only_fields(qs, fields, column_map: dict):
+    """
+    ``qs.only()`` the columns behind the serializer ``fields``, plus the
+    primary key and the current sort columns (keyset pagination reads
+    those back from each row).
+    """
+    model = qs.model
+    columns = {model._meta.pk.name}
+    for name in fields:
+        columns.update(column_map.get(name, ()))
+    concrete = {field.name for field in model._meta.concrete_fields}
+    for key in qs.query.order_by:
+        if isinstance(key, str) and key.lstrip("-") in concrete:
+            columns.add(key.lstrip("-"))
+    return qs.only(*columns)
+
 
 class PropertyImageQuerySet(auto_prefetch.QuerySet):
     """Used for image ordering and prefetch consistency."""
@@ -32,78 +171,21 @@ class AmenityQuerySet(auto_prefetch.QuerySet):
 
 
 
-class PropertyQuerySet(auto_prefetch.QuerySet):
+class ListingFilterMixin:
     """
-    Core Property queryset with composable filters, annotations, and prefetches.
+    Listing filters, search and ordering shared by ``PropertyQuerySet`` and
+    ``PropertySearchDocumentQuerySet`` — both tables use the same column
+    names for everything a listing page filters or sorts on.
     """
 
-    # -------------------------
-    # Base filters
-    # -------------------------
-
-    def visible(self) -> "PropertyQuerySet":
-        return self.filter(visible=True)
-
-    def available(self) -> "PropertyQuerySet":
-        return self.filter(is_available=True)
-
-    def featured_active(self):
-        """Filter properties that have an active featured listing."""
-        return self.filter(
-            property_featured_listings__is_active=True,
-            property_featured_listings__end_date__gte=Now(),
-        ).distinct()
-
-    def with_featured_annotation(self) -> "PropertyQuerySet":
-        """
-        Annotate each property with `is_featured_now` boolean
-        based on active featured listings.
-        """
-        from core.applications.subscriptions.models import FeaturedListing
-        subquery = FeaturedListing.objects.filter(
-            property=OuterRef("pk"),
-            is_active=True,
-            end_date__gte=Now(),
-        )
-        return self.annotate(is_featured_now=Exists(subquery))
-
-    # -------------------------
-    # Prefetch bundles
-    # -------------------------
-
-    def with_card_relations(self) -> "PropertyQuerySet":
-        """For property cards and listings - minimal related data for display."""
-        return (
-            self.select_related(
-                "agent",
-                "agent__user",
-            )
-            .prefetch_related(
-                Prefetch(
-                    "images",
-                    queryset=property_models.PropertyImage.objects.order_by(
-                        "order", "created_at"
-                    ),
-                ),
-                Prefetch(
-                    "amenities",
-                    queryset=property_models.Amenity.objects.alphabetical(),
-                ),
-                "property_featured_listings",
-            )
-        )
-
-    def with_detail_relations(self) -> "PropertyQuerySet":
-        return self.with_card_relations()
-
-    def with_lead_relations(self) -> "PropertyQuerySet":
-        return self.prefetch_related("leads", "leads__user")
+    # Columns scanned by ``search(mode="contains")``.
+    search_text_fields = ("title", "location", "description")
 
     # -------------------------
     # Annotations
     # -------------------------
 
-    def with_favorite_annotation(self, user=None) -> "PropertyQuerySet":
+    def with_favorite_annotation(self, user=None) -> "ListingFilterMixin":
         """Annotate each property with `is_favorited` boolean for the given user."""
         if user and user.is_authenticated:
             subquery = property_models.FavoriteProperty.objects.filter(
@@ -116,35 +198,43 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
             is_favorited=Value(False, output_field=BooleanField())
         )
 
-    def with_featured_annotation(self) -> "PropertyQuerySet":
-        """Annotate each property with `is_featured_now` boolean based on active featured listings."""
-        subquery = property_models.FeaturedListing.objects.filter(
-            property=OuterRef("pk"),
-            is_active=True,
-            end_date__gte=Now(),
-        )
-        return self.annotate(is_featured_now=Exists(subquery))
-
-    def with_listing_counts(self) -> "PropertyQuerySet":
-        return self.annotate(
-            lead_count=Count("leads", distinct=True),
-            viewing_count=Count("viewings", distinct=True),
-        )
-
     # -------------------------
     # Filters
     # -------------------------
 
-    def by_listing_type(self, listing_type: str) -> "PropertyQuerySet":
+    def by_listing_type(self, listing_type: str) -> "ListingFilterMixin":
         return self.filter(property_listing=listing_type)
 
-    def by_property_type(self, property_type: str) -> "PropertyQuerySet":
+    def by_property_type(self, property_type: str) -> "ListingFilterMixin":
         return self.filter(property_type=property_type)
 
-    def by_location(self, location: str) -> "PropertyQuerySet":
-        return self.filter(location__icontains=location)
+    def by_location(
+        self,
+        location: str,
+        fuzzy: bool = False,
+        threshold: float | None = None,
+    ) -> "ListingFilterMixin":
+        """
+        Substring match on ``location`` — served by the trigram GIN index.
+
+        With ``fuzzy=True`` listings whose location contains a word-level
+        near match (``word_similarity`` ≥ ``threshold``) are included too,
+        so "Lekki Phse 1" still finds "Lekki Phase 1, Lagos".  Both arms
+        are index-usable; ``location_similarity`` is annotated for ordering.
+        """
+        if not fuzzy:
+            return self.filter(location__icontains=location)
+        return self.annotate(
+            location_similarity=TrigramWordSimilarity(location, "location"),
+        ).filter(
+            Q(location__icontains=location)
+            | Q(
+                location__trigram_word_similar=location,
+                location_similarity__gte=_location_threshold(threshold),
+            )
+        )
 
-    def by_price_range(self, min_price=None, max_price=None) -> "PropertyQuerySet":
+    def by_price_range(self, min_price=None, max_price=None) -> "ListingFilterMixin":
         """
         Filter properties within a price range. Both min_price and max_price are optional.
         """
@@ -155,7 +245,7 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
             qs = qs.filter(price__lte=max_price)
         return qs
 
-    def by_bedrooms(self, min_bedrooms=None, max_bedrooms=None) -> "PropertyQuerySet":
+    def by_bedrooms(self, min_bedrooms=None, max_bedrooms=None) -> "ListingFilterMixin":
         """
         Filter properties by number of bedrooms. Both min_bedrooms and max_bedrooms are optional.
         """
@@ -166,31 +256,85 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
             qs = qs.filter(bedrooms__lte=max_bedrooms)
         return qs
 
-    def by_bathrooms(self, min_bathrooms=None) -> "PropertyQuerySet":
+    def by_bathrooms(self, min_bathrooms=None) -> "ListingFilterMixin":
         """
         Filter properties by number of bathrooms. The min_bathrooms parameter is optional.
         """
         return self.filter(bathrooms__gte=min_bathrooms) if min_bathrooms else self
 
-    def by_amenities(self, amenity_ids: list) -> "PropertyQuerySet":
+    def within_bbox(
+        self,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+    ) -> "ListingFilterMixin":
+        """Map-viewport filter — a range scan on the (latitude, longitude) index."""
+        return self.filter(
+            latitude__range=(min_lat, max_lat),
+            longitude__range=(min_lng, max_lng),
+        )
+
+    def with_distance(self, lat: float, lng: float) -> "ListingFilterMixin":
+        """Annotate ``distance_km`` (haversine) from the given point."""
+        return self.annotate(distance_km=distance_km_expression(lat, lng))
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> "ListingFilterMixin":
+        """
+        Listings within ``radius_km`` of the point, with ``distance_km``
+        annotated.  The bounding box narrows rows via the index before the
+        exact haversine check runs.
+        """
+        return (
+            self.within_bbox(*bounding_box(lat, lng, radius_km))
+            .with_distance(lat, lng)
+            .filter(distance_km__lte=radius_km)
+        )
+
+    def by_amenities(
+        self,
+        amenity_ids: list,
+        match: str = AMENITY_MATCH_ANY,
+    ) -> "ListingFilterMixin":
+        """
+        Filter on the ``amenity_ids`` array with a single GIN lookup —
+        ``match="all"`` uses containment (``@>``), ``"any"`` overlap (``&&``).
+        No M2M join, so no ``distinct()`` either.
+        """
         if not amenity_ids:
             return self
-        return self.filter(amenities__id__in=amenity_ids).distinct()
+        if match == AMENITY_MATCH_ALL:
+            return self.filter(amenity_ids__contains=amenity_ids)
+        return self.filter(amenity_ids__overlap=amenity_ids)
 
-    def search(self, term: str) -> "PropertyQuerySet":
+    def search(self, term: str, mode: str = SEARCH_MODE_FTS) -> "ListingFilterMixin":
         """
-        Search properties by title, location, or description. Case-insensitive partial match.
+        Search properties by title, location, or description.
+
+        ``mode="fts"`` (default) matches the GIN-indexed ``search_vector``
+        using websearch syntax (quoted phrases, ``-exclude``) and annotates
+        ``search_rank`` for ``order_by_relevance()``.
+        ``mode="contains"`` is the legacy case-insensitive partial match —
+        useful for prefixes ("Lek") that full-text stemming won't match.
         """
 
         if not term:
             return self
-        return self.filter(
-            Q(title__icontains=term)
-            | Q(location__icontains=term)
-            | Q(description__icontains=term)
+        if mode == SEARCH_MODE_CONTAINS:
+            q = Q()
+            for field in self.search_text_fields:
+                q |= Q(**{f"{field}__icontains": term})
+            return self.filter(q)
+        query = SearchQuery(term, search_type="websearch", config=SEARCH_CONFIG)
+        return self.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F("search_vector"), query),
         )
 
-    def safe_order(self, ordering: str) -> "PropertyQuerySet":
+    def order_by_relevance(self) -> "ListingFilterMixin":
+        """Rank-ordered results; requires ``search()`` in fts mode first."""
+        return self.order_by("-search_rank", "-created_at", "-pk")
+
+    def safe_order(self, ordering: str) -> "ListingFilterMixin":
         allowed = {
             "price", "-price",
             "created_at", "-created_at",
@@ -198,9 +342,133 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
             "sqft", "-sqft",
             "title", "-title",
         }
-        if ordering not in allowed:
+        if ordering in ("distance", "-distance"):
+            # Only meaningful once with_distance() / within_radius() ran.
+            if "distance_km" not in self.query.annotations:
+                return self
+            ordering = f"{ordering}_km"
+        elif ordering not in allowed:
             return self
-        return self.order_by(ordering)
+        # ``pk`` tie-breaker keeps the order total, which keyset pagination needs.
+        return self.order_by(ordering, "-pk" if ordering.startswith("-") else "pk")
+
+
+class PropertyQuerySet(ListingFilterMixin, auto_prefetch.QuerySet):
+    """
+    Core Property queryset with composable filters, annotations, and prefetches.
+    """
+
+    # -------------------------
+    # Base filters
+    # -------------------------
+
+    def visible(self) -> "PropertyQuerySet":
+        return self.filter(visible=True)
+
+    def available(self) -> "PropertyQuerySet":
+        return self.filter(is_available=True)
+
+    def featured_active(self) -> "PropertyQuerySet":
+        """
+        Properties with an active boost, read from the denormalised
+        ``is_featured`` / ``featured_until`` columns; the end-date check
+        covers boosts that lapsed since the last expiry sweep.
+        """
+        return self.filter(_featured_now())
+
+    # -------------------------
+    # Prefetch bundles
+    # -------------------------
+
+    def with_card_relations(self) -> "PropertyQuerySet":
+        """For property cards and listings - minimal related data for display."""
+        return (
+            self.select_related(
+                "agent",
+                "agent__user",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "images",
+                    queryset=property_models.PropertyImage.objects.order_by(
+                        "order", "created_at"
+                    ),
+                ),
+                Prefetch(
+                    "amenities",
+                    queryset=property_models.Amenity.objects.alphabetical(),
+                ),
+            )
+        )
+
+    def with_detail_relations(self) -> "PropertyQuerySet":
+        return self.with_card_relations()
+
+    def with_fields(self, fields) -> "PropertyQuerySet":
+        """
+        Relations and columns for just the requested card / detail
+        serializer ``fields`` (e.g. from ``?fields=`` / ``?omit=``): the
+        agent join, image and amenity prefetches are only added when a
+        field needs them, and every other column is deferred.
+        Call after ordering so sort columns stay loaded.
+        """
+        fields = set(fields)
+        qs = self
+        if "agent" in fields:
+            qs = qs.select_related("agent", "agent__user")
+        if fields & {"main_image_url", "main_image_srcset", "images"}:
+            qs = qs.prefetch_related(
+                Prefetch("images", queryset=property_models.PropertyImage.objects.ordered()),
+            )
+        if "amenities" in fields:
+            qs = qs.prefetch_related(
+                Prefetch("amenities", queryset=property_models.Amenity.objects.alphabetical()),
+            )
+        return only_fields(qs, fields, PROPERTY_FIELD_COLUMNS)
+
+    def with_lead_relations(self) -> "PropertyQuerySet":
+        return self.prefetch_related("leads", "leads__user")
+
+    # -------------------------
+    # Annotations
+    # -------------------------
+
+    def with_featured_annotation(self) -> "PropertyQuerySet":
+        """Annotate each property with an ``is_featured_now`` boolean (see ``featured_active()``)."""
+        return self.annotate(
+            is_featured_now=ExpressionWrapper(_featured_now(), output_field=BooleanField()),
+        )
+
+    def order_by_engagement(self, ordering: str) -> "PropertyQuerySet":
+        """
+        Agent dashboard ordering: ``lead_count`` / ``viewing_count`` /
+        ``favorite_count`` (optionally ``-``-prefixed) sort on the counter
+        columns, which the ``prop_agent_*_idx`` indexes cover within one
+        agent; anything else goes through ``safe_order()``.
+        """
+        if ordering.lstrip("-") not in ENGAGEMENT_ORDERINGS:
+            return self.safe_order(ordering)
+        return self.order_by(ordering, "-pk" if ordering.startswith("-") else "pk")
+
+    # -------------------------
+    # Filters
+    # -------------------------
+
+    def refresh_amenity_ids(self) -> int:
+        """Recompute ``amenity_ids`` from the M2M table for every row in the queryset."""
+        through = property_models.Property.amenities.through
+        return self.update(
+            amenity_ids=ArraySubquery(
+                through.objects.filter(property_id=OuterRef("pk"))
+                .order_by("amenity_id")
+                .values("amenity_id"),
+            ),
+            updated_at=Now(),
+        )
+
+    def refresh_search_vector(self) -> int:
+        """Recompute ``search_vector`` for every row in the queryset."""
+        return self.update(search_vector=property_search_vector())
 
     def similar_to(self, prop, limit: int = 4) -> "PropertyQuerySet":
         return (
@@ -213,10 +481,29 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
             .exclude(pk=prop.pk)[:limit]
         )
 
+    def precomputed_similar(self, prop, limit: int = 4) -> "PropertyQuerySet":
+        """
+        Neighbours stored in ``SimilarProperty`` for ``prop``, best first —
+        a single (property, rank) index range scan joined to Property.
+        """
+        return (
+            self.visible()
+            .available()
+            .filter(neighbour_of__property=prop)
+            .order_by("neighbour_of__rank")[:limit]
+        )
+
     def for_agent(self, agent) -> "PropertyQuerySet":
         return self.filter(agent=agent)
 
     def category_counts(self) -> dict[str, int]:
+        """
+        Visible, available properties per listing type.  The unfiltered
+        manager reads the ``ListingCategoryCounter`` rows; a filtered
+        queryset (e.g. ``for_agent()``) still counts live.
+        """
+        if not self.query.where:
+            return property_models.ListingCategoryCounter.objects.by_listing()
         qs = (
             self.visible()
             .available()
@@ -226,10 +513,46 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
         return {row["property_listing"]: row["count"] for row in qs}
 
     def featured_first(self) -> "PropertyQuerySet":
-        return (
-            self.with_featured_annotation()
-            .order_by("-is_featured_now", "-created_at")
-        )
+        """
+        Boosted listings first, newest first within each group — a plain
+        sort on ``is_featured``, which the expiry sweeper keeps current
+        (``prop_featured_first_idx`` / ``prop_listing_featured_idx``).
+        """
+        return self.order_by("-is_featured", "-created_at")
+
+
+# ---------------------------------------------------------------------------
+# SEARCH DOCUMENTS
+# ---------------------------------------------------------------------------
+
+class PropertySearchDocumentQuerySet(ListingFilterMixin, auto_prefetch.QuerySet):
+    """
+    Single-table listing reads.  Rows only exist for visible properties,
+    so there is no ``visible()`` step and nothing to join or prefetch.
+    """
+
+    def with_fields(self, fields) -> "PropertySearchDocumentQuerySet":
+        """Defer every column the requested serializer ``fields`` don't read."""
+        return only_fields(self, set(fields), SEARCH_DOCUMENT_FIELD_COLUMNS)
+
+
+# ---------------------------------------------------------------------------
+# CATEGORY COUNTERS
+# ---------------------------------------------------------------------------
+
+class ListingCategoryCounterQuerySet(auto_prefetch.QuerySet):
+
+    def _totals(self, dimension: str) -> dict[str, int]:
+        qs = self.order_by().values(dimension).annotate(total=Sum("count"))
+        return {row[dimension]: row["total"] for row in qs if row["total"]}
+
+    def by_listing(self) -> dict[str, int]:
+        """``{property_listing: count}`` — for the home page category cards."""
+        return self._totals("property_listing")
+
+    def by_property_type(self) -> dict[str, int]:
+        """``{property_type: count}`` — for the HTML category grid."""
+        return self._totals("property_type")
 
 
 # ---------------------------------------------------------------------------
@@ -238,34 +561,49 @@ class PropertyQuerySet(auto_prefetch.QuerySet):
 
 class LeadQuerySet(auto_prefetch.QuerySet):
 
-    def with_relations(self) -> "LeadQuerySet":
-        upcoming_qs = property_models.PropertyViewing.objects.filter(
-            status__in=[
-                PropertyViewingChoices.PENDING,
-                PropertyViewingChoices.CONFIRMED,
-            ],
-            scheduled_time__gte=Now(),
-        ).order_by("scheduled_time")
+    def with_relations(self, fields=None) -> "LeadQuerySet":
+        """
+        Relations for ``LeadSerializer``.  ``fields`` (serializer field
+        names, e.g. from ``?fields=``) limits the joins, prefetches and
+        loaded columns to what those fields read; None loads everything.
+        """
+        fields = None if fields is None else set(fields)
 
-        return (
-            self.select_related(
-                "user",
+        def wanted(*names):
+            return fields is None or bool(fields.intersection(names))
+
+        qs = self
+        if wanted("user_email", "user_full_name"):
+            qs = qs.select_related("user")
+        if wanted("property"):
+            qs = qs.select_related(
                 "property_link",
                 "property_link__agent",
                 "property_link__agent__user",
+            ).prefetch_related(
+                Prefetch(
+                    "property_link__images",
+                    queryset=property_models.PropertyImage.objects.ordered(),
+                ),
             )
-            .prefetch_related(
+        if wanted("upcoming_viewing"):
+            upcoming_qs = property_models.PropertyViewing.objects.filter(
+                status__in=[
+                    PropertyViewingChoices.PENDING,
+                    PropertyViewingChoices.CONFIRMED,
+                ],
+                scheduled_time__gte=Now(),
+            ).order_by("scheduled_time")
+            qs = qs.prefetch_related(
                 Prefetch(
                     "viewings",
                     queryset=upcoming_qs,
                     to_attr="upcoming_viewings_cache",
                 ),
-                Prefetch(
-                    "property_link__images",
-                    queryset=property_models.PropertyImage.objects.ordered(),
-                ),
             )
-        )
+        if fields is None:
+            return qs
+        return only_fields(qs, fields, LEAD_FIELD_COLUMNS)
 
     def for_agent(self, agent):
         return self.filter(agent=agent)
@@ -286,6 +624,18 @@ class LeadQuerySet(auto_prefetch.QuerySet):
 
 class PropertyViewingQuerySet(auto_prefetch.QuerySet):
 
+    def with_fields(self, fields) -> "PropertyViewingQuerySet":
+        """
+        Just what the requested ``ViewingSerializer`` fields read: the
+        property join (title / slug / location only) when one of its
+        fields is wanted, every other column deferred.
+        """
+        fields = set(fields)
+        qs = self
+        if fields & {"property_title", "property_slug", "property_location"}:
+            qs = qs.select_related("property")
+        return only_fields(qs, fields, VIEWING_FIELD_COLUMNS)
+
     def with_relations(self):
         return (
             self.select_related(
@@ -315,6 +665,9 @@ class PropertyViewingQuerySet(auto_prefetch.QuerySet):
     def for_user(self, user):
         return self.filter(user=user)
 
+    def for_agent(self, agent):
+        return self.filter(property__agent=agent)
+
     def for_property(self, property_pk):
         return self.filter(property_id=property_pk)
 
@@ -356,7 +709,6 @@ class FavoritePropertyQuerySet(auto_prefetch.QuerySet):
                     "property__amenities",
                     queryset=property_models.Amenity.objects.alphabetical(),
                 ),
-                "property__property_featured_listings",
             )
             .order_by("-created_at")
         )
@@ -371,13 +723,46 @@ class PropertySubscriptionQuerySet(auto_prefetch.QuerySet):
     def for_user(self, user):
         return self.filter(user=user)
 
-    def matching(self, location: str | None, property_type: str | None):
+    def matching(
+        self,
+        location: str | None,
+        property_type: str | None,
+        fuzzy: bool = False,
+        threshold: float | None = None,
+    ):
+        """
+        Alert subscriptions that cover a listing's location / type: the
+        subscribed location appears in the listing's (case-insensitive), or
+        is blank — a wildcard.  ``fuzzy=True`` also accepts subscriptions
+        trigram-similar (≥ ``threshold``) to the listing location or one of
+        its comma-separated parts, so "Lekki Phse 1" still matches
+        "Lekki Phase 1, Lagos"; those ``%`` comparisons use the trigram index.
+        """
+        qs = self
         q = Q()
 
         if location:
-            q &= Q(location__icontains=location) | Q(location__isnull=True)
+            qs = qs.annotate(listing_location=Value(location, output_field=CharField()))
+            location_q = (
+                Q(location__isnull=True)
+                | Q(location="")
+                | Q(listing_location__icontains=F("location"))
+            )
+            if fuzzy:
+                parts = {location, *(part.strip() for part in location.split(",") if part.strip())}
+                similarities = [TrigramSimilarity("location", part) for part in sorted(parts)]
+                qs = qs.annotate(
+                    location_similarity=(
+                        Greatest(*similarities) if len(similarities) > 1 else similarities[0]
+                    ),
+                )
+                similar_q = Q()
+                for part in parts:
+                    similar_q |= Q(location__trigram_similar=part)
+                location_q |= similar_q & Q(location_similarity__gte=_location_threshold(threshold))
+            q &= location_q
 
         if property_type:
             q &= Q(property_type=property_type) | Q(property_type__isnull=True)
 
-        return self.filter(q).select_related("user")
+        return qs.filter(q).select_related("user")
@@ -0,0 +1,190 @@
+"""
+Resized WebP / AVIF copies ("renditions") of listing photos.
+
+Uploads are stored untouched; a Celery task (tasks.py) then writes one
+file per size and format next to the original in the same storage —
+``…/photo.jpg`` → ``…/photo-card.webp``, ``…/photo-card.avif``, … — and
+records them on the row (``PropertyImage.renditions``,
+``Property.cover_renditions``) as::
+
+    {"card": {"width": 400, "webp": "<name>", "avif": "<name>"}, "gallery": {…}, "hero": {…}}
+
+Sizes never upscale: an original narrower than a size is written once at
+its own width and the larger sizes are skipped.
+
+AVIF is only written when the installed Pillow can encode it.  The pinned
+Pillow 11.1 (requirements/base.txt) has no AVIF encoder, so for now only
+WebP renditions are produced and the ``avif`` keys stay absent; an upgrade
+to a Pillow with AVIF support (11.2+) turns them on with no code change.
+
+Until a row's renditions land (or if the file can't be decoded) the map
+is empty and clients fall back to the original URL.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable
+from collections.abc import Iterable
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db.models.functions import Now
+from PIL import Image
+from PIL import ImageOps
+from PIL import UnidentifiedImageError
+
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+
+logger = logging.getLogger(__name__)
+
+# Smallest first; widths in pixels.
+RENDITION_SIZES = {
+    "card": 400,
+    "gallery": 1024,
+    "hero": 1920,
+}
+# Preferred format first — the order of the srcset keys clients iterate.
+# Formats the installed Pillow can't encode are skipped (available_formats()).
+_CODECS = {
+    "avif": ("AVIF", {"quality": 50}),
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+}
+_DECODE_ERRORS = (OSError, UnidentifiedImageError, Image.DecompressionBombError)
+
+
+def available_formats() -> tuple[str, ...]:
+    """Rendition formats the installed Pillow can encode."""
+    Image.init()
+    return tuple(fmt for fmt, (codec, _) in _CODECS.items() if codec in Image.SAVE)
+
+
+def _open(field_file) -> Image.Image:
+    with field_file.storage.open(field_file.name, "rb") as fh:
+        image = Image.open(fh)
+        largest = max(RENDITION_SIZES.values())
+        if image.width > largest:
+            # JPEG decodes straight at a reduced scale no smaller than needed.
+            image.draft("RGB", (largest, round(image.height * largest / image.width)))
+        image.load()
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def render(field_file) -> dict:
+    """Write the renditions of ``field_file`` to its storage; returns the map."""
+    image = _open(field_file)
+    formats = available_formats()
+    root = os.path.splitext(field_file.name)[0]
+    storage = field_file.storage
+
+    renditions = {}
+    for size, width in RENDITION_SIZES.items():
+        width = min(width, image.width)
+        if width == image.width:
+            resized = image
+        else:
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+        entry = {"width": width}
+        for fmt in formats:
+            codec, options = _CODECS[fmt]
+            buffer = BytesIO()
+            resized.save(buffer, codec, **options)
+            name = f"{root}-{size}.{fmt}"
+            # Regenerating replaces the previous file instead of adding a suffix.
+            storage.delete(name)
+            entry[fmt] = storage.save(name, ContentFile(buffer.getvalue()))
+        renditions[size] = entry
+
+        if width == image.width:
+            break
+    return renditions
+
+
+def srcset(renditions: dict, url: Callable[[str], str]) -> dict[str, str]:
+    """
+    ``{format: "<url> 400w, <url> 1024w, …"}`` for ``<img srcset>`` /
+    ``<source type=…>``, preferred format first.  ``url`` maps a stored
+    value to its URL.  jsonb doesn't keep key order, so entries are sorted
+    by width here.
+    """
+    entries = sorted(renditions.values(), key=lambda entry: entry["width"])
+    return {
+        fmt: ", ".join(f"{url(entry[fmt])} {entry['width']}w" for entry in entries if fmt in entry)
+        for fmt in _CODECS
+        if any(fmt in entry for entry in entries)
+    }
+
+
+def rendition_urls(renditions: dict, url: Callable[[str], str]) -> dict:
+    """``renditions`` with each stored name replaced by ``url(name)``."""
+    return {
+        size: {key: value if key == "width" else url(value) for key, value in entry.items()}
+        for size, entry in renditions.items()
+    }
+
+
+def _render_or_log(field_file, label) -> dict | None:
+    try:
+        return render(field_file)
+    except _DECODE_ERRORS as exc:
+        logger.warning("Could not render %s (%s): %s", label, field_file.name, exc)
+        return None
+
+
+def _discard(renditions: dict, storage) -> None:
+    for entry in renditions.values():
+        for key, name in entry.items():
+            if key != "width":
+                storage.delete(name)
+
+
+def render_images(image_ids: Iterable) -> set:
+    """
+    Render and record the renditions of the given gallery images.  A row
+    whose file was replaced while rendering keeps its (cleared) map; the
+    replacement queues its own run.  Returns the ids of the properties
+    whose galleries changed.
+    """
+    images = PropertyImage.objects.filter(pk__in=list(image_ids)).only("id", "property_id", "image")
+    property_ids = set()
+    for image in images.iterator():
+        if not image.image:
+            continue
+        renditions = _render_or_log(image.image, f"image {image.pk}")
+        if renditions is None:
+            continue
+        if PropertyImage.objects.filter(pk=image.pk, image=image.image.name).update(renditions=renditions):
+            property_ids.add(image.property_id)
+        else:
+            _discard(renditions, image.image.storage)
+
+    # Gallery changes bump the parent for the conditional-GET validators.
+    Property.objects.filter(pk__in=property_ids).update(updated_at=Now())
+    return property_ids
+
+
+def render_covers(property_ids: Iterable) -> set:
+    """Render and record ``Property.cover_renditions``; as ``render_images()``."""
+    properties = Property.objects.filter(pk__in=list(property_ids)).only("id", "cover_image")
+    updated = set()
+    for prop in properties.iterator():
+        if not prop.cover_image:
+            continue
+        renditions = _render_or_log(prop.cover_image, f"cover of {prop.pk}")
+        if renditions is None:
+            continue
+        rows = Property.objects.filter(pk=prop.pk, cover_image=prop.cover_image.name).update(
+            cover_renditions=renditions,
+            updated_at=Now(),
+        )
+        if rows:
+            updated.add(prop.pk)
+        else:
+            _discard(renditions, prop.cover_image.storage)
+    return updated
@@ -0,0 +1,158 @@
+"""
+django-import-export resource behind the Property admin's Import / Export
+buttons.
+
+Imports only create listings, and save them through the bulk importer
+(importer.py): rows are validated one at a time by import-export, then
+each batch of ``PROPERTY_IMPORT_CHUNK_SIZE`` goes through
+``insert_listings()`` — bulk slugs, bulk inserts and the batched counter /
+search-document / cache updates.  The columns match the importer's;
+``agent`` holds the agent's e-mail address.  Plan limits don't apply to
+staff imports.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
+from import_export import fields
+from import_export import resources
+from import_export import widgets
+
+from core.applications.property.importer import LIST_SEPARATOR
+from core.applications.property.importer import amenity_index
+from core.applications.property.importer import insert_listings
+from core.applications.property.importer import prepare_listing
+from core.applications.property.importer import resolve_amenities
+from core.applications.property.importer import schedule_similarity_rebuild
+from core.applications.property.importer import split_list_cells
+from core.applications.property.models import Amenity
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.users.models import AgentProfile
+
+
+class AgentEmailWidget(widgets.ForeignKeyWidget):
+    """Agent by user e-mail; each address is looked up once per import."""
+
+    def __init__(self):
+        super().__init__(AgentProfile, field="user__email")
+        self._agents: dict = {}
+
+    def clean(self, value, row=None, **kwargs):
+        if value not in self._agents:
+            try:
+                self._agents[value] = super().clean(value, row, **kwargs)
+            except ObjectDoesNotExist as exc:
+                msg = f"No agent with e-mail {value}."
+                raise ValueError(msg) from exc
+        return self._agents[value]
+
+
+class PropertyResource(resources.ModelResource):
+    agent = fields.Field(attribute="agent", column_name="agent", widget=AgentEmailWidget())
+    # Read in import_instance(); not model attributes.
+    amenities = fields.Field(column_name="amenities")
+    images = fields.Field(column_name="images")
+
+    class Meta:
+        model = Property
+        fields = (
+            "title",
+            "description",
+            "property_type",
+            "property_listing",
+            "price",
+            "location",
+            "latitude",
+            "longitude",
+            "bedrooms",
+            "bathrooms",
+            "sqft",
+            "cover_image",
+            "is_available",
+            "agent",
+            "amenities",
+            "images",
+        )
+        use_bulk = True
+        batch_size = settings.PROPERTY_IMPORT_CHUNK_SIZE
+        # Create-only: no per-row lookup of an existing instance.
+        force_init_instance = True
+        skip_diff = True
+        clean_model_instances = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._amenities: dict | None = None
+        self._created = 0
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related("agent__user")
+            .prefetch_related(
+                Prefetch("amenities", queryset=Amenity.objects.alphabetical()),
+                Prefetch("images", queryset=PropertyImage.objects.ordered()),
+            )
+        )
+
+    # ---- export ------------------------------------------------------------
+
+    def dehydrate_amenities(self, prop: Property) -> str:
+        return LIST_SEPARATOR.join(amenity.name for amenity in prop.amenities.all())
+
+    def dehydrate_images(self, prop: Property) -> str:
+        return LIST_SEPARATOR.join(image.image.name for image in prop.images.all())
+
+    # ---- import ------------------------------------------------------------
+
+    def import_instance(self, instance, row, **kwargs):
+        errors = {}
+        try:
+            super().import_instance(instance, row, **kwargs)
+        except ValidationError as exc:
+            errors = exc.update_error_dict(errors)
+
+        if self._amenities is None:
+            self._amenities = amenity_index()
+        extras = split_list_cells(
+            {column: str(row.get(column) or "") for column in ("amenities", "images")},
+        )
+        amenity_ids = []
+        try:
+            amenity_ids = resolve_amenities(extras["amenities"], self._amenities)
+        except ValidationError as exc:
+            errors = exc.update_error_dict(errors)
+        # Picked up by bulk_create().
+        instance._import_extras = (amenity_ids, extras["images"])
+
+        if errors:
+            raise ValidationError(errors)
+
+    def validate_instance(self, instance, import_validation_errors=None, validate_unique=True):
+        # Slugs are allocated at insert time; no other column is unique.
+        super().validate_instance(instance, import_validation_errors, validate_unique=False)
+
+    def bulk_create(self, using_transactions, dry_run, raise_errors, batch_size=None, result=None):
+        try:
+            if self.create_instances and (using_transactions or not dry_run):
+                insert_listings(
+                    [
+                        prepare_listing(instance, *instance._import_extras)
+                        for instance in self.create_instances
+                    ],
+                )
+                self._created += len(self.create_instances)
+        except Exception as e:
+            self.handle_import_error(result, e, raise_errors)
+        finally:
+            self.create_instances.clear()
+
+    def after_import(self, dataset, result, **kwargs):
+        super().after_import(dataset, result, **kwargs)
+        if self._created and not self._is_dry_run(kwargs):
+            schedule_similarity_rebuild()
@@ -0,0 +1,175 @@
+"""
+Keeps ``PropertySearchDocument`` in step with the normalised tables.
+
+Signal handlers call ``schedule_document_sync()``, which defers the work
+to ``transaction.on_commit`` so the document is built from committed data
+(including the search vector refreshed by the Property post_save handler).
+Syncing is idempotent — a property is rebuilt from scratch each time, and
+its document is dropped once it stops being visible.
+
+Every sync also swaps the listing version token (``listing_version()``),
+which the listing API's conditional-GET validator is built from: any
+change a card can show reaches a sync, so an unchanged token means every
+filtered listing is unchanged too.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.models import PropertySearchDocument
+from core.applications.property.renditions import rendition_urls
+
+# Every column rewritten on sync (all but the primary key and synced_at,
+# which auto_now refreshes).
+_SYNCED_FIELDS = [
+    "title",
+    "slug",
+    "location",
+    "description",
+    "latitude",
+    "longitude",
+    "property_type",
+    "property_listing",
+    "price",
+    "price_per_sqft",
+    "bedrooms",
+    "bathrooms",
+    "sqft",
+    "is_available",
+    "is_featured",
+    "cover_image_url",
+    "cover_renditions",
+    "agent_id",
+    "agent_name",
+    "agent_avatar_url",
+    "amenity_ids",
+    "search_vector",
+    "created_at",
+    "synced_at",
+]
+
+_CENT = Decimal("0.01")
+
+LISTING_VERSION_KEY = "property-listing:version"
+
+
+def listing_version() -> int:
+    """Token (``time.time_ns()`` of the last change) for the public listing."""
+    version = cache.get(LISTING_VERSION_KEY)
+    if version is None:
+        cache.add(LISTING_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(LISTING_VERSION_KEY)
+    return version
+
+
+def bump_listing_version() -> None:
+    cache.set(LISTING_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _source_queryset(property_ids: Iterable):
+    return (
+        Property.objects.visible()
+        .filter(pk__in=property_ids)
+        .select_related("agent", "agent__user")
+        .prefetch_related(
+            Prefetch("images", queryset=PropertyImage.objects.ordered()),
+        )
+    )
+
+
+def build_document(prop: Property) -> PropertySearchDocument:
+    """Flatten one property (with card relations loaded) into a document."""
+    agent = prop.agent
+    cover = prop.get_main_image()
+    price_per_sqft = (prop.price / prop.sqft).quantize(_CENT) if prop.sqft else None
+
+    return PropertySearchDocument(
+        property=prop,
+        title=prop.title,
+        slug=prop.slug,
+        location=prop.location,
+        description=prop.description,
+        latitude=prop.latitude,
+        longitude=prop.longitude,
+        property_type=prop.property_type,
+        property_listing=prop.property_listing,
+        price=prop.price,
+        price_per_sqft=price_per_sqft,
+        bedrooms=prop.bedrooms,
+        bathrooms=prop.bathrooms,
+        sqft=prop.sqft,
+        is_available=prop.is_available,
+        is_featured=prop.is_featured,
+        cover_image_url=cover.url if cover else "",
+        cover_renditions=(
+            rendition_urls(prop.get_main_image_renditions(), cover.storage.url) if cover else {}
+        ),
+        agent_id=agent.pk,
+        agent_name=agent.user.get_full_name(),
+        agent_avatar_url=agent.profile_picture.url if agent.profile_picture else "",
+        amenity_ids=list(prop.amenity_ids),
+        search_vector=prop.search_vector,
+        created_at=prop.created_at,
+    )
+
+
+def sync_documents(property_ids: Iterable) -> int:
+    """
+    Upsert documents for the visible properties in ``property_ids`` and
+    delete those for properties that are hidden or gone.
+    Returns the number of documents written.
+    """
+    property_ids = set(property_ids)
+    if not property_ids:
+        return 0
+
+    documents = [build_document(prop) for prop in _source_queryset(property_ids)]
+    live_ids = {doc.property_id for doc in documents}
+
+    with transaction.atomic():
+        PropertySearchDocument.objects.filter(
+            property_id__in=property_ids - live_ids,
+        ).delete()
+        PropertySearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=["property"],
+            update_fields=_SYNCED_FIELDS,
+        )
+    bump_listing_version()
+    return len(documents)
+
+
+def schedule_document_sync(property_ids: Iterable) -> None:
+    """Sync ``property_ids`` once the current transaction commits."""
+    property_ids = set(property_ids)
+    if property_ids:
+        transaction.on_commit(lambda: sync_documents(property_ids))
+
+
+def rebuild_documents(*, batch_size: int = 500) -> int:
+    """
+    Rebuild every document from scratch in batches and drop orphans.
+    Returns the number of documents written.
+    """
+    PropertySearchDocument.objects.exclude(property__visible=True).delete()
+
+    written = 0
+    ids = Property.objects.visible().order_by("pk").values_list("pk", flat=True)
+    batch: list = []
+    for pk in ids.iterator(chunk_size=batch_size):
+        batch.append(pk)
+        if len(batch) >= batch_size:
+            written += sync_documents(batch)
+            batch = []
+    written += sync_documents(batch)
+    return written
@@ -1,24 +1,55 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import math
+from datetime import UTC
+from datetime import datetime
 from typing import Any
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Avg
+from django.db.models import Count
+from django.db.models import Max
+from django.db.models import Min
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models.functions import Substr
 from django.utils import timezone
 from rest_framework.exceptions import NotFound
 from rest_framework.exceptions import PermissionDenied
 
+from core.applications.property import gallery
+from core.applications.property.counters import is_closed_deal
+from core.applications.property.counters import move_lead
 from core.applications.property.models import Amenity
 from core.applications.property.models import FavoriteProperty
 from core.applications.property.models import Lead
 from core.applications.property.models import Property
-from core.applications.property.models import PropertyImage
+from core.applications.property.models import PropertySearchDocument
 from core.applications.property.models import PropertySubscription
 from core.applications.property.models import PropertyViewing
+from core.applications.property.models import SimilarProperty
+from core.applications.property.querysets.property_queryset import AMENITY_MATCH_ANY
+from core.applications.property.querysets.property_queryset import LISTING_SOURCE_DOCUMENT
+from core.applications.property.querysets.property_queryset import LISTING_SOURCE_PROPERTY
+from core.applications.property.querysets.property_queryset import LOCATION_MATCH_CONTAINS
+from core.applications.property.querysets.property_queryset import LOCATION_MATCH_FUZZY
+from core.applications.property.querysets.property_queryset import SEARCH_MODE_CONTAINS
+from core.applications.property.querysets.property_queryset import SEARCH_MODE_FTS
+from core.applications.property.search_documents import listing_version
 from core.applications.subscriptions.features import check_limit
 from core.helpers.enums import PropertyListingType
+from core.helpers.enums import PropertyTypeChoices
 from core.helpers.enums import PropertyViewingChoices
 from core.helpers.enums import SubscriptionPlan
+from core.helpers.geo import geohash_bounds
+from core.helpers.geo import geohash_cell_size
+from core.helpers.geo import geohash_cells
 
 User = get_user_model()
 
@@ -78,6 +109,18 @@ _PRICE_RANGE_OPTIONS: dict[str, list[dict]] = {
 }
 
 
+# Filter-sidebar buckets.  Bedrooms are exact counts with a final "N+"
+# bucket; bathroom buckets are "at least N", matching ?min_bathrooms=.
+_BEDROOM_FACETS: list[tuple[int, str]] = [(1, "1"), (2, "2"), (3, "3"), (4, "4"), (5, "5+")]
+_BATHROOM_FACETS: list[int] = [1, 2, 3, 4]
+
+# Map clustering: (max zoom, geohash precision) — a precision-p cell is
+# roughly one to two map tiles wide at these zoom levels.
+_CLUSTER_ZOOM_PRECISION: list[tuple[int, int]] = [
+    (2, 1), (5, 2), (8, 3), (10, 4), (13, 5), (15, 6), (99, 7),
+]
+_CLUSTER_MAX_CELLS = 256
+
 
 def get_home_page_data(*, user=None) -> dict[str, Any]:
     """
@@ -128,46 +171,40 @@ def get_home_page_data(*, user=None) -> dict[str, Any]:
         "search_config":       search_config,
     }
 
-def get_property_list(
+def _apply_property_filters(
+    qs,
     *,
-    user=None,
     listing_type: str | None = None,
     property_type: str | None = None,
     location: str | None = None,
+    location_match: str = LOCATION_MATCH_FUZZY,
     min_price: float | None = None,
     max_price: float | None = None,
     min_bedrooms: int | None = None,
     max_bedrooms: int | None = None,
     min_bathrooms: int | None = None,
     amenity_ids: list | None = None,
+    amenity_match: str = AMENITY_MATCH_ANY,
     is_available: bool | None = None,
     search: str | None = None,
-    ordering: str = "-created_at",
+    search_mode: str = SEARCH_MODE_FTS,
+    lat: float | None = None,
+    lng: float | None = None,
+    radius_km: float | None = None,
+    bbox: tuple[float, float, float, float] | None = None,
 ):
     """
-    Returns an unevaluated QuerySet for the property listing page.
-
-    All filter parameters are optional — omitting them returns the full
-    visible set.  The view paginates before evaluation so the database
-    only fetches the current page of rows.
-
-    ``ordering`` is validated against a whitelist inside
-    ``PropertyQuerySet.safe_order()`` — arbitrary field names from
-    query params cannot leak through.
+    Applies the listing-page filter set to any ``ListingFilterMixin``
+    queryset.  Shared by ``get_property_list()`` and
+    ``get_property_facets()`` so the sidebar counts always describe the
+    same rows as the grid.
     """
-    qs = (
-        Property.objects
-        .visible()
-        .with_card_relations()
-        .with_favorite_annotation(user=user)
-    )
-
     if listing_type:
         qs = qs.by_listing_type(listing_type)
     if property_type:
         qs = qs.by_property_type(property_type)
     if location:
-        qs = qs.by_location(location)
+        qs = qs.by_location(location, fuzzy=location_match != LOCATION_MATCH_CONTAINS)
     if min_price is not None or max_price is not None:
         qs = qs.by_price_range(min_price=min_price, max_price=max_price)
     if min_bedrooms is not None or max_bedrooms is not None:
@@ -175,49 +212,407 @@ def get_property_list(
     if min_bathrooms is not None:
         qs = qs.by_bathrooms(min_bathrooms=min_bathrooms)
     if amenity_ids:
-        qs = qs.by_amenities(amenity_ids)
+        qs = qs.by_amenities(amenity_ids, match=amenity_match)
     if is_available is not None:
         qs = qs.filter(is_available=is_available)
     if search:
-        qs = qs.search(search)
+        qs = qs.search(search, mode=search_mode)
+    if bbox:
+        qs = qs.within_bbox(*bbox)
+    if lat is not None and lng is not None:
+        if radius_km:
+            qs = qs.within_radius(lat, lng, radius_km)
+        else:
+            qs = qs.with_distance(lat, lng)
+    return qs
+
+
+def get_property_list(
+    *,
+    user=None,
+    ordering: str | None = None,
+    source: str = LISTING_SOURCE_PROPERTY,
+    fields: set[str] | None = None,
+    **filters,
+):
+    """
+    Returns an unevaluated QuerySet for the property listing page.
+
+    All filter parameters are optional — omitting them returns the full
+    visible set.  The view paginates before evaluation so the database
+    only fetches the current page of rows.  See ``_apply_property_filters``
+    for the accepted filter keywords.
+
+    ``location`` tolerates misspellings via trigram similarity unless
+    ``location_match="contains"`` asks for a plain substring match.
+
+    ``amenity_ids`` matches listings with any of the amenities;
+    ``amenity_match="all"`` requires every one of them.
+
+    ``search`` uses the full-text index by default (``search_mode="fts"``);
+    when no explicit ``ordering`` is given, those results come back
+    relevance-ranked.  ``search_mode="contains"`` keeps partial matching.
+
+    ``bbox`` = ``(min_lat, min_lng, max_lat, max_lng)`` limits results to a
+    map viewport.  ``lat`` / ``lng`` annotate ``distance_km`` (and with
+    ``radius_km`` keep only listings inside that circle); without another
+    ordering such results come back nearest first, and
+    ``ordering="distance"`` asks for that explicitly.
+
+    ``ordering`` is validated against a whitelist inside
+    ``PropertyQuerySet.safe_order()`` — arbitrary field names from
+    query params cannot leak through.
+
+    ``source="document"`` reads the flattened ``PropertySearchDocument``
+    table instead — same filters, no joins or prefetches.  Serialize those
+    rows with ``PropertySearchDocumentSerializer``.
+
+    ``fields`` (serializer field names from ``?fields=`` / ``?omit=``)
+    loads only the relations and columns those fields read; None loads
+    the full card.
+    """
+    if source == LISTING_SOURCE_DOCUMENT:
+        # description is only searched (search_mode="contains"), never shown.
+        qs = PropertySearchDocument.objects.defer("description")
+    else:
+        qs = Property.objects.visible()
+        if fields is None:
+            qs = qs.with_card_relations()
+    if fields is None or "is_favorited" in fields:
+        qs = qs.with_favorite_annotation(user=user)
+    qs = _apply_property_filters(qs, **filters)
+
+    search_mode = filters.get("search_mode", SEARCH_MODE_FTS)
+    if filters.get("search") and not ordering and search_mode != SEARCH_MODE_CONTAINS:
+        qs = qs.order_by_relevance()
+    else:
+        if not ordering and filters.get("lat") is not None and filters.get("lng") is not None:
+            ordering = "distance"
+        qs = qs.safe_order(ordering or "-created_at")
+
+    return qs if fields is None else qs.with_fields(fields)
+
+
+def _filter_digest(filters: dict) -> str:
+    """
+    Normalises the filter set (drops empty values, trims / lower-cases
+    strings, sorts amenity ids) so equivalent requests share a cache entry.
+    """
+    normalized = {}
+    for name, value in filters.items():
+        if value is None or value == "" or value == []:
+            continue
+        if name == "amenity_ids":
+            normalized[name] = sorted(str(v).strip().lower() for v in value)
+        elif isinstance(value, (list, tuple)):
+            normalized[name] = [str(v) for v in value]
+        else:
+            normalized[name] = str(value).strip().lower()
+    raw = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def get_property_facets(**filters) -> dict[str, Any]:
+    """
+    Filter-sidebar counts for the current filter set: listing type,
+    property type, bedrooms, bathroom buckets, amenities and the
+    per-listing-type price bands from ``_PRICE_RANGE_OPTIONS``.
+
+    Every count comes from one aggregate query using
+    ``COUNT(*) FILTER (WHERE …)`` over the filtered ids; the result is
+    cached per normalised filter key for ``PROPERTY_FACETS_CACHE_TIMEOUT``
+    seconds.  Accepts the same keywords as ``get_property_list()``.
+    """
+    key = f"property-facets:{_filter_digest(filters)}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    matching = _apply_property_filters(Property.objects.visible(), **filters)
+    qs = Property.objects.filter(pk__in=matching.values("pk"))
+    amenities = list(Amenity.objects.alphabetical().values("id", "name"))
+
+    listing_types = list(PropertyListingType.choices)
+    property_types = list(PropertyTypeChoices.choices)
+    price_bands = [
+        (listing_type, band)
+        for listing_type, bands in _PRICE_RANGE_OPTIONS.items()
+        for band in bands
+        if band["price_min"] is not None or band["price_max"] is not None
+    ]
+
+    def count(condition: Q) -> Count:
+        return Count("pk", filter=condition)
+
+    aggregates: dict[str, Count] = {"total": Count("pk")}
+    for i, (value, _) in enumerate(listing_types):
+        aggregates[f"listing_{i}"] = count(Q(property_listing=value))
+    for i, (value, _) in enumerate(property_types):
+        aggregates[f"type_{i}"] = count(Q(property_type=value))
+    for i, (value, _) in enumerate(_BEDROOM_FACETS):
+        aggregates[f"bedrooms_{i}"] = count(
+            Q(bedrooms__gte=value) if value == _BEDROOM_FACETS[-1][0] else Q(bedrooms=value)
+        )
+    for i, value in enumerate(_BATHROOM_FACETS):
+        aggregates[f"bathrooms_{i}"] = count(Q(bathrooms__gte=value))
+    for i, amenity in enumerate(amenities):
+        aggregates[f"amenity_{i}"] = count(Q(amenity_ids__contains=[amenity["id"]]))
+    for i, (listing_type, band) in enumerate(price_bands):
+        condition = Q(property_listing=listing_type)
+        if band["price_min"] is not None:
+            condition &= Q(price__gte=band["price_min"])
+        if band["price_max"] is not None:
+            condition &= Q(price__lte=band["price_max"])
+        aggregates[f"price_{i}"] = count(condition)
+
+    counts = qs.aggregate(**aggregates)
+
+    price_ranges: dict[str, list[dict]] = {lt: [] for lt in _PRICE_RANGE_OPTIONS}
+    for i, (listing_type, band) in enumerate(price_bands):
+        price_ranges[listing_type].append({**band, "count": counts[f"price_{i}"]})
+
+    facets = {
+        "total": counts["total"],
+        "listing_types": [
+            {"value": value, "label": label, "count": counts[f"listing_{i}"]}
+            for i, (value, label) in enumerate(listing_types)
+        ],
+        "property_types": [
+            {"value": value, "label": label, "count": counts[f"type_{i}"]}
+            for i, (value, label) in enumerate(property_types)
+        ],
+        "bedrooms": [
+            {"value": value, "label": label, "count": counts[f"bedrooms_{i}"]}
+            for i, (value, label) in enumerate(_BEDROOM_FACETS)
+        ],
+        "bathrooms": [
+            {"value": value, "label": f"{value}+", "count": counts[f"bathrooms_{i}"]}
+            for i, value in enumerate(_BATHROOM_FACETS)
+        ],
+        "amenities": [
+            {"value": str(amenity["id"]), "label": amenity["name"], "count": counts[f"amenity_{i}"]}
+            for i, amenity in enumerate(amenities)
+        ],
+        "price_ranges": price_ranges,
+    }
+    cache.set(key, facets, settings.PROPERTY_FACETS_CACHE_TIMEOUT)
+    return facets
+
+
+def _cluster_precision(zoom: int, bbox: tuple[float, float, float, float]) -> int:
+    """
+    Geohash precision for a map zoom level, lowered until the viewport is
+    covered by at most ``_CLUSTER_MAX_CELLS`` cells.
+    """
+    precision = next(p for max_zoom, p in _CLUSTER_ZOOM_PRECISION if zoom <= max_zoom)
+    min_lat, min_lng, max_lat, max_lng = bbox
+    while precision > 1:
+        height, width = geohash_cell_size(precision)
+        cells = math.ceil((max_lat - min_lat) / height + 1) * math.ceil((max_lng - min_lng) / width + 1)
+        if cells <= _CLUSTER_MAX_CELLS:
+            break
+        precision -= 1
+    return precision
+
 
-    return qs.safe_order(ordering)
+def get_property_clusters(
+    *,
+    bbox: tuple[float, float, float, float],
+    zoom: int,
+    **filters,
+) -> list[dict[str, Any]]:
+    """
+    Map clusters for a viewport: one entry per non-empty geohash cell with
+    its listing count, price range and centroid.
+
+    ``zoom`` picks the cell size.  Cells are aggregated from the indexed
+    ``Property.geohash`` prefix in a single GROUP BY query and cached per
+    (cell, filter set) for ``PROPERTY_CLUSTER_CACHE_TIMEOUT`` seconds, so
+    panning only queries the newly exposed cells.  Accepts the same filter
+    keywords as ``get_property_list()``; the viewport itself is not part
+    of the filter key — whole cells are counted even where they overhang it.
+    """
+    precision = _cluster_precision(zoom, bbox)
+    cells = geohash_cells(*bbox, precision)
+    digest = _filter_digest(filters)
+    keys = {cell: f"property-clusters:{digest}:{cell}" for cell in cells}
+
+    cached = cache.get_many(keys.values())
+    missing = [cell for cell, key in keys.items() if key not in cached]
+
+    if missing:
+        matching = _apply_property_filters(Property.objects.visible(), **filters)
+        in_cells = Q()
+        for cell in missing:
+            in_cells |= Q(geohash__startswith=cell)
+        rows = (
+            # visible / non-empty geohash repeat the partial index predicate.
+            Property.objects.visible()
+            .exclude(geohash="")
+            .filter(in_cells, pk__in=matching.values("pk"))
+            .annotate(cell=Substr("geohash", 1, precision))
+            .values("cell")
+            .annotate(
+                count=Count("pk"),
+                min_price=Min("price"),
+                max_price=Max("price"),
+                latitude=Avg("latitude"),
+                longitude=Avg("longitude"),
+            )
+            .order_by()
+        )
+        # Empty cells are cached too, as {} — some backends drop None on get_many.
+        fresh: dict[str, dict] = {cell: {} for cell in missing}
+        for row in rows:
+            cell = row.pop("cell")
+            min_lat, min_lng, max_lat, max_lng = geohash_bounds(cell)
+            fresh[cell] = {
+                "geohash": cell,
+                **row,
+                "latitude": float(row["latitude"]),
+                "longitude": float(row["longitude"]),
+                "bounds": [min_lng, min_lat, max_lng, max_lat],
+            }
+        cache.set_many(
+            {keys[cell]: value for cell, value in fresh.items()},
+            settings.PROPERTY_CLUSTER_CACHE_TIMEOUT,
+        )
+        cached.update({keys[cell]: value for cell, value in fresh.items()})
 
+    return [cached[keys[cell]] for cell in cells if cached.get(keys[cell])]
 
 
 def get_property_detail(
-    *, slug: str, user=None
+    *, slug: str, user=None, fields: set[str] | None = None
 ) -> tuple[Property, list[Property]]:
     """
     Returns ``(property, similar_properties)``.
 
-    Similar properties share the same listing type and property type,
-    capped at 4.  They are fetched in a second evaluated query (list)
-    so the main detail query is not complicated by slicing constraints.
+    Similar properties are the 4 best precomputed neighbours (see
+    ``similarity.py``), read in a second evaluated query (list) so the main
+    detail query is not complicated by slicing constraints.  Listings not
+    yet scored fall back to the same listing / property type match.
+
+    ``fields`` narrows the detail query as in ``get_property_list``; the
+    similar-properties queries are skipped when that field isn't wanted.
 
     Raises ``NotFound`` when no visible property matches the slug.
     """
+    qs = Property.objects.visible()
+    if fields is None:
+        qs = qs.with_detail_relations()
+    else:
+        qs = qs.with_fields(fields)
+    if fields is None or "is_favorited" in fields:
+        qs = qs.with_favorite_annotation(user=user)
     try:
-        prop = (
-            Property.objects
-            .visible()
-            .with_detail_relations()
-            .with_favorite_annotation(user=user)
-            .get(slug=slug)
-        )
+        prop = qs.get(slug=slug)
     except Property.DoesNotExist:
         raise NotFound("Property not found.")
 
-    similar = list(
-        Property.objects
-        .with_card_relations()
-        .with_favorite_annotation(user=user)
-        .similar_to(prop, limit=4)
-    )
+    if fields is not None and "similar_properties" not in fields:
+        return prop, []
+
+    candidates = Property.objects.with_card_relations().with_favorite_annotation(user=user)
+    similar = list(candidates.precomputed_similar(prop, limit=4))
+    if not similar:
+        similar = list(candidates.similar_to(prop, limit=4))
 
     return prop, similar
 
 
+# ---------------------------------------------------------------------------
+# Conditional GET validators
+# ---------------------------------------------------------------------------
+#
+# Image, amenity and featured-listing changes bump ``Property.updated_at``,
+# and agent (User) renames bump ``AgentProfile.updated_at`` (see signals.py),
+# so the property and agent timestamps cover everything the detail page
+# shows.  Listings use the listing version token instead.  Favourite flags
+# are per user, so signed-in requests fold the user's favourites into the
+# ETag and get no Last-Modified (an un-favourite would not move it forward).
+
+
+def _validator(parts: tuple, timestamps, *, user=None) -> tuple[str, Any]:
+    if user and user.is_authenticated:
+        favorites = FavoriteProperty.objects.filter(user=user).aggregate(
+            count=Count("pk"),
+            last=Max("created_at"),
+        )
+        parts = (*parts, user.pk, favorites["count"], favorites["last"])
+        last_modified = None
+    else:
+        last_modified = max((ts for ts in timestamps if ts), default=None)
+    etag = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return etag, last_modified
+
+
+def get_property_detail_validator(*, slug: str, user=None) -> tuple[str, Any] | None:
+    """
+    ``(etag, last_modified)`` for the detail endpoint, read in one query
+    (plus one for signed-in users).  Covers the property row, its agent,
+    the active-boost flag and the precomputed similar listings.
+
+    Returns None when no visible property matches, so the caller falls
+    through to the normal 404.
+    """
+    neighbours = (
+        SimilarProperty.objects.filter(property=OuterRef("pk"))
+        .order_by()
+        .values("property")
+    )
+    row = (
+        Property.objects.visible()
+        .filter(slug=slug)
+        .with_featured_annotation()
+        .annotate(
+            neighbours_computed_at=Subquery(
+                neighbours.annotate(last=Max("computed_at")).values("last"),
+            ),
+            neighbours_updated_at=Subquery(
+                neighbours.annotate(last=Max("similar__updated_at")).values("last"),
+            ),
+        )
+        .values(
+            "pk",
+            "updated_at",
+            "agent__updated_at",
+            "is_featured_now",
+            "neighbours_computed_at",
+            "neighbours_updated_at",
+        )
+        .first()
+    )
+    if row is None:
+        return None
+    return _validator(
+        tuple(row.values()),
+        (
+            row["updated_at"],
+            row["agent__updated_at"],
+            row["neighbours_computed_at"],
+            row["neighbours_updated_at"],
+        ),
+        user=user,
+    )
+
+
+def get_property_list_validator(queryset, *, query: str, user=None) -> tuple[str, Any]:
+    """
+    ``(etag, last_modified)`` for a filtered listing, read from the cache
+    rather than the listing tables: ``listing_version()`` moves whenever
+    any listing's card data changes (search_documents.py), so it stands in
+    for the newest change time of every filtered set.  ``query`` is the
+    request's query string (filters, ordering, page).
+    """
+    version = listing_version()
+    return _validator(
+        (query, queryset.model._meta.label, version),
+        (datetime.fromtimestamp(version / 1e9, tz=UTC),),
+        user=user,
+    )
+
+
 
 def create_property(*, agent, validated_data: dict) -> Property:
     """
@@ -251,10 +646,12 @@ def create_property(*, agent, validated_data: dict) -> Property:
             prop.amenities.set(amenities)
 
         if images_data:
-            PropertyImage.objects.bulk_create([
-                PropertyImage(property=prop, **img)
-                for img in images_data
-            ])
+            gallery.check_gallery_limit(prop, current_count=0, adding=len(images_data))
+            gallery.insert_images(
+                prop,
+                [img["image"] for img in images_data],
+                orders=[img.get("order", position) for position, img in enumerate(images_data)],
+            )
 
     return prop
 
@@ -267,9 +664,10 @@ def update_property(*, instance: Property, agent, validated_data: dict) -> Prope
       • ``images``    — list of dicts with keys "image" (InMemoryUploadedFile)
       and "order" (int) (optional)
     The update strategy for amenities and images is to replace the existing set
-    with the submitted set.  For images, this means deleting all existing records and
-    inserting new ones
-    since the client may update the order or replace the image file itself.
+    with the submitted set.  Images are diffed rather than re-inserted (see
+    ``gallery.sync_gallery()``): entries may also carry the ``id`` of an
+    existing image instead of a file, and only reorders, removals and new
+    files are written.
     """
 
     if str(instance.agent_id) != str(agent.pk):
@@ -286,12 +684,7 @@ def update_property(*, instance: Property, agent, validated_data: dict) -> Prope
         if amenities is not None:
             instance.amenities.set(amenities)
         if images_data is not None:
-            # Replace strategy: wipe existing gallery, insert fresh
-            instance.images.all().delete()
-            PropertyImage.objects.bulk_create([
-                PropertyImage(property=instance, **img)
-                for img in images_data
-            ])
+            gallery.sync_gallery(instance, images_data)
     return instance
 
 def delete_property(*, instance: Property, agent) -> None:
@@ -304,10 +697,12 @@ def delete_property(*, instance: Property, agent) -> None:
     instance.delete()
 
 
-def get_agent_properties(*, agent, user=None):
+def get_agent_properties(*, agent, user=None, ordering: str | None = None):
     """
-    All listings owned by a given agent, annotated with lead_count and
-    viewing_count for the agent dashboard table.
+    All listings owned by a given agent for the agent dashboard table.
+    ``lead_count`` / ``viewing_count`` / ``favorite_count`` are counter
+    columns on Property, so they cost no joins and ``ordering`` may sort
+    on them (see ``PropertyQuerySet.order_by_engagement``).
     Returns an unevaluated QuerySet.
     """
     return (
@@ -316,7 +711,7 @@ def get_agent_properties(*, agent, user=None):
         .for_agent(agent)
         .with_card_relations()
         .with_favorite_annotation(user=user)
-        .with_listing_counts()
+        .order_by_engagement(ordering or "-created_at")
     )
 
 
@@ -443,21 +838,35 @@ def get_lead(*, user, lead_id) -> Lead:
         raise NotFound("Lead not found.")
 
 
-def get_user_leads(*, user):
+def get_user_leads(*, user, fields: set[str] | None = None):
     """
     All leads created by a user (their enquiry history) with full
-    relations pre-fetched.  Unevaluated — the view paginates.
+    relations pre-fetched — or just those ``fields`` need.
+    Unevaluated — the view paginates.
     """
-    return Lead.objects.for_user(user).with_relations()
+    return Lead.objects.for_user(user).with_relations(fields)
 
 
-def get_agent_leads(*, agent, status: str | None = None):
+def get_agent_leads(*, agent, status: str | None = None, fields: set[str] | None = None):
     """
     All leads for an agent's listings, with upcoming viewings and
     viewing counts pre-fetched.  Supports optional status filtering
-    for the CRM pipeline view.  Unevaluated — the view paginates.
+    for the CRM pipeline view and ``fields`` narrowing as in
+    ``get_user_leads``.  Unevaluated — the view paginates.
     """
-    qs = Lead.objects.for_agent(agent).with_relations().with_viewing_count()
+    qs = Lead.objects.for_agent(agent).with_relations(fields).with_viewing_count()
+    if status:
+        qs = qs.by_status(status)
+    return qs
+
+
+def get_agent_lead_export(*, agent, status: str | None = None):
+    """
+    The agent's leads for the streaming export: no relations or viewing
+    count, since the export reads flat ``values_list()`` rows.
+    Unevaluated.
+    """
+    qs = Lead.objects.for_agent(agent).order_by("-created_at")
     if status:
         qs = qs.by_status(status)
     return qs
@@ -518,6 +927,11 @@ def create_viewing(*, user, validated_data: dict) -> PropertyViewing:
                 status="VIEWING_SCHEDULED",
                 last_contact=timezone.now(),
             )
+            # update() bypasses the Lead signals that keep closed_deals.
+            move_lead(
+                (lead.agent_id, is_closed_deal(lead.status)),
+                (lead.agent_id, False),
+            )
 
     return viewing
 
@@ -558,18 +972,28 @@ def cancel_viewing(*, user, viewing_id, reason: str = "") -> PropertyViewing:
     return viewing
 
 
-def get_user_viewings(*, user):
+def get_user_viewings(*, user, fields: set[str] | None = None):
     """
-    All viewings for a user with property card pre-fetched.
+    All viewings for a user with property card pre-fetched (or, given
+    ``fields``, just the columns those serializer fields read).
     Ordered by most recent scheduled time first.
     Unevaluated — the view paginates.
     """
-    return (
-        PropertyViewing.objects
-        .for_user(user)
-        .with_relations()
-        .order_by("-scheduled_time")
-    )
+    qs = PropertyViewing.objects.for_user(user).order_by("-scheduled_time")
+    if fields is None:
+        return qs.with_relations()
+    return qs.with_fields(fields)
+
+
+def get_agent_viewings(*, agent, status: str | None = None):
+    """
+    Viewings booked on an agent's listings, most recent scheduled time
+    first, optionally narrowed to one ``status``.  Unevaluated.
+    """
+    qs = PropertyViewing.objects.for_agent(agent).order_by("-scheduled_time")
+    if status:
+        qs = qs.filter(status=status)
+    return qs
 
 
 # ---------------------------------------------------------------------------
@@ -2,19 +2,377 @@ import logging
 
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import F
+from django.db.models import Func
+from django.db.models import UUIDField
+from django.db.models import Value
+from django.db.models.functions import Now
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.template.loader import render_to_string
 
 from core.applications.notifications.models import Notification
+from core.applications.property.counters import CATEGORY_FIELDS
+from core.applications.property.counters import adjust_engagement_counters
+from core.applications.property.counters import adjust_viewing_count
+from core.applications.property.counters import category_key
+from core.applications.property.counters import is_closed_deal
+from core.applications.property.counters import move_category_count
+from core.applications.property.counters import move_lead
+from core.applications.property.counters import move_listing
+from core.applications.property.home_page import invalidate_home_page
 from core.applications.property.models import Amenity, Lead
+from core.applications.property.models import FavoriteProperty
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
 from core.applications.property.models import PropertyViewing
+from core.applications.property.search_documents import bump_listing_version
+from core.applications.property.search_documents import schedule_document_sync
+from core.applications.property.tasks import refresh_similar_properties
+from core.applications.property.tasks import schedule_renditions
+from core.applications.subscriptions.models import FeaturedListing
+from core.applications.subscriptions.services.boost import sync_featured_flags
+from core.applications.users.models import AgentProfile
 from core.helpers.enums import NotificationType
 from django.db.models.signals import post_migrate
 
 
 logger = logging.getLogger(__name__)
 
+# Columns that feed Property.search_vector.
+_SEARCH_VECTOR_FIELDS = frozenset({"title", "location", "description"})
+# Columns that feed the similarity feature vectors (similarity.py).
+_SIMILARITY_FIELDS = frozenset(
+    {
+        "price",
+        "bedrooms",
+        "bathrooms",
+        "sqft",
+        "property_type",
+        "property_listing",
+        "location",
+        "description",
+        "visible",
+        "is_available",
+    },
+)
+
+
+@receiver(connection_created)
+def set_trigram_thresholds(sender, connection, **kwargs):
+    """
+    pg_trgm's ``%`` / ``%>`` operators — what the trigram GIN indexes
+    answer — match at these session settings; align them with
+    PROPERTY_LOCATION_SIMILARITY_THRESHOLD so the index pre-filter keeps
+    every row the explicit similarity filter accepts.  Session-level, so
+    no database-owner privileges are needed.
+    """
+    if connection.vendor != "postgresql":
+        return
+    threshold = str(settings.PROPERTY_LOCATION_SIMILARITY_THRESHOLD)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, false), "
+            "set_config('pg_trgm.word_similarity_threshold', %s, false)",
+            [threshold, threshold],
+        )
+
+
+@receiver(post_save, sender=Property)
+def refresh_property_search_vector(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keeps the weighted full-text vector in step with the text columns.
+    Runs as a single UPDATE (no post_save re-entry) and is skipped for
+    partial saves that don't touch title, location or description.
+    """
+    if update_fields is not None and not _SEARCH_VECTOR_FIELDS.intersection(update_fields):
+        return
+    Property.objects.filter(pk=instance.pk).refresh_search_vector()
+
+
+# ---------------------------------------------------------------------------
+# PropertySearchDocument maintenance — see search_documents.py
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=Property)
+def sync_property_document(sender, instance, **kwargs):
+    schedule_document_sync([instance.pk])
+
+
+@receiver(post_delete, sender=Property)
+def expire_listing_validators(sender, instance, **kwargs):
+    """The document goes with the row (CASCADE), so no sync bumps the version."""
+    transaction.on_commit(bump_listing_version)
+
+
+# ---------------------------------------------------------------------------
+# Precomputed similar properties — see similarity.py
+# ---------------------------------------------------------------------------
+
+def schedule_similarity_refresh(property_id) -> None:
+    """Queue the neighbour refresh once the current transaction commits."""
+    transaction.on_commit(lambda: refresh_similar_properties.delay(str(property_id)))
+
+
+@receiver(post_save, sender=Property)
+def refresh_property_neighbours(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not _SIMILARITY_FIELDS.intersection(update_fields):
+        return
+    schedule_similarity_refresh(instance.pk)
+
+
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_save, sender=FeaturedListing)
+@receiver(post_delete, sender=FeaturedListing)
+def sync_related_property_document(sender, instance, **kwargs):
+    schedule_document_sync([instance.property_id])
+
+
+@receiver(m2m_changed, sender=Property.amenities.through)
+def sync_amenity_ids(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Mirrors the amenities M2M into ``Property.amenity_ids`` (and the search
+    documents) whenever it changes from either side.  Runs synchronously so
+    later queries in the same transaction already filter on the new array.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear", "post_clear"):
+        return
+    if not reverse:
+        if action != "pre_clear":
+            # Refresh the in-memory copy too, so a later save() of this
+            # instance doesn't write a stale array back.
+            instance.amenity_ids = sorted(instance.amenities.values_list("pk", flat=True))
+            Property.objects.filter(pk=instance.pk).update(
+                amenity_ids=instance.amenity_ids,
+                updated_at=Now(),
+            )
+            schedule_document_sync([instance.pk])
+            schedule_similarity_refresh(instance.pk)
+        return
+    if action == "pre_clear":
+        # The reverse clear doesn't report which properties lost the amenity.
+        instance._cleared_property_ids = list(
+            instance.properties.values_list("pk", flat=True),
+        )
+        return
+    property_ids = pk_set if action != "post_clear" else instance._cleared_property_ids
+    Property.objects.filter(pk__in=property_ids).refresh_amenity_ids()
+    schedule_document_sync(property_ids)
+
+
+@receiver(post_delete, sender=Amenity)
+def drop_deleted_amenity(sender, instance, **kwargs):
+    """Cascade-deleted M2M rows send no m2m_changed, so prune the arrays here."""
+    affected = Property.objects.filter(amenity_ids__contains=[instance.pk])
+    property_ids = list(affected.values_list("pk", flat=True))
+    affected.update(
+        amenity_ids=Func(
+            F("amenity_ids"),
+            Value(instance.pk, output_field=UUIDField()),
+            function="array_remove",
+        ),
+        updated_at=Now(),
+    )
+    schedule_document_sync(property_ids)
+
+
+@receiver(post_save, sender=AgentProfile)
+def sync_agent_documents(sender, instance, **kwargs):
+    schedule_document_sync(instance.properties.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_agent_user_documents(sender, instance, update_fields=None, **kwargs):
+    """Agent names live on User; skip the login-time last_login saves."""
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    profile = getattr(instance, "agent_profile", None)
+    if profile is not None:
+        # The detail page's validator reads the profile's updated_at.
+        AgentProfile.objects.filter(pk=profile.pk).update(updated_at=Now())
+        schedule_document_sync(profile.properties.values_list("pk", flat=True))
+
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+def touch_parent_property(sender, instance, **kwargs):
+    """
+    Gallery changes bump ``Property.updated_at`` so the conditional-GET
+    validators (services.get_property_*_validator) see them.
+    """
+    Property.objects.filter(pk=instance.property_id).update(updated_at=Now())
+
+
+# ---------------------------------------------------------------------------
+# Image renditions — see renditions.py
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=PropertyImage)
+def render_gallery_image(sender, instance, created, **kwargs):
+    """A new or replaced file drops the old renditions and queues new ones."""
+    if not created and not instance.tracker.has_changed("image"):
+        return
+    if not created and instance.renditions:
+        instance.renditions = {}
+        PropertyImage.objects.filter(pk=instance.pk).update(renditions={})
+    if instance.image:
+        schedule_renditions(image_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Property)
+def render_cover_image(sender, instance, created, **kwargs):
+    if not created and not instance.tracker.has_changed("cover_image"):
+        return
+    if not created and instance.cover_renditions:
+        instance.cover_renditions = {}
+        Property.objects.filter(pk=instance.pk).update(cover_renditions={})
+    if instance.cover_image:
+        schedule_renditions(property_ids=[instance.pk])
+
+
+@receiver(post_save, sender=FeaturedListing)
+@receiver(post_delete, sender=FeaturedListing)
+def sync_property_featured_flags(sender, instance, **kwargs):
+    """
+    Boost changes resync ``Property.is_featured`` / ``featured_until``
+    (bumping ``updated_at`` with them).  Expiry by time alone is handled by
+    the ``expire_featured_listings`` sweeper.
+    """
+    sync_featured_flags([instance.property_id])
+
+
+# ---------------------------------------------------------------------------
+# Listing category counters — see counters.py
+# ---------------------------------------------------------------------------
+
+def _saved_category_key(instance):
+    return category_key(**{name: instance.tracker.previous(name) for name in CATEGORY_FIELDS})
+
+
+@receiver(post_save, sender=Property)
+def update_category_counters(sender, instance, created, **kwargs):
+    old = None if created else _saved_category_key(instance)
+    new = category_key(**{name: getattr(instance, name) for name in CATEGORY_FIELDS})
+    move_category_count(old, new)
+
+
+@receiver(post_delete, sender=Property)
+def release_category_count(sender, instance, **kwargs):
+    move_category_count(_saved_category_key(instance), None)
+
+
+# ---------------------------------------------------------------------------
+# AgentProfile counters — see counters.py
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=Property)
+def update_agent_listing_counters(sender, instance, created, **kwargs):
+    new = (instance.agent_id, instance.is_available)
+    if created:
+        move_listing(None, new)
+        return
+    old = (instance.tracker.previous("agent"), instance.tracker.previous("is_available"))
+    viewings = instance.viewings.count() if old[0] != new[0] else 0
+    move_listing(old, new, viewings=viewings)
+
+
+@receiver(post_delete, sender=Property)
+def release_agent_listing_counters(sender, instance, **kwargs):
+    # Its viewings and leads are cascade-deleted first and release their
+    # own counts.
+    saved = (instance.tracker.previous("agent"), instance.tracker.previous("is_available"))
+    move_listing(saved, None)
+
+
+@receiver(post_save, sender=Lead)
+def update_agent_lead_counters(sender, instance, created, **kwargs):
+    new = (instance.agent_id, is_closed_deal(instance.status))
+    if created:
+        move_lead(None, new)
+        return
+    move_lead(
+        (instance.tracker.previous("agent"), is_closed_deal(instance.tracker.previous("status"))),
+        new,
+    )
+
+
+@receiver(post_delete, sender=Lead)
+def release_agent_lead_counters(sender, instance, **kwargs):
+    move_lead(
+        (instance.tracker.previous("agent"), is_closed_deal(instance.tracker.previous("status"))),
+        None,
+    )
+
+
+@receiver(post_save, sender=PropertyViewing)
+def count_agent_viewing(sender, instance, created, **kwargs):
+    if created:
+        adjust_viewing_count(instance.property_id, 1)
+
+
+@receiver(post_delete, sender=PropertyViewing)
+def release_agent_viewing(sender, instance, **kwargs):
+    adjust_viewing_count(instance.property_id, -1)
+
+
+# ---------------------------------------------------------------------------
+# Property engagement counters — see counters.py
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=Lead)
+def count_property_lead(sender, instance, created, **kwargs):
+    if created:
+        adjust_engagement_counters(instance.property_link_id, lead_count=1)
+
+
+@receiver(post_delete, sender=Lead)
+def release_property_lead(sender, instance, **kwargs):
+    adjust_engagement_counters(instance.property_link_id, lead_count=-1)
+
+
+@receiver(post_save, sender=PropertyViewing)
+def count_property_viewing(sender, instance, created, **kwargs):
+    if created:
+        adjust_engagement_counters(instance.property_id, viewing_count=1)
+
+
+@receiver(post_delete, sender=PropertyViewing)
+def release_property_viewing(sender, instance, **kwargs):
+    adjust_engagement_counters(instance.property_id, viewing_count=-1)
+
+
+@receiver(post_save, sender=FavoriteProperty)
+def count_property_favorite(sender, instance, created, **kwargs):
+    if created:
+        adjust_engagement_counters(instance.property_id, favorite_count=1)
+
+
+@receiver(post_delete, sender=FavoriteProperty)
+def release_property_favorite(sender, instance, **kwargs):
+    adjust_engagement_counters(instance.property_id, favorite_count=-1)
+
+
+# ---------------------------------------------------------------------------
+# Home page cache — see home_page.py
+# ---------------------------------------------------------------------------
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_save, sender=FeaturedListing)
+@receiver(post_delete, sender=FeaturedListing)
+@receiver(post_save, sender=AgentProfile)
+@receiver(post_delete, sender=AgentProfile)
+def invalidate_home_page_cache(sender, **kwargs):
+    # After commit, so a concurrent request can't re-cache the old rows.
+    transaction.on_commit(invalidate_home_page)
+
+
 @receiver(post_save, sender=PropertyViewing)
 def handle_viewing_status_change(sender, instance, created, **kwargs):
     """
@@ -116,9 +474,6 @@ def handle_new_lead(sender, instance, created, **kwargs):
 
         except Exception as e:
             # Log the error but don't crash the application
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.error(f"Failed to process lead signal: {e!s}", exc_info=True)
 
 
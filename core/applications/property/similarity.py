@@ -0,0 +1,357 @@
+"""
+Content-based "similar properties".
+
+Each listing is turned into a NumPy feature vector made of:
+
+- numeric columns — log price, bedrooms, bathrooms, log sqft —
+  standardised across the pool and compared with an RBF kernel;
+- the property type (one-hot);
+- an amenity bitmask;
+- location tokens ("Lekki Phase 1, Lagos" → lekki / phase / 1 / lagos);
+- TF-IDF over the description.
+
+Listings are only compared within their listing type (sale prices and
+rents don't mix).  The top ``PROPERTY_SIMILAR_TOP_K`` neighbours of each
+property are stored in ``SimilarProperty`` so the detail page reads them
+with one indexed query instead of scoring anything per request.
+
+``refresh_similar`` handles a single changed property: it rewrites that
+property's own list and slots it into the lists it now beats or that
+still have room.  Lists it
+drops out of are only corrected by the nightly ``rebuild_similar``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Min
+
+from core.applications.property.models import Property
+from core.applications.property.models import SimilarProperty
+
+# Relative weight of each feature block; they sum to 1, so scores fall in [0, 1].
+_WEIGHTS = {
+    "numeric": 0.35,
+    "type": 0.15,
+    "amenities": 0.15,
+    "location": 0.2,
+    "description": 0.15,
+}
+_MAX_LOCATION_TERMS = 500
+_MAX_DESCRIPTION_TERMS = 1000
+# Rows scored per matrix product; bounds peak memory at CHUNK × pool size.
+_CHUNK_SIZE = 512
+
+_FEATURE_FIELDS = (
+    "pk",
+    "price",
+    "bedrooms",
+    "bathrooms",
+    "sqft",
+    "property_type",
+    "amenity_ids",
+    "location",
+    "description",
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or that the
+    this to with which will you your our we all also very into there
+    """.split(),
+)
+
+
+@dataclass
+class FeatureMatrix:
+    """Feature vectors for every candidate listing of one listing type."""
+
+    ids: list
+    # Standardised numeric columns, compared with an RBF kernel.
+    numeric: np.ndarray
+    # Weighted, row-normalised categorical / text blocks: a dot product
+    # is the weighted sum of the per-block cosine similarities.
+    dense: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def position(self, property_id) -> int | None:
+        try:
+            return self.ids.index(property_id)
+        except ValueError:
+            return None
+
+    def scores(self, rows: slice | list[int]) -> np.ndarray:
+        """Similarity of ``rows`` to every listing, shape ``(len(rows), n)``."""
+        numeric = self.numeric[rows]
+        sq_dist = (
+            (numeric**2).sum(axis=1)[:, None]
+            + (self.numeric**2).sum(axis=1)[None, :]
+            - 2 * numeric @ self.numeric.T
+        )
+        np.maximum(sq_dist, 0, out=sq_dist)
+        scores = _WEIGHTS["numeric"] * np.exp(-sq_dist / self.numeric.shape[1])
+        scores += self.dense[rows] @ self.dense.T
+        return scores
+
+
+# ---------------------------------------------------------------------------
+# Feature construction
+# ---------------------------------------------------------------------------
+
+
+def _description_tokens(text: str) -> list[str]:
+    return [
+        token
+        for token in _TOKEN_RE.findall((text or "").lower())
+        if len(token) > 1 and token not in _STOP_WORDS
+    ]
+
+
+def _location_tokens(text: str) -> list[str]:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _normalise_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def _standardise(matrix: np.ndarray) -> np.ndarray:
+    std = matrix.std(axis=0)
+    std[std == 0] = 1
+    return (matrix - matrix.mean(axis=0)) / std
+
+
+def _one_hot(documents: list[list], vocabulary: list) -> np.ndarray:
+    index = {term: i for i, term in enumerate(vocabulary)}
+    matrix = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+    for row, terms in enumerate(documents):
+        for term in terms:
+            column = index.get(term)
+            if column is not None:
+                matrix[row, column] = 1
+    return matrix
+
+
+def _tfidf(documents: list[list[str]], max_terms: int) -> np.ndarray:
+    """
+    Sublinear TF × smoothed IDF.  Terms seen in a single listing can't make
+    two listings similar, so only terms with a document frequency of at
+    least two are kept (the ``max_terms`` most frequent of them).
+    """
+    frequency = Counter()
+    for tokens in documents:
+        frequency.update(set(tokens))
+    vocabulary = [term for term, df in frequency.most_common(max_terms) if df > 1]
+    index = {term: i for i, term in enumerate(vocabulary)}
+
+    matrix = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+    for row, tokens in enumerate(documents):
+        for term, count in Counter(tokens).items():
+            column = index.get(term)
+            if column is not None:
+                matrix[row, column] = count
+    np.log1p(matrix, out=matrix)
+
+    df = np.array([frequency[term] for term in vocabulary], dtype=np.float32)
+    idf = np.log((1 + len(documents)) / (1 + df)) + 1
+    return matrix * idf
+
+
+def build_features(property_listing: str) -> FeatureMatrix:
+    """Feature vectors for every visible, available listing of this type."""
+    rows = list(
+        Property.objects.visible()
+        .available()
+        .filter(property_listing=property_listing)
+        .order_by("pk")
+        .values_list(*_FEATURE_FIELDS),
+    )
+    if not rows:
+        return FeatureMatrix(
+            ids=[],
+            numeric=np.zeros((0, 4)),
+            dense=np.zeros((0, 0), dtype=np.float32),
+        )
+    ids, prices, bedrooms, bathrooms, sqft, types, amenities, locations, descriptions = (
+        list(column) for column in zip(*rows)
+    )
+
+    numeric = _standardise(
+        np.column_stack(
+            [
+                np.log1p(np.array(prices, dtype=np.float64)),
+                np.array(bedrooms, dtype=np.float64),
+                np.array(bathrooms, dtype=np.float64),
+                np.log1p(np.array(sqft, dtype=np.float64)),
+            ],
+        ),
+    )
+
+    blocks = {
+        "type": _one_hot([[value] for value in types], sorted({t for t in types if t})),
+        "amenities": _one_hot(
+            amenities,
+            sorted({amenity for ids_ in amenities for amenity in ids_}),
+        ),
+        "location": _tfidf([_location_tokens(text) for text in locations], _MAX_LOCATION_TERMS),
+        "description": _tfidf(
+            [_description_tokens(text) for text in descriptions],
+            _MAX_DESCRIPTION_TERMS,
+        ),
+    }
+    dense = np.hstack(
+        [np.sqrt(_WEIGHTS[name]) * _normalise_rows(block) for name, block in blocks.items()],
+    ).astype(np.float32)
+
+    return FeatureMatrix(ids=ids, numeric=numeric, dense=dense)
+
+
+# ---------------------------------------------------------------------------
+# Neighbour selection
+# ---------------------------------------------------------------------------
+
+
+def _top_k(scores: np.ndarray, k: int) -> list[tuple[int, float]]:
+    """``(column, score)`` pairs of the ``k`` best scores, best first."""
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return []
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return [(int(column), float(scores[column])) for column in ordered if np.isfinite(scores[column])]
+
+
+def _entries(property_id, neighbours: list[tuple[object, float]]) -> list[SimilarProperty]:
+    return [
+        SimilarProperty(property_id=property_id, similar_id=similar_id, score=score, rank=rank)
+        for rank, (similar_id, score) in enumerate(neighbours, start=1)
+    ]
+
+
+def rebuild_similar(*, k: int | None = None) -> int:
+    """
+    Recompute every neighbour list from scratch, one listing type at a time.
+    Returns the number of rows written.
+    """
+    k = k or settings.PROPERTY_SIMILAR_TOP_K
+    entries: list[SimilarProperty] = []
+
+    listing_types = (
+        Property.objects.visible()
+        .available()
+        .order_by()
+        .values_list("property_listing", flat=True)
+        .distinct()
+    )
+    for property_listing in listing_types:
+        features = build_features(property_listing)
+        for start in range(0, len(features), _CHUNK_SIZE):
+            rows = list(range(start, min(start + _CHUNK_SIZE, len(features))))
+            scores = features.scores(rows)
+            scores[np.arange(len(rows)), rows] = -np.inf  # never your own neighbour
+            for offset, row in enumerate(rows):
+                neighbours = [
+                    (features.ids[column], score)
+                    for column, score in _top_k(scores[offset], k)
+                ]
+                entries.extend(_entries(features.ids[row], neighbours))
+
+    with transaction.atomic():
+        SimilarProperty.objects.all().delete()
+        SimilarProperty.objects.bulk_create(entries, batch_size=1000)
+    return len(entries)
+
+
+def refresh_similar(property_id, *, k: int | None = None) -> int:
+    """
+    Incrementally update the neighbour lists after ``property_id`` changed.
+
+    - Its own list is recomputed against the current pool.
+    - Every list it now beats, already appears in or that still has room
+      (an empty one included) is merged with its new score and re-ranked.
+
+    A property that is hidden, unavailable or gone drops out of every list.
+    Returns the number of lists rewritten.
+    """
+    k = k or settings.PROPERTY_SIMILAR_TOP_K
+    prop = (
+        Property.objects.visible()
+        .available()
+        .filter(pk=property_id)
+        .values("pk", "property_listing")
+        .first()
+    )
+    if prop is None:
+        SimilarProperty.objects.filter(property_id=property_id).delete()
+        return SimilarProperty.objects.filter(similar_id=property_id).delete()[0]
+
+    features = build_features(prop["property_listing"])
+    row = features.position(prop["pk"])
+    if row is None:
+        return 0
+    scores = features.scores([row])[0]
+    scores[row] = -np.inf
+    new_score = dict(zip(features.ids, scores.tolist()))
+
+    # Lists the property should now appear in: those that already hold it
+    # (its score changed), lists with room left — including the empty
+    # lists of pool members that have no rows yet — and full lists whose
+    # weakest entry it beats.
+    existing = {
+        row_["property_id"]: row_
+        for row_ in SimilarProperty.objects.filter(
+            property__property_listing=prop["property_listing"],
+        )
+        .exclude(property_id=prop["pk"])
+        .values("property_id")
+        .annotate(floor=Min("score"), size=Count("pk"))
+    }
+    holding = set(
+        SimilarProperty.objects.filter(similar_id=prop["pk"]).values_list("property_id", flat=True),
+    )
+    affected = {
+        pk
+        for pk in features.ids
+        if pk != prop["pk"]
+        and (
+            pk not in existing
+            or pk in holding
+            or existing[pk]["size"] < k
+            or new_score[pk] > existing[pk]["floor"]
+        )
+    }
+
+    merged: dict = {pk: {} for pk in affected}
+    for source_id, similar_id, score in SimilarProperty.objects.filter(
+        property_id__in=affected,
+    ).values_list("property_id", "similar_id", "score"):
+        merged[source_id][similar_id] = score
+
+    entries = _entries(
+        prop["pk"],
+        [(features.ids[column], score) for column, score in _top_k(scores, k)],
+    )
+    for source_id, neighbours in merged.items():
+        neighbours[prop["pk"]] = new_score[source_id]
+        ranked = sorted(neighbours.items(), key=lambda item: -item[1])[:k]
+        entries.extend(_entries(source_id, ranked))
+
+    with transaction.atomic():
+        SimilarProperty.objects.filter(
+            property_id__in=affected | {prop["pk"]},
+        ).delete()
+        SimilarProperty.objects.bulk_create(entries)
+    return len(affected) + 1
+
@@ -0,0 +1,99 @@
+"""
+Unique slug allocation.
+
+A title's slug is its ``slugify()`` base, or the base plus the next free
+numeric suffix (``3-bedroom-flat-in-lekki-4``) once the bare base is
+taken.  One aggregate query reads, for every base at once, whether the
+bare base is taken and the highest suffix in use; the prefix match is
+served by the ``varchar_pattern_ops`` index Django adds for unique slug
+columns on PostgreSQL.  Suffixes are then handed out in memory, so a
+batch of imported titles costs one query per ``_BASES_PER_QUERY``
+distinct bases.
+
+Allocation doesn't lock anything: a concurrent create can still claim the
+same slug first.  Callers insert with the unique constraint as the
+arbiter and allocate again on ``IntegrityError`` (see ``Property.save()``).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+from django.db.models import Count
+from django.db.models import IntegerField
+from django.db.models import Max
+from django.db.models import Q
+from django.db.models.functions import Cast
+from django.db.models.functions import Substr
+from django.utils.text import slugify
+
+# Longest numeric suffix considered (fits an integer column).
+_SUFFIX_DIGITS = 9
+_FALLBACK_SLUG = "listing"
+_BASES_PER_QUERY = 100
+# Allocations tried before an insert gives up on IntegrityError.
+SLUG_ATTEMPTS = 3
+
+
+def base_slug(title: str, *, max_length: int) -> str:
+    """``slugify(title)``, trimmed so a ``-<suffix>`` still fits in ``max_length``."""
+    slug = slugify(title or "")[: max_length - _SUFFIX_DIGITS - 1].rstrip("-")
+    return slug or _FALLBACK_SLUG
+
+
+def _slots(queryset, bases: list[str]) -> dict[str, tuple[bool, int]]:
+    """``base → (bare base free?, next free suffix)`` read in one query."""
+    aggregates = {}
+    prefixes = Q()
+    for i, base in enumerate(bases):
+        suffixed = Q(slug__regex=rf"^{re.escape(base)}-[0-9]{{1,{_SUFFIX_DIGITS}}}$")
+        aggregates[f"taken_{i}"] = Count("pk", filter=Q(slug=base))
+        aggregates[f"last_{i}"] = Max(
+            Cast(Substr("slug", len(base) + 2), IntegerField()),
+            filter=suffixed,
+        )
+        prefixes |= Q(slug__startswith=base)
+    row = queryset.filter(prefixes).aggregate(**aggregates)
+    return {
+        base: (not row[f"taken_{i}"], (row[f"last_{i}"] or 0) + 1)
+        for i, base in enumerate(bases)
+    }
+
+
+def allocate_slugs(queryset, titles: Iterable[str], *, exclude: Iterable[str] = ()) -> list[str]:
+    """
+    A distinct, currently unused slug for each of ``titles``, in order.
+    ``queryset`` is the model's manager or queryset (``Property.objects``);
+    slugs in ``exclude`` (e.g. ones just lost to a concurrent insert) are
+    skipped too.
+    """
+    max_length = queryset.model._meta.get_field("slug").max_length
+    bases = [base_slug(title, max_length=max_length) for title in titles]
+    distinct = list(dict.fromkeys(bases))
+
+    slots: dict[str, tuple[bool, int]] = {}
+    for start in range(0, len(distinct), _BASES_PER_QUERY):
+        slots.update(_slots(queryset.all(), distinct[start : start + _BASES_PER_QUERY]))
+
+    exclude = set(exclude)
+    slugs = []
+    for base in bases:
+        bare_free, suffix = slots[base]
+        if bare_free and base not in exclude:
+            slug = base
+            bare_free = False
+        else:
+            slug = f"{base}-{suffix}"
+            while slug in exclude:
+                suffix += 1
+                slug = f"{base}-{suffix}"
+            suffix += 1
+        slots[base] = (bare_free, suffix)
+        slugs.append(slug)
+    return slugs
+
+
+def allocate_slug(queryset, title: str, *, exclude: Iterable[str] = ()) -> str:
+    """The slug ``title`` gets in ``queryset``'s table, from one query."""
+    return allocate_slugs(queryset, [title], exclude=exclude)[0]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+from django.db import transaction
+
+from core.applications.property.counters import repair_engagement_counters as repair_counters
+from core.applications.property.home_page import invalidate_home_page
+from core.applications.property.renditions import render_covers
+from core.applications.property.renditions import render_images
+from core.applications.property.search_documents import sync_documents
+from core.applications.property.similarity import rebuild_similar
+from core.applications.property.similarity import refresh_similar
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def refresh_similar_properties(property_id: str) -> None:
+    """Re-rank the neighbour lists touched by a changed property."""
+    rewritten = refresh_similar(property_id)
+    logger.debug("Refreshed %s similar-property lists for %s", rewritten, property_id)
+
+
+@shared_task(ignore_result=True)
+def rebuild_similar_properties() -> None:
+    """Nightly full rebuild (CELERY_BEAT_SCHEDULE); repairs incremental drift."""
+    written = rebuild_similar()
+    logger.info("Rebuilt similar properties: %s rows", written)
+
+
+@shared_task(ignore_result=True)
+def repair_engagement_counters() -> None:
+    """Nightly (CELERY_BEAT_SCHEDULE) fix-up of Property lead / viewing / favourite counts."""
+    repaired = repair_counters()
+    if repaired:
+        logger.warning("Repaired engagement counters on %s properties", repaired)
+
+
+def _renditions_landed(property_ids: set) -> None:
+    """Card payloads embed the srcsets: resync documents and the home page."""
+    if property_ids:
+        sync_documents(property_ids)
+        invalidate_home_page()
+
+
+@shared_task(ignore_result=True)
+def generate_image_renditions(image_ids: list[str]) -> None:
+    """Resized WebP / AVIF copies of uploaded gallery images (renditions.py)."""
+    property_ids = render_images(image_ids)
+    _renditions_landed(property_ids)
+    logger.debug("Rendered gallery images of %s properties", len(property_ids))
+
+
+@shared_task(ignore_result=True)
+def generate_cover_renditions(property_ids: list[str]) -> None:
+    """Resized WebP / AVIF copies of uploaded cover images (renditions.py)."""
+    rendered = render_covers(property_ids)
+    _renditions_landed(rendered)
+    logger.debug("Rendered %s cover images", len(rendered))
+
+
+def schedule_renditions(*, image_ids=(), property_ids=()) -> None:
+    """
+    Queue rendition generation for gallery ``image_ids`` and the covers of
+    ``property_ids`` once the current transaction commits.
+    """
+    image_ids = [str(pk) for pk in image_ids]
+    property_ids = [str(pk) for pk in property_ids]
+    if image_ids:
+        transaction.on_commit(lambda: generate_image_renditions.delay(image_ids))
+    if property_ids:
+        transaction.on_commit(lambda: generate_cover_renditions.delay(property_ids))
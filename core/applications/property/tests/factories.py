@@ -0,0 +1,111 @@
+from decimal import Decimal
+from io import BytesIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from factory import Faker
+from factory import LazyFunction
+from factory import Sequence
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+from factory.django import ImageField
+from PIL import Image
+
+from core.applications.property.models import Amenity
+from core.applications.property.models import FavoriteProperty
+from core.applications.property.models import Lead
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.models import PropertySubscription
+from core.applications.property.models import PropertyViewing
+from core.applications.users.models import AgentProfile
+from core.applications.users.tests.factories import UserFactory
+from core.helpers.enums import AgentTypeChoices
+from core.helpers.enums import PropertyListingType
+from core.helpers.enums import PropertyTypeChoices
+from core.helpers.enums import UserRoleChoice
+
+
+class AgentUserFactory(UserFactory):
+    role = UserRoleChoice.AGENT.value
+
+
+class AgentProfileFactory(DjangoModelFactory[AgentProfile]):
+    user = SubFactory(AgentUserFactory)
+    agent_type = AgentTypeChoices.PROPERTY_MANAGER
+    verified = True
+
+    class Meta:
+        model = AgentProfile
+
+
+class AmenityFactory(DjangoModelFactory[Amenity]):
+    name = Sequence(lambda n: f"Amenity {n}")
+
+    class Meta:
+        model = Amenity
+
+
+class PropertyFactory(DjangoModelFactory[Property]):
+    agent = SubFactory(AgentProfileFactory)
+    title = Sequence(lambda n: f"Listing {n}")
+    description = Faker("sentence")
+    property_type = PropertyTypeChoices.APARTMENT
+    property_listing = PropertyListingType.RENT
+    price = LazyFunction(lambda: Decimal("1500.00"))
+    location = "East Legon, Accra"
+    bedrooms = 2
+    bathrooms = 1
+    sqft = 900
+
+    class Meta:
+        model = Property
+
+
+class PropertyImageFactory(DjangoModelFactory[PropertyImage]):
+    property = SubFactory(PropertyFactory)
+    image = ImageField(color="blue", width=64, height=48)
+    order = Sequence(lambda n: n)
+
+    class Meta:
+        model = PropertyImage
+
+
+class LeadFactory(DjangoModelFactory[Lead]):
+    property_link = SubFactory(PropertyFactory)
+    agent = SubFactory(AgentProfileFactory)
+    user = SubFactory(UserFactory)
+    message = Faker("sentence")
+
+    class Meta:
+        model = Lead
+
+
+class PropertyViewingFactory(DjangoModelFactory[PropertyViewing]):
+    property = SubFactory(PropertyFactory)
+    user = SubFactory(UserFactory)
+    scheduled_time = Faker("future_datetime", tzinfo=None)
+
+    class Meta:
+        model = PropertyViewing
+
+
+class FavoritePropertyFactory(DjangoModelFactory[FavoriteProperty]):
+    property = SubFactory(PropertyFactory)
+    user = SubFactory(UserFactory)
+
+    class Meta:
+        model = FavoriteProperty
+
+
+class PropertySubscriptionFactory(DjangoModelFactory[PropertySubscription]):
+    user = SubFactory(UserFactory)
+
+    class Meta:
+        model = PropertySubscription
+
+
+def image_upload(name: str = "photo.png", *, color: str = "red", size=(64, 48)) -> SimpleUploadedFile:
+    """A small PNG upload; different ``color`` values give different bytes."""
+    buffer = BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
@@ -0,0 +1,106 @@
+import pytest
+from django.db import DatabaseError
+
+from core.applications.property.counters import rebuild_agent_counters
+from core.applications.property.tests.factories import AgentProfileFactory
+from core.applications.property.tests.factories import LeadFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.property.tests.factories import PropertyViewingFactory
+from core.applications.users.models import AgentProfile
+from core.helpers.enums import Lead_Status_Choices
+
+pytestmark = pytest.mark.django_db
+
+
+def _counters(agent) -> dict:
+    return AgentProfile.objects.values(
+        "total_listings",
+        "active_listings",
+        "total_leads",
+        "closed_deals",
+        "total_viewings",
+    ).get(pk=agent.pk)
+
+
+class TestAgentCounters:
+    def test_listings_are_counted(self):
+        agent = AgentProfileFactory()
+        prop = PropertyFactory(agent=agent)
+        PropertyFactory(agent=agent, is_available=False)
+
+        assert _counters(agent)["total_listings"] == 2
+        assert _counters(agent)["active_listings"] == 1
+
+        prop.is_available = False
+        prop.save()
+        assert _counters(agent)["active_listings"] == 0
+
+        prop.delete()
+        assert _counters(agent)["total_listings"] == 1
+
+    def test_leads_and_closed_deals(self):
+        prop = PropertyFactory()
+        agent = prop.agent
+        lead = LeadFactory(property_link=prop, agent=agent)
+        LeadFactory(property_link=prop, agent=agent)
+
+        lead.status = Lead_Status_Choices.CLOSED
+        lead.save()
+        assert _counters(agent)["total_leads"] == 2
+        assert _counters(agent)["closed_deals"] == 1
+
+        lead.delete()
+        assert _counters(agent)["total_leads"] == 1
+        assert _counters(agent)["closed_deals"] == 0
+
+    def test_viewings_count_for_the_listing_agent(self):
+        prop = PropertyFactory()
+
+        viewing = PropertyViewingFactory(property=prop)
+        assert _counters(prop.agent)["total_viewings"] == 1
+
+        viewing.delete()
+        assert _counters(prop.agent)["total_viewings"] == 0
+
+    def test_stale_instance_save_keeps_the_counters(self):
+        agent = AgentProfileFactory()
+        stale = AgentProfile.objects.get(pk=agent.pk)
+
+        PropertyFactory(agent=agent)
+        stale.company_name = "Renamed Realty"
+        stale.save()
+
+        stored = AgentProfile.objects.get(pk=agent.pk)
+        assert stored.company_name == "Renamed Realty"
+        assert stored.total_listings == 1
+
+    def test_named_counter_is_written(self):
+        agent = AgentProfileFactory()
+        agent.total_listings = 7
+
+        agent.save(update_fields=["total_listings"])
+
+        assert _counters(agent)["total_listings"] == 7
+
+    def test_full_save_of_a_deleted_profile_does_not_reinsert(self):
+        agent = AgentProfileFactory()
+        AgentProfile.objects.filter(pk=agent.pk).delete()
+
+        with pytest.raises(DatabaseError, match="did not affect any rows"):
+            agent.save()
+
+    def test_rebuild_repairs_drift(self):
+        prop = PropertyFactory()
+        LeadFactory(property_link=prop, agent=prop.agent)
+        PropertyViewingFactory(property=prop)
+        AgentProfile.objects.update(total_listings=9, total_leads=0, total_viewings=4)
+
+        rebuild_agent_counters()
+
+        assert _counters(prop.agent) == {
+            "total_listings": 1,
+            "active_listings": 1,
+            "total_leads": 1,
+            "closed_deals": 0,
+            "total_viewings": 1,
+        }
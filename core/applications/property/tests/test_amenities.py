@@ -0,0 +1,68 @@
+from uuid import UUID
+
+import pytest
+
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import AmenityFactory
+from core.applications.property.tests.factories import PropertyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _ids(*amenities) -> list[UUID]:
+    return sorted(UUID(str(amenity.pk)) for amenity in amenities)
+
+
+def _stored(prop) -> list[UUID]:
+    return sorted(Property.objects.values_list("amenity_ids", flat=True).get(pk=prop.pk))
+
+
+def _titles(queryset) -> set[str]:
+    return set(queryset.values_list("title", flat=True))
+
+
+class TestAmenityIds:
+    def test_forward_add_and_remove_mirror_the_array(self):
+        pool, gym = AmenityFactory(), AmenityFactory()
+        prop = PropertyFactory()
+
+        prop.amenities.add(pool, gym)
+        assert _stored(prop) == _ids(pool, gym)
+        assert sorted(prop.amenity_ids) == _ids(pool, gym)
+
+        prop.amenities.remove(gym)
+        assert _stored(prop) == _ids(pool)
+
+        # The in-memory copy was refreshed, so a full save keeps the array.
+        prop.title = "Renamed"
+        prop.save()
+        assert _stored(prop) == _ids(pool)
+
+    def test_reverse_add_and_clear(self):
+        pool = AmenityFactory()
+        first, second = PropertyFactory(), PropertyFactory()
+
+        pool.properties.add(first, second)
+        assert _stored(first) == _stored(second) == _ids(pool)
+
+        pool.properties.clear()
+        assert _stored(first) == _stored(second) == []
+
+    def test_deleted_amenity_is_pruned(self):
+        pool, gym = AmenityFactory(), AmenityFactory()
+        prop = PropertyFactory()
+        prop.amenities.add(pool, gym)
+
+        gym.delete()
+
+        assert _stored(prop) == _ids(pool)
+
+    def test_any_and_all_matching(self):
+        pool, gym = AmenityFactory(), AmenityFactory()
+        PropertyFactory(title="Both").amenities.add(pool, gym)
+        PropertyFactory(title="Pool only").amenities.add(pool)
+        PropertyFactory(title="Neither")
+
+        wanted = [pool.pk, gym.pk]
+        assert _titles(Property.objects.by_amenities(wanted)) == {"Both", "Pool only"}
+        assert _titles(Property.objects.by_amenities(wanted, match="all")) == {"Both"}
@@ -0,0 +1,63 @@
+import pytest
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.applications.property import services
+from core.applications.property.api.serializers import PropertyCardSerializer
+from core.applications.property.card_renderer import card_rows
+from core.applications.property.card_renderer import render_cards
+from core.applications.property.tests.factories import FavoritePropertyFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.property.tests.factories import PropertyImageFactory
+from core.applications.property.tests.factories import image_upload
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def cards():
+    PropertyFactory(title="Bare")
+    PropertyFactory(title="Cover", cover_image=image_upload("cover.png"))
+    PropertyImageFactory(property=PropertyFactory(title="Gallery only"))
+    agent_listing = PropertyFactory(title="Agent photo")
+    agent_listing.agent.profile_picture = image_upload("agent.png", color="green")
+    agent_listing.agent.save()
+
+
+def _both(queryset, request):
+    expected = PropertyCardSerializer(list(queryset), many=True, context={"request": request}).data
+    actual = render_cards(card_rows(queryset), request=request)
+    return JSONRenderer().render(expected), JSONRenderer().render(actual)
+
+
+class TestCardRenderer:
+    @pytest.mark.parametrize("host", [None, "example.com"])
+    def test_matches_the_serializer_byte_for_byte(self, cards, host):
+        request = RequestFactory().get("/", HTTP_HOST=host) if host else None
+        queryset = services.get_property_list(user=None)
+
+        expected, actual = _both(queryset, request)
+
+        assert actual == expected
+
+    def test_matches_with_annotations(self, cards, user):
+        FavoritePropertyFactory(user=user, property=PropertyFactory(title="Loved"))
+        queryset = services.get_property_list(user=user, lat=5.6, lng=-0.2)
+
+        expected, actual = _both(queryset, None)
+
+        assert actual == expected
+
+    def test_listing_api_uses_the_fast_path(self, cards, settings, monkeypatch):
+        settings.PROPERTY_CARD_FAST_PATH = True
+
+        def unexpected(*args, **kwargs):
+            raise AssertionError("PropertyCardSerializer was used")
+
+        monkeypatch.setattr(PropertyCardSerializer, "to_representation", unexpected)
+
+        response = APIClient().get("/api/v1/property/")
+
+        assert response.status_code == 200
+        assert len(response.data["results"]) == 4
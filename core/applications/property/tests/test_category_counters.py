@@ -0,0 +1,80 @@
+import pytest
+
+from core.applications.property.counters import rebuild_category_counters
+from core.applications.property.models import ListingCategoryCounter
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.enums import PropertyListingType
+from core.helpers.enums import PropertyTypeChoices
+
+pytestmark = pytest.mark.django_db
+
+RENT = PropertyListingType.RENT
+SALE = PropertyListingType.FOR_SALE
+APARTMENT = PropertyTypeChoices.APARTMENT
+HOUSE = PropertyTypeChoices.HOUSE
+
+
+def _counts() -> dict:
+    return {
+        (row.property_listing, row.property_type): row.count
+        for row in ListingCategoryCounter.objects.exclude(count=0)
+    }
+
+
+def _live_counts() -> dict:
+    counts: dict = {}
+    for prop in Property.objects.visible().available():
+        key = (prop.property_listing, prop.property_type)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+class TestCategoryCounters:
+    def test_created_listings_are_counted(self):
+        PropertyFactory.create_batch(2)
+        PropertyFactory(property_listing=SALE, property_type=HOUSE)
+        PropertyFactory(visible=False)
+        PropertyFactory(is_available=False)
+
+        assert _counts() == {(RENT, APARTMENT): 2, (SALE, HOUSE): 1}
+
+    def test_edits_move_the_count(self):
+        prop = PropertyFactory()
+
+        prop.property_listing = SALE
+        prop.save()
+        assert _counts() == {(SALE, APARTMENT): 1}
+
+        prop.is_available = False
+        prop.save()
+        assert _counts() == {}
+
+        prop.is_available = True
+        prop.property_type = HOUSE
+        prop.save()
+        assert _counts() == {(SALE, HOUSE): 1}
+
+    def test_delete_releases_the_count(self):
+        keep, gone = PropertyFactory.create_batch(2)
+
+        gone.delete()
+
+        assert _counts() == {(RENT, APARTMENT): 1}
+
+    def test_manager_reads_counters_and_filtered_counts_live(self):
+        first = PropertyFactory()
+        PropertyFactory(property_listing=SALE)
+
+        assert Property.objects.category_counts() == {RENT: 1, SALE: 1}
+        assert Property.objects.for_agent(first.agent).category_counts() == {RENT: 1}
+
+    def test_rebuild_repairs_bulk_update_drift(self):
+        PropertyFactory.create_batch(3)
+        # QuerySet.update() bypasses the signals.
+        Property.objects.filter(pk__in=Property.objects.values("pk")[:2]).update(visible=False)
+        assert _counts() != _live_counts()
+
+        rebuild_category_counters()
+
+        assert _counts() == _live_counts() == {(RENT, APARTMENT): 1}
@@ -0,0 +1,83 @@
+from collections import Counter
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from core.applications.property import services
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.geo import geohash_bounds
+from core.helpers.geo import geohash_cells
+from core.helpers.geo import geohash_encode
+
+pytestmark = pytest.mark.django_db
+
+POINTS = [(5.6037, -0.1870), (5.6698, -0.0166), (5.5600, -0.2050), (6.6885, -1.6244)]
+# west, south, east, north → (min_lat, min_lng, max_lat, max_lng)
+GHANA = (4.5, -3.5, 11.5, 1.5)
+
+
+@pytest.fixture
+def placed():
+    return [
+        PropertyFactory(latitude=Decimal(str(lat)), longitude=Decimal(str(lng)))
+        for lat, lng in POINTS
+    ]
+
+
+class TestGeohash:
+    def test_encode_matches_reference(self):
+        assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_bounds_contain_the_point(self):
+        min_lat, min_lng, max_lat, max_lng = geohash_bounds(geohash_encode(*POINTS[0], 6))
+
+        assert min_lat <= POINTS[0][0] <= max_lat
+        assert min_lng <= POINTS[0][1] <= max_lng
+
+    def test_cells_cover_the_box(self):
+        cells = geohash_cells(*GHANA, 3)
+
+        for lat, lng in POINTS:
+            assert geohash_encode(lat, lng, 3) in cells
+
+    def test_save_derives_geohash(self, placed):
+        prop = placed[0]
+        prop.latitude, prop.longitude = Decimal("6.6885"), Decimal("-1.6244")
+        prop.save(update_fields=["latitude", "longitude"])
+
+        stored = Property.objects.values_list("geohash", flat=True).get(pk=prop.pk)
+        assert stored == geohash_encode(6.6885, -1.6244)
+
+
+class TestPropertyClusters:
+    def test_clusters_group_by_cell(self, placed):
+        clusters = services.get_property_clusters(bbox=GHANA, zoom=8)
+
+        precision = len(clusters[0]["geohash"])
+        expected = Counter(geohash_encode(lat, lng, precision) for lat, lng in POINTS)
+        assert {c["geohash"]: c["count"] for c in clusters} == dict(expected)
+        assert sum(c["count"] for c in clusters) == len(POINTS)
+
+    def test_cells_are_cached(self, placed):
+        before = services.get_property_clusters(bbox=GHANA, zoom=8)
+        PropertyFactory(latitude=Decimal("5.6"), longitude=Decimal("-0.19"))
+
+        assert services.get_property_clusters(bbox=GHANA, zoom=8) == before
+
+    def test_filters_apply(self, placed):
+        placed[-1].bedrooms = 4
+        placed[-1].save()
+
+        clusters = services.get_property_clusters(bbox=GHANA, zoom=8, min_bedrooms=3)
+
+        assert [c["count"] for c in clusters] == [1]
+
+    def test_endpoint_requires_bbox_and_zoom(self, placed):
+        client = APIClient()
+
+        assert client.get("/api/v1/property/clusters/", {"zoom": 8}).status_code == 400
+        response = client.get("/api/v1/property/clusters/", {"bbox": "-3.5,4.5,1.5,11.5", "zoom": 8})
+        assert response.status_code == 200
+        assert sum(c["count"] for c in response.data) == len(POINTS)
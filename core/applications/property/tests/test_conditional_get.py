@@ -0,0 +1,100 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.applications.property.tests.factories import PropertyFactory
+
+pytestmark = pytest.mark.django_db
+
+LIST_URL = "/api/v1/property/"
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+def _listing_queries(queries) -> list[str]:
+    return [q["sql"] for q in queries if "property_property" in q["sql"]]
+
+
+class TestListValidator:
+    def test_unchanged_list_is_304_without_listing_queries(self, commit):
+        with commit():
+            PropertyFactory.create_batch(2)
+        client = APIClient()
+        etag = client.get(LIST_URL)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert _listing_queries(queries) == []
+
+    def test_listing_change_moves_the_etag(self, commit):
+        with commit():
+            prop = PropertyFactory()
+        client = APIClient()
+        etag = client.get(LIST_URL)["ETag"]
+
+        with commit():
+            prop.price = prop.price + 100
+            prop.save()
+
+        assert client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_deleted_listing_moves_the_etag(self, commit):
+        with commit():
+            prop = PropertyFactory()
+        client = APIClient()
+        etag = client.get(LIST_URL)["ETag"]
+
+        with commit():
+            prop.delete()
+
+        assert client.get(LIST_URL, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_query_string_is_part_of_the_etag(self, commit):
+        with commit():
+            PropertyFactory()
+        client = APIClient()
+
+        assert client.get(LIST_URL)["ETag"] != client.get(LIST_URL, {"min_bedrooms": 1})["ETag"]
+
+
+class TestDetailValidator:
+    def test_unchanged_detail_is_304(self):
+        prop = PropertyFactory()
+        client = APIClient()
+        url = f"{LIST_URL}{prop.slug}/"
+        etag = client.get(url)["ETag"]
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    def test_agent_rename_moves_the_etag(self):
+        prop = PropertyFactory()
+        client = APIClient()
+        url = f"{LIST_URL}{prop.slug}/"
+        first = client.get(url)
+
+        user = prop.agent.user
+        user.name = "Someone Else"
+        user.save()
+
+        second = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert second.status_code == 200
+        assert second["ETag"] != first["ETag"]
+
+    def test_agent_avatar_moves_the_etag(self):
+        prop = PropertyFactory()
+        client = APIClient()
+        url = f"{LIST_URL}{prop.slug}/"
+        etag = client.get(url)["ETag"]
+
+        agent = prop.agent
+        agent.profile_picture = SimpleUploadedFile("me.gif", b"GIF89a", content_type="image/gif")
+        agent.save()
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
@@ -0,0 +1,77 @@
+import pytest
+from django.db import DatabaseError
+
+from core.applications.property import services
+from core.applications.property.counters import repair_engagement_counters
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import FavoritePropertyFactory
+from core.applications.property.tests.factories import LeadFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.property.tests.factories import PropertyViewingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _counters(prop) -> dict:
+    return Property.objects.values("lead_count", "viewing_count", "favorite_count").get(pk=prop.pk)
+
+
+class TestEngagementCounters:
+    def test_counted_and_released(self):
+        prop = PropertyFactory()
+        lead = LeadFactory(property_link=prop, agent=prop.agent)
+        viewing = PropertyViewingFactory(property=prop)
+        favorite = FavoritePropertyFactory(property=prop)
+        assert _counters(prop) == {"lead_count": 1, "viewing_count": 1, "favorite_count": 1}
+
+        lead.delete()
+        viewing.delete()
+        favorite.delete()
+        assert _counters(prop) == {"lead_count": 0, "viewing_count": 0, "favorite_count": 0}
+
+    def test_stale_instance_save_keeps_the_counters(self):
+        prop = PropertyFactory()
+        stale = Property.objects.get(pk=prop.pk)
+
+        LeadFactory(property_link=prop, agent=prop.agent)
+        FavoritePropertyFactory(property=prop)
+        stale.title = "Renamed listing"
+        stale.save()
+
+        stored = Property.objects.get(pk=prop.pk)
+        assert stored.title == "Renamed listing"
+        assert (stored.lead_count, stored.favorite_count) == (1, 1)
+
+    def test_update_property_keeps_the_counters(self):
+        prop = PropertyFactory()
+        stale = Property.objects.get(pk=prop.pk)
+        PropertyViewingFactory(property=prop)
+
+        services.update_property(instance=stale, agent=prop.agent, validated_data={"bedrooms": 4})
+
+        assert Property.objects.get(pk=prop.pk).bedrooms == 4
+        assert _counters(prop)["viewing_count"] == 1
+
+    def test_named_counter_is_written(self):
+        prop = PropertyFactory()
+        prop.lead_count = 5
+
+        prop.save(update_fields=["lead_count"])
+
+        assert _counters(prop)["lead_count"] == 5
+
+    def test_full_save_of_a_deleted_listing_does_not_reinsert(self):
+        prop = PropertyFactory()
+        Property.objects.filter(pk=prop.pk).delete()
+
+        with pytest.raises(DatabaseError, match="did not affect any rows"):
+            prop.save()
+
+    def test_repair_fixes_drift(self):
+        prop = PropertyFactory()
+        FavoritePropertyFactory(property=prop)
+        Property.objects.update(lead_count=3, favorite_count=0)
+
+        assert repair_engagement_counters() == 1
+
+        assert _counters(prop) == {"lead_count": 0, "viewing_count": 0, "favorite_count": 1}
@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+
+import pytest
+from rest_framework.test import APIClient
+
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import LeadFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.exports import _csv_cell
+from core.helpers.exports import export_lines
+
+pytestmark = pytest.mark.django_db
+
+COLUMNS = {"title": "title", "location": "location", "price": "price"}
+
+
+def _csv(queryset) -> list[list[str]]:
+    return list(csv.reader(io.StringIO("".join(export_lines(queryset, COLUMNS, file_format="csv")))))
+
+
+class TestCsvCell:
+    @pytest.mark.parametrize(
+        "value",
+        ["=1+1", "+SUM(A1)", "-cmd|' /C calc'!A0", "+1+A1", "@SUM(A1)", "\tx", "\r1"],
+    )
+    def test_formula_prefixes_are_neutralised(self, value):
+        assert _csv_cell(value) == f"'{value}"
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "Flat in Osu",
+            "a=b",
+            "",
+            3,
+            -2,
+            "-12.5",
+            "+2348012345678",
+            "+234 801 234 5678",
+            "+1 (555) 010-0000",
+        ],
+    )
+    def test_other_values_are_unchanged(self, value):
+        assert _csv_cell(value) == value
+
+    def test_none_is_blank(self):
+        assert _csv_cell(None) == ""
+
+
+class TestExportLines:
+    def test_csv_neutralises_text_cells(self):
+        PropertyFactory(title='=HYPERLINK("http://evil.example","Flat")', location="@Osu")
+
+        header, row = _csv(Property.objects.all())
+
+        assert header == ["title", "location", "price"]
+        assert row == ["'=HYPERLINK(\"http://evil.example\",\"Flat\")", "'@Osu", "1500.00"]
+
+    def test_ndjson_keeps_the_raw_values(self):
+        PropertyFactory(title="=1+1")
+
+        lines = "".join(export_lines(Property.objects.all(), COLUMNS, file_format="ndjson"))
+
+        assert json.loads(lines)["title"] == "=1+1"
+
+    def test_agent_download_is_neutralised(self):
+        prop = PropertyFactory(title="-cmd")
+        client = APIClient()
+        client.force_authenticate(prop.agent.user)
+
+        response = client.get("/api/v1/property/export/", {"fields": "title"})
+
+        body = b"".join(response.streaming_content).decode()
+        assert response.status_code == 200
+        assert body.splitlines() == ["title", "'-cmd"]
+
+    def test_lead_phone_numbers_are_kept(self):
+        prop = PropertyFactory()
+        lead = LeadFactory(property_link=prop, agent=prop.agent)
+        lead.user.phone_number = "+2348012345678"
+        lead.user.save()
+        client = APIClient()
+        client.force_authenticate(prop.agent.user)
+
+        response = client.get("/api/v1/property/export/leads/", {"fields": "user_phone_number"})
+
+        body = b"".join(response.streaming_content).decode()
+        assert body.splitlines() == ["user_phone_number", "+2348012345678"]
@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.applications.property import services
+from core.applications.property.tests.factories import AmenityFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.enums import PropertyListingType
+from core.helpers.enums import PropertyTypeChoices
+
+pytestmark = pytest.mark.django_db
+
+
+def _count(facets, group, value, *, key="value"):
+    return next(item["count"] for item in facets[group] if item[key] == value)
+
+
+@pytest.fixture
+def listings():
+    AmenityFactory(name="Gym")
+    rent = PropertyFactory(bedrooms=2, bathrooms=1, price=Decimal("150000"))
+    rent.amenities.add(AmenityFactory(name="Pool"))
+    PropertyFactory(bedrooms=6, bathrooms=3, price=Decimal("2000000"))
+    PropertyFactory(
+        property_listing=PropertyListingType.FOR_SALE,
+        property_type=PropertyTypeChoices.HOUSE,
+        bedrooms=3,
+        price=Decimal("25000000"),
+    )
+    PropertyFactory(visible=False)
+
+
+class TestPropertyFacets:
+    def test_counts_every_group_over_visible_rows(self, listings):
+        facets = services.get_property_facets()
+
+        assert facets["total"] == 3
+        assert _count(facets, "listing_types", PropertyListingType.RENT) == 2
+        assert _count(facets, "listing_types", PropertyListingType.FOR_SALE) == 1
+        assert _count(facets, "property_types", PropertyTypeChoices.HOUSE) == 1
+        assert _count(facets, "bedrooms", 2) == 1
+        assert _count(facets, "bedrooms", 5) == 1  # "5+"
+        assert _count(facets, "bathrooms", 1) == 3
+        assert _count(facets, "bathrooms", 3) == 1
+        assert _count(facets, "amenities", "Pool", key="label") == 1
+        assert _count(facets, "amenities", "Gym", key="label") == 0
+
+        rent_bands = {band["label"]: band["count"] for band in facets["price_ranges"]["Rent"]}
+        assert rent_bands["Under ₦200,000/month"] == 1
+        assert rent_bands["Above ₦1,000,000/month"] == 1
+
+    def test_counts_follow_the_filters(self, listings):
+        facets = services.get_property_facets(listing_type=PropertyListingType.RENT)
+
+        assert facets["total"] == 2
+        assert _count(facets, "listing_types", PropertyListingType.FOR_SALE) == 0
+
+    def test_one_aggregate_then_cached(self, listings):
+        with CaptureQueriesContext(connection) as queries:
+            services.get_property_facets(min_bedrooms=2)
+        # Amenity names, then the single aggregate.
+        assert len(queries) == 2
+
+        PropertyFactory(bedrooms=4)
+        with CaptureQueriesContext(connection) as queries:
+            facets = services.get_property_facets(min_bedrooms="2")
+        assert len(queries) == 0
+        assert facets["total"] == 3
+
+    def test_endpoint_accepts_listing_filters(self, listings):
+        response = APIClient().get("/api/v1/property/facets/", {"min_bedrooms": 3})
+
+        assert response.status_code == 200
+        assert response.data["total"] == 2
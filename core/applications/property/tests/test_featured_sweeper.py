@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.subscriptions.models import FeaturedListing
+from core.applications.subscriptions.services import boost
+from core.applications.subscriptions.tasks import expire_featured_listings
+
+pytestmark = pytest.mark.django_db
+
+
+def _boost(prop, *, days: int | None = 7) -> FeaturedListing:
+    end_date = timezone.now() + timedelta(days=days) if days is not None else None
+    return FeaturedListing.objects.create(property=prop, agent=prop.agent, end_date=end_date)
+
+
+def _lapse(*boosts: FeaturedListing) -> None:
+    # Time passing: QuerySet.update() does not resync the property.
+    FeaturedListing.objects.filter(pk__in=[b.pk for b in boosts]).update(
+        end_date=timezone.now() - timedelta(minutes=1),
+    )
+
+
+def _featured(prop) -> tuple:
+    return Property.objects.values_list("is_featured", "featured_until").get(pk=prop.pk)
+
+
+class TestFeaturedFlags:
+    def test_boost_features_the_property(self):
+        prop = PropertyFactory()
+
+        featured = _boost(prop)
+
+        assert _featured(prop) == (True, featured.end_date)
+
+    def test_open_ended_boost_wins_over_dated_ones(self):
+        prop = PropertyFactory()
+        _boost(prop)
+
+        _boost(prop, days=None)
+
+        assert _featured(prop) == (True, None)
+
+    def test_deleted_boost_unfeatures_the_property(self):
+        prop = PropertyFactory()
+        featured = _boost(prop)
+
+        featured.delete()
+
+        assert _featured(prop) == (False, None)
+
+
+class TestExpirySweeper:
+    def test_expired_boosts_are_deactivated(self):
+        prop = PropertyFactory()
+        _lapse(_boost(prop))
+        assert _featured(prop)[0] is True
+
+        assert boost.deactivate_expired_boosts() == 1
+
+        assert _featured(prop) == (False, None)
+        assert not FeaturedListing.objects.filter(is_active=True).exists()
+
+    def test_live_boost_keeps_the_property_featured(self):
+        prop = PropertyFactory()
+        live = _boost(prop, days=3)
+        _lapse(_boost(prop, days=1))
+
+        assert boost.deactivate_expired_boosts() == 1
+
+        assert _featured(prop) == (True, live.end_date)
+
+    def test_open_ended_boosts_never_expire(self):
+        _boost(PropertyFactory(), days=None)
+
+        assert boost.deactivate_expired_boosts() == 0
+
+    def test_works_through_every_batch(self):
+        boosts = [_boost(prop) for prop in PropertyFactory.create_batch(5)]
+        _lapse(*boosts)
+
+        assert boost.deactivate_expired_boosts(batch_size=2) == 5
+
+        assert not Property.objects.filter(is_featured=True).exists()
+
+    def test_home_page_invalidated_only_when_something_expired(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(boost, "invalidate_home_page", lambda: calls.append(True))
+
+        boost.deactivate_expired_boosts()
+        assert calls == []
+
+        _lapse(_boost(PropertyFactory()))
+        boost.deactivate_expired_boosts()
+        assert calls == [True]
+
+    def test_periodic_task_runs_the_sweep(self):
+        prop = PropertyFactory()
+        _lapse(_boost(prop))
+
+        expire_featured_listings.delay()
+
+        assert _featured(prop) == (False, None)
@@ -0,0 +1,233 @@
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.applications.property import gallery
+from core.applications.property.models import PropertyImage
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.property.tests.factories import PropertyImageFactory
+from core.applications.property.tests.factories import image_upload
+from core.helpers.enums import VerificationStatusChoices
+from core.helpers.service_errors import ServiceValidationError
+from core.helpers.service_errors import SubscriptionLimitError
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+@pytest.fixture
+def stored_files(settings):
+    return lambda: sorted(path for path in Path(settings.MEDIA_ROOT).rglob("*") if path.is_file())
+
+
+def _owner_client(prop) -> APIClient:
+    prop.agent.verification_status = VerificationStatusChoices.VERIFIED
+    prop.agent.save()
+    client = APIClient()
+    client.force_authenticate(prop.agent.user)
+    return client
+
+
+def _orders(prop) -> list[int]:
+    return list(PropertyImage.objects.filter(property=prop).order_by("order").values_list("order", flat=True))
+
+
+class TestAddGalleryImages:
+    def test_batch_is_appended_after_the_existing_images(self):
+        prop = PropertyFactory()
+        PropertyImageFactory(property=prop, order=4)
+
+        images = gallery.add_gallery_images(prop, [image_upload("a.png"), image_upload("b.png", color="blue")])
+
+        assert [image.order for image in images] == [5, 6]
+        assert _orders(prop) == [4, 5, 6]
+        assert all(image.content_hash for image in images)
+        assert all(image.image.storage.exists(image.image.name) for image in images)
+
+    def test_rows_are_inserted_with_one_query(self):
+        prop = PropertyFactory()
+        files = [image_upload(f"{n}.png") for n in range(3)]
+
+        with CaptureQueriesContext(connection) as queries:
+            gallery.add_gallery_images(prop, files)
+
+        inserts = [q["sql"] for q in queries if q["sql"].startswith('INSERT INTO "property_propertyimage"')]
+        assert len(inserts) == 1
+
+    def test_cap_is_checked_before_anything_is_stored(self, stored_files):
+        prop = PropertyFactory()
+        PropertyImageFactory.create_batch(2, property=prop)
+        before = stored_files()
+
+        with pytest.raises(SubscriptionLimitError, match="room for 1 more"):
+            gallery.add_gallery_images(prop, [image_upload("a.png"), image_upload("b.png")])
+
+        assert stored_files() == before
+        assert len(_orders(prop)) == 2
+
+    def test_full_gallery_message(self):
+        prop = PropertyFactory()
+        PropertyImageFactory.create_batch(3, property=prop)
+
+        with pytest.raises(SubscriptionLimitError, match="reached your images per property limit"):
+            gallery.add_gallery_images(prop, [image_upload()])
+
+    def test_failed_upload_leaves_nothing_behind(self, monkeypatch, stored_files):
+        prop = PropertyFactory()
+        storage = PropertyImage._meta.get_field("image").storage
+        save = storage.save
+
+        def flaky(name, content, max_length=None):
+            if content.name == "bad.png":
+                raise OSError("disk full")
+            return save(name, content, max_length=max_length)
+
+        monkeypatch.setattr(storage, "save", flaky)
+
+        with pytest.raises(OSError, match="disk full"):
+            gallery.add_gallery_images(prop, [image_upload("good.png"), image_upload("bad.png")])
+
+        assert stored_files() == []
+        assert not PropertyImage.objects.filter(property=prop).exists()
+
+    def test_renditions_are_queued_after_commit(self, commit):
+        prop = PropertyFactory()
+
+        with commit():
+            image, = gallery.add_gallery_images(prop, [image_upload()])
+
+        image.refresh_from_db()
+        assert image.renditions["card"]["width"] == 64
+
+    def test_upload_endpoint(self):
+        prop = PropertyFactory()
+
+        response = _owner_client(prop).post(
+            f"/api/v1/property/{prop.slug}/images/",
+            {"images": [image_upload("a.png"), image_upload("b.png")]},
+            format="multipart",
+        )
+
+        assert response.status_code == 201
+        assert [item["order"] for item in response.data] == [0, 1]
+
+    def test_upload_endpoint_reports_the_cap(self):
+        prop = PropertyFactory()
+
+        response = _owner_client(prop).post(
+            f"/api/v1/property/{prop.slug}/images/",
+            {"images": [image_upload(f"{n}.png") for n in range(4)]},
+            format="multipart",
+        )
+
+        assert response.status_code == 400
+        assert not PropertyImage.objects.filter(property=prop).exists()
+
+
+@pytest.fixture
+def listing():
+    prop = PropertyFactory()
+    gallery.add_gallery_images(
+        prop,
+        [image_upload("a.png", color="red"), image_upload("b.png", color="blue")],
+    )
+    return prop
+
+
+IMAGE_WRITES = (
+    'INSERT INTO "property_propertyimage"',
+    'UPDATE "property_propertyimage"',
+    'DELETE FROM "property_propertyimage"',
+)
+
+
+def _gallery(prop) -> list[PropertyImage]:
+    return list(PropertyImage.objects.filter(property=prop).order_by("order"))
+
+
+class TestSyncGallery:
+    def test_unknown_or_repeated_ids_are_rejected(self, listing):
+        first, _ = _gallery(listing)
+        foreign = PropertyImageFactory()
+
+        with pytest.raises(ServiceValidationError) as exc:
+            gallery.sync_gallery(listing, [{"id": first.pk}, {"id": first.pk}, {"id": foreign.pk}])
+
+        assert len(exc.value.errors["images"]) == 2
+        assert len(_gallery(listing)) == 2
+
+    def test_reorder_only_is_one_bulk_update(self, listing, stored_files):
+        first, second = _gallery(listing)
+        before = stored_files()
+
+        with CaptureQueriesContext(connection) as queries:
+            gallery.sync_gallery(listing, [{"id": second.pk}, {"id": first.pk}])
+
+        image_writes = [q["sql"] for q in queries if q["sql"].startswith(IMAGE_WRITES)]
+        assert len(image_writes) == 1
+        assert image_writes[0].startswith('UPDATE "property_propertyimage"')
+        assert stored_files() == before
+        assert [image.pk for image in _gallery(listing)] == [second.pk, first.pk]
+
+    def test_unchanged_gallery_writes_nothing(self, listing):
+        first, second = _gallery(listing)
+
+        with CaptureQueriesContext(connection) as queries:
+            gallery.sync_gallery(listing, [{"id": first.pk}, {"id": second.pk}])
+
+        assert not [q for q in queries if q["sql"].startswith(("INSERT", "UPDATE", "DELETE"))]
+
+    def test_upload_matching_an_unclaimed_row_keeps_it(self, listing, stored_files):
+        first, second = _gallery(listing)
+        before = stored_files()
+
+        gallery.sync_gallery(listing, [{"id": second.pk}, {"image": image_upload("again.png", color="red")}])
+
+        assert [image.pk for image in _gallery(listing)] == [second.pk, first.pk]
+        assert stored_files() == before
+
+    def test_unlisted_images_are_removed_and_new_files_stored(self, listing):
+        first, second = _gallery(listing)
+
+        gallery.sync_gallery(listing, [{"image": image_upload("new.png", color="green")}, {"id": first.pk}])
+
+        images = _gallery(listing)
+        assert [image.pk for image in images][1:] == [first.pk]
+        assert images[0].pk != second.pk
+        assert not PropertyImage.objects.filter(pk=second.pk).exists()
+
+    def test_cap_counts_the_kept_images_only(self, listing):
+        first, _ = _gallery(listing)
+        PropertyImageFactory(property=listing, order=9)
+        new = [{"image": image_upload(f"{n}.png", color=color)} for n, color in enumerate(["green", "white"])]
+
+        gallery.sync_gallery(listing, [{"id": first.pk}, *new])
+
+        assert len(_gallery(listing)) == 3
+
+    def test_cap_is_enforced(self, listing):
+        first, second = _gallery(listing)
+
+        new = [{"image": image_upload(f"{n}.png", color=color)} for n, color in enumerate(["green", "white"])]
+
+        with pytest.raises(SubscriptionLimitError):
+            gallery.sync_gallery(listing, [{"id": first.pk}, {"id": second.pk}, *new])
+
+        assert len(_gallery(listing)) == 2
+
+    def test_takes_the_property_row_lock(self, listing):
+        first, _ = _gallery(listing)
+
+        with CaptureQueriesContext(connection) as queries:
+            gallery.sync_gallery(listing, [{"id": first.pk}])
+
+        locks = [q["sql"] for q in queries if q["sql"].endswith("FOR NO KEY UPDATE")]
+        assert len(locks) == 1
+        assert 'FROM "property_property"' in locks[0]
@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+import pytest
+from rest_framework.test import APIClient
+
+from core.applications.property import services
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.geo import bounding_box
+from core.helpers.geo import haversine_km
+from core.helpers.geo import parse_bbox
+
+pytestmark = pytest.mark.django_db
+
+ACCRA = (5.6037, -0.1870)
+TEMA = (5.6698, -0.0166)
+KUMASI = (6.6885, -1.6244)
+
+
+def _place(title, point):
+    lat, lng = point
+    return PropertyFactory(title=title, latitude=Decimal(str(lat)), longitude=Decimal(str(lng)))
+
+
+@pytest.fixture
+def places():
+    _place("Accra", ACCRA)
+    _place("Tema", TEMA)
+    _place("Kumasi", KUMASI)
+    PropertyFactory(title="Unplaced")
+
+
+class TestGeoHelpers:
+    def test_haversine_distance(self):
+        assert haversine_km(*ACCRA, *KUMASI) == pytest.approx(200, abs=5)
+        assert haversine_km(*ACCRA, *ACCRA) == 0
+
+    def test_bounding_box_encloses_the_radius(self):
+        min_lat, min_lng, max_lat, max_lng = bounding_box(*ACCRA, 25)
+
+        assert min_lat < TEMA[0] < max_lat
+        assert min_lng < TEMA[1] < max_lng
+        assert not min_lat < KUMASI[0] < max_lat
+
+    def test_parse_bbox_reorders_and_validates(self):
+        assert parse_bbox("-1,5,0,6") == (5.0, -1.0, 6.0, 0.0)
+        with pytest.raises(ValueError):
+            parse_bbox("0,5,-1,6")  # west > east
+        with pytest.raises(ValueError):
+            parse_bbox("1,2,3")
+
+
+class TestGeoSearch:
+    def test_radius_search_orders_by_distance(self, places):
+        qs = services.get_property_list(user=None, lat=ACCRA[0], lng=ACCRA[1], radius_km=30)
+
+        rows = list(qs)
+        assert [p.title for p in rows] == ["Accra", "Tema"]
+        assert rows[1].distance_km == pytest.approx(haversine_km(*ACCRA, *TEMA), rel=1e-6)
+
+    def test_point_without_radius_annotates_distance(self, places):
+        qs = services.get_property_list(user=None, lat=KUMASI[0], lng=KUMASI[1])
+
+        assert [p.title for p in qs][:3] == ["Kumasi", "Accra", "Tema"]
+
+    def test_bbox_endpoint(self, places):
+        response = APIClient().get("/api/v1/property/", {"bbox": "-0.3,5.5,0.1,5.8"})
+
+        assert response.status_code == 200
+        assert {card["title"] for card in response.data["results"]} == {"Accra", "Tema"}
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"lat": "5.6"}, {"radius_km": "5"}, {"lat": "5.6", "lng": "x"}, {"bbox": "1,2,3"}],
+    )
+    def test_malformed_geo_params_are_rejected(self, params):
+        assert APIClient().get("/api/v1/property/", params).status_code == 400
@@ -0,0 +1,68 @@
+from uuid import UUID
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.applications.property import home_page
+from core.applications.property.tests.factories import FavoritePropertyFactory
+from core.applications.property.tests.factories import PropertyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+class TestHomePageCache:
+    def test_builds_once_until_invalidated(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return len(calls)
+
+        assert home_page.cached("test", build) == 1
+        assert home_page.cached("test", build) == 1
+        home_page.invalidate_home_page()
+        assert home_page.cached("test", build) == 2
+
+    def test_parts_are_separate_entries(self):
+        assert home_page.cached("test", lambda: "a", "host-a") == "a"
+        assert home_page.cached("test", lambda: "b", "host-b") == "b"
+
+    def test_property_save_invalidates_after_commit(self, django_capture_on_commit_callbacks):
+        home_page.cached("test", lambda: "stale")
+        prop = PropertyFactory()
+
+        # Not before the transaction commits.
+        assert home_page.cached("test", lambda: "fresh") == "stale"
+        with django_capture_on_commit_callbacks(execute=True):
+            prop.save()
+        assert home_page.cached("test", lambda: "fresh") == "fresh"
+
+    def test_overlay_copies_cards(self, user):
+        favorite = FavoritePropertyFactory(user=user)
+        other = PropertyFactory()
+        cards = [
+            {"id": str(UUID(str(favorite.property.pk))), "is_favorited": False},
+            {"id": str(UUID(str(other.pk))), "is_favorited": False},
+        ]
+
+        overlaid = home_page.overlay_favorites(cards, user=user)
+
+        assert [card["is_favorited"] for card in overlaid] == [True, False]
+        assert not cards[0]["is_favorited"]
+
+
+class TestHomePageView:
+    def test_second_anonymous_request_skips_the_database(self):
+        PropertyFactory.create_batch(2)
+        client = APIClient()
+        first = client.get("/api/v1/home/")
+
+        with CaptureQueriesContext(connection) as queries:
+            second = client.get("/api/v1/home/")
+
+        assert second.status_code == 200
+        assert second.data == first.data
+        # Only ATOMIC_REQUESTS' savepoint remains.
+        assert not [q for q in queries if "SAVEPOINT" not in q["sql"]]
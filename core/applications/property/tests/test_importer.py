@@ -0,0 +1,194 @@
+import json
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APIClient
+
+from core.applications.property import importer
+from core.applications.property.models import ListingCategoryCounter
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.slugs import allocate_slugs
+from core.applications.property.tests.factories import AgentProfileFactory
+from core.applications.property.tests.factories import AmenityFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.users.models import AgentProfile
+from core.helpers.enums import PropertyListingType
+from core.helpers.enums import PropertyTypeChoices
+from core.helpers.enums import VerificationStatusChoices
+
+pytestmark = pytest.mark.django_db
+
+HEADER = "title,description,bathrooms,property_type,property_listing,price,location,latitude,longitude,bedrooms,sqft,amenities,images"
+
+
+def _row(title: str, **overrides) -> dict:
+    return {
+        "title": title,
+        "description": "Imported listing",
+        "property_type": PropertyTypeChoices.APARTMENT,
+        "property_listing": PropertyListingType.RENT,
+        "price": "1200.00",
+        "location": "Osu, Accra",
+        "bedrooms": 2,
+        "bathrooms": 1,
+        "sqft": 800,
+        **overrides,
+    }
+
+
+def _import(content: str, file_format: str, agent, **kwargs) -> importer.ImportReport:
+    return importer.import_properties(
+        BytesIO(content.encode()),
+        agent=agent,
+        file_format=file_format,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def agent():
+    return AgentProfileFactory()
+
+
+@pytest.fixture
+def agent_client(agent):
+    agent.verification_status = VerificationStatusChoices.VERIFIED
+    agent.save()
+    client = APIClient()
+    client.force_authenticate(agent.user)
+    return client
+
+
+class TestImportProperties:
+    def test_csv_rows_are_saved_with_derived_columns(self, agent):
+        AmenityFactory(name="Pool")
+        AmenityFactory(name="Gym")
+        content = "\n".join(
+            [
+                HEADER,
+                "Sea view flat,Bright,2,apartment,Rent,1500,Osu Accra,5.55,-0.18,3,1100,pool|GYM,a.jpg|b.jpg",
+                "Plain flat,Small,1,apartment,Rent,900,Osu Accra,,,1,500,,",
+            ],
+        )
+
+        report = _import(content, "csv", agent)
+
+        assert report.errors == []
+        assert (report.rows, report.created) == (2, 2)
+        prop = Property.objects.get(title="Sea view flat")
+        assert prop.slug == "sea-view-flat"
+        assert prop.geohash
+        assert prop.search_vector is not None
+        assert sorted(map(str, prop.amenity_ids)) == sorted(map(str, prop.amenities.values_list("pk", flat=True)))
+        assert set(prop.amenities.values_list("name", flat=True)) == {"Pool", "Gym"}
+        assert list(PropertyImage.objects.filter(property=prop).values_list("image", "order")) == [
+            ("a.jpg", 0),
+            ("b.jpg", 1),
+        ]
+
+    def test_counters_are_updated_per_chunk(self, agent):
+        rows = [_row(f"Flat {n}") for n in range(3)]
+
+        _import(json.dumps(rows), "json", agent, chunk_size=2)
+
+        counts = AgentProfile.objects.values_list("total_listings", "active_listings").get(pk=agent.pk)
+        assert counts == (3, 3)
+        counter = ListingCategoryCounter.objects.get(
+            property_listing=PropertyListingType.RENT,
+            property_type=PropertyTypeChoices.APARTMENT,
+        )
+        assert counter.count == 3
+
+    def test_rejected_rows_are_reported_by_number(self, agent):
+        content = "\n".join(
+            [
+                json.dumps(_row("Good")),
+                json.dumps(_row("Bad price", price="lots")),
+                "{not json",
+                json.dumps(_row("Unknown amenity", amenities=["Helipad"])),
+                json.dumps(["not", "an", "object"]),
+                json.dumps(_row("Also good")),
+            ],
+        )
+
+        report = _import(content, "ndjson", agent)
+
+        assert (report.rows, report.created) == (6, 2)
+        assert [error["row"] for error in report.errors] == [2, 3, 4, 5]
+        assert "price" in report.errors[0]["errors"]
+        assert report.errors[2]["errors"] == {"amenities": ["Unknown amenity: Helipad"]}
+        assert set(Property.objects.values_list("title", flat=True)) == {"Good", "Also good"}
+
+    def test_csv_row_with_extra_cells_is_rejected(self, agent):
+        content = f"{HEADER}\nFlat,Small,1,apartment,Rent,900,Osu,,,1,500,,,extra\n"
+
+        report = _import(content, "csv", agent)
+
+        assert report.created == 0
+        assert report.errors[0]["row"] == 1
+
+    def test_dry_run_saves_nothing(self, agent):
+        report = _import(json.dumps([_row("Flat")]), "json", agent, dry_run=True)
+
+        assert report.created == 1
+        assert not Property.objects.exists()
+
+    def test_unreadable_file_raises(self, agent):
+        with pytest.raises(importer.ImportFormatError):
+            _import('{"title": "not an array"}', "json", agent)
+        with pytest.raises(importer.ImportFormatError):
+            importer.detect_format("listings.xlsx")
+
+    def test_plan_limit_is_enforced_in_memory(self, agent):
+        PropertyFactory.create_batch(9, agent=agent)
+        rows = [_row(f"Flat {n}") for n in range(3)]
+
+        report = _import(json.dumps(rows), "json", agent)
+
+        assert report.created == 1
+        assert [error["row"] for error in report.errors] == [2, 3]
+        assert "property listings" in report.errors[0]["errors"]["non_field_errors"][0]
+        assert Property.objects.filter(agent=agent).count() == 10
+
+
+class TestInsertListings:
+    def test_slug_collision_is_retried(self, agent, monkeypatch):
+        rival = PropertyFactory(title="Rival")
+        calls = []
+
+        def racing(queryset, titles, *, exclude=()):
+            slugs = allocate_slugs(queryset, titles, exclude=exclude)
+            calls.append(set(exclude))
+            if len(calls) == 1:
+                # A concurrent create claims the first slug before the insert.
+                Property.objects.filter(pk=rival.pk).update(slug=slugs[0])
+            return slugs
+
+        monkeypatch.setattr(importer, "allocate_slugs", racing)
+
+        report = _import(json.dumps([_row("Flat"), _row("Loft")]), "json", agent)
+
+        assert report.created == 2
+        assert calls == [set(), {"flat"}]
+        assert set(Property.objects.filter(agent=agent).values_list("slug", flat=True)) == {"flat-1", "loft"}
+        assert AgentProfile.objects.get(pk=agent.pk).total_listings == 2
+
+
+class TestImportEndpoint:
+    def test_verified_agent_gets_the_report(self, agent_client):
+        upload = SimpleUploadedFile("listings.ndjson", json.dumps(_row("Flat")).encode())
+
+        response = agent_client.post("/api/v1/property/import/", {"file": upload}, format="multipart")
+
+        assert response.status_code == 200
+        assert response.data == {"rows": 1, "created": 1, "dry_run": False, "errors": []}
+
+    def test_unsupported_file_type_is_a_validation_error(self, agent_client):
+        upload = SimpleUploadedFile("listings.xlsx", b"title")
+
+        response = agent_client.post("/api/v1/property/import/", {"file": upload}, format="multipart")
+
+        assert response.status_code == 400
+        assert "Unsupported import file type" in str(response.data["file"][0])
@@ -0,0 +1,44 @@
+import pytest
+from django.db import connection
+
+from core.applications.property import services
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.enums import PropertyListingType
+
+pytestmark = pytest.mark.django_db
+
+
+def _plan(queryset) -> str:
+    with connection.cursor() as cursor:
+        # Tiny test tables are always cheaper to scan and sort; make the
+        # planner show which index it *can* use for the ordered read, with
+        # statistics that include the rows this test inserted.
+        cursor.execute("ANALYZE property_property")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute("SET LOCAL enable_sort = off")
+    return queryset.explain()
+
+
+class TestListingIndexes:
+    def test_default_listing_uses_recent_index(self):
+        PropertyFactory.create_batch(3)
+
+        plan = _plan(services.get_property_list(user=None, ordering=None)[:25])
+
+        assert "prop_live_recent_idx" in plan
+
+    def test_listing_type_filter_uses_listing_index(self):
+        PropertyFactory.create_batch(3)
+        PropertyFactory.create_batch(30, property_listing=PropertyListingType.FOR_SALE)
+
+        qs = services.get_property_list(user=None, ordering=None, listing_type="rent")
+
+        assert "prop_live_listing_recent_idx" in _plan(qs[:25])
+
+    def test_unavailable_listings_stay_public(self):
+        PropertyFactory(is_available=False, title="Let")
+        PropertyFactory(visible=False, title="Hidden")
+
+        titles = [p.title for p in services.get_property_list(user=None, ordering=None)]
+
+        assert titles == ["Let"]
@@ -0,0 +1,85 @@
+import pytest
+from django.db import connection
+
+from core.applications.notifications.models import Notification
+from core.applications.property.models import Property
+from core.applications.property.models import PropertySubscription
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.property.tests.factories import PropertySubscriptionFactory
+from core.helpers.enums import PropertyTypeChoices
+from core.utils.notifications import notify_new_property_listing
+from core.utils.utils import is_user_subscribed_for_property
+
+pytestmark = pytest.mark.django_db
+
+LISTING_LOCATION = "Lekki Phase 1, Lagos"
+
+
+def _subscribed(location, **kwargs):
+    return PropertySubscription.objects.matching(LISTING_LOCATION, None, **kwargs).filter(
+        location=location,
+    ).exists()
+
+
+class TestListingLocationFilter:
+    def test_fuzzy_match_tolerates_typos(self):
+        PropertyFactory(location=LISTING_LOCATION)
+        PropertyFactory(location="Wuse 2, Abuja")
+        assert not Property.objects.by_location("Lekki Phse 1").exists()
+        matches = Property.objects.by_location("Lekki Phse 1", fuzzy=True)
+        assert [prop.location for prop in matches] == [LISTING_LOCATION]
+
+    def test_threshold_is_applied_per_query(self):
+        PropertyFactory(location=LISTING_LOCATION)
+        assert not Property.objects.by_location("Lekki Phse 1", fuzzy=True, threshold=0.99).exists()
+
+    def test_connections_use_the_configured_operator_thresholds(self, settings):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT current_setting('pg_trgm.similarity_threshold'), "
+                "current_setting('pg_trgm.word_similarity_threshold')",
+            )
+            thresholds = cursor.fetchone()
+        expected = settings.PROPERTY_LOCATION_SIMILARITY_THRESHOLD
+        assert [float(value) for value in thresholds] == [expected, expected]
+
+
+class TestSubscriptionMatching:
+    def test_subscribed_location_contained_in_listing_location(self):
+        PropertySubscriptionFactory(location="lekki")
+        PropertySubscriptionFactory(location="Lekki Phase 1, Lagos, Nigeria")
+        assert _subscribed("lekki")
+        assert not _subscribed("Lekki Phase 1, Lagos, Nigeria")
+
+    def test_blank_location_is_a_wildcard(self):
+        PropertySubscriptionFactory(location=None)
+        PropertySubscriptionFactory(location="")
+        assert PropertySubscription.objects.matching(LISTING_LOCATION, None).count() == 2
+
+    def test_fuzzy_matches_misspelled_subscriptions(self):
+        PropertySubscriptionFactory(location="Lekki Phse 1")
+        PropertySubscriptionFactory(location="Wuse 2")
+        assert not _subscribed("Lekki Phse 1")
+        assert _subscribed("Lekki Phse 1", fuzzy=True)
+        assert not _subscribed("Wuse 2", fuzzy=True)
+
+    def test_property_type_must_match_unless_blank(self):
+        PropertySubscriptionFactory(location="Lekki", property_type=PropertyTypeChoices.APARTMENT)
+        PropertySubscriptionFactory(location="Lekki", property_type=None)
+        matches = PropertySubscription.objects.matching(LISTING_LOCATION, PropertyTypeChoices.HOUSE)
+        assert [sub.property_type for sub in matches] == [None]
+
+
+class TestNewListingAlerts:
+    def test_notifies_fuzzy_matching_subscribers_only(self):
+        typo = PropertySubscriptionFactory(location="Lekki Phse 1")
+        elsewhere = PropertySubscriptionFactory(location="Wuse 2")
+        prop = PropertyFactory(location=LISTING_LOCATION)
+
+        notify_new_property_listing(prop)
+
+        notified = set(Notification.objects.values_list("user_id", flat=True))
+        assert typo.user_id in notified
+        assert elsewhere.user_id not in notified
+        assert is_user_subscribed_for_property(typo.user, prop)
+        assert not is_user_subscribed_for_property(elsewhere.user, prop)
@@ -0,0 +1,144 @@
+from datetime import timedelta
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+from rest_framework.test import APIRequestFactory
+
+from core.applications.property.models import Property
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.paginations import CustomPagination
+from core.helpers.paginations import KeysetPagination
+from core.helpers.paginations import RowComparison
+
+pytestmark = pytest.mark.django_db
+
+
+def _paginate(queryset, cursor=None, limit=2):
+    params = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    request = Request(APIRequestFactory().get("/api/properties/", params))
+    paginator = KeysetPagination()
+    rows = paginator.paginate_queryset(queryset, request)
+    return paginator, [row.title for row in rows]
+
+
+def _cursor(link):
+    return parse_qs(urlsplit(link).query)["cursor"][0] if link else None
+
+
+@pytest.fixture
+def same_millisecond():
+    """Five listings created within one millisecond, 100µs apart."""
+    base = timezone.now().replace(microsecond=500000)
+    titles = []
+    for step in range(5):
+        prop = PropertyFactory()
+        Property.objects.filter(pk=prop.pk).update(
+            created_at=base + timedelta(microseconds=100 * step),
+        )
+        titles.append(prop.title)
+    return titles
+
+
+class TestKeysetPagination:
+    @pytest.mark.parametrize("ordering", ["created_at", "-created_at"])
+    def test_pages_forward_through_one_millisecond(self, same_millisecond, ordering):
+        queryset = Property.objects.order_by(ordering)
+        expected = same_millisecond if ordering == "created_at" else same_millisecond[::-1]
+
+        seen, cursor = [], None
+        while True:
+            paginator, titles = _paginate(queryset, cursor)
+            seen.extend(titles)
+            cursor = _cursor(paginator.get_next_link())
+            if cursor is None:
+                break
+
+        assert seen == expected
+
+    @pytest.mark.parametrize("ordering", ["created_at", "-created_at"])
+    def test_pages_backward_through_one_millisecond(self, same_millisecond, ordering):
+        queryset = Property.objects.order_by(ordering)
+        expected = same_millisecond if ordering == "created_at" else same_millisecond[::-1]
+
+        cursor = None
+        while True:
+            paginator, titles = _paginate(queryset, cursor)
+            next_cursor = _cursor(paginator.get_next_link())
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+
+        pages = [titles]
+        while cursor := _cursor(paginator.get_previous_link()):
+            paginator, titles = _paginate(queryset, cursor)
+            pages.insert(0, titles)
+        # The first page's "previous" link drops the cursor instead.
+        paginator, titles = _paginate(queryset)
+        pages.insert(0, titles)
+
+        seen = [title for page in pages for title in page]
+        assert list(dict.fromkeys(seen)) == expected
+
+    def test_uniform_direction_uses_row_comparison(self, same_millisecond):
+        paginator, _ = _paginate(Property.objects.order_by("-created_at"))
+        queryset = Property.objects.order_by("-created_at", "-id")
+        predicate = paginator._beyond(Property, ["-created_at", "-id"], [timezone.now(), uuid4()])
+
+        assert isinstance(predicate, RowComparison)
+        sql = str(queryset.filter(predicate).query)
+        assert '("property_property"."created_at", "property_property"."id") <' in sql
+
+    def test_mixed_directions_page_through_every_row(self, same_millisecond):
+        queryset = Property.objects.order_by("created_at", "-id")
+        paginator, _ = _paginate(queryset)
+        assert not isinstance(
+            paginator._beyond(Property, ["created_at", "-id"], [timezone.now(), uuid4()]),
+            RowComparison,
+        )
+
+        seen, cursor = [], None
+        while True:
+            paginator, titles = _paginate(queryset, cursor)
+            seen.extend(titles)
+            cursor = _cursor(paginator.get_next_link())
+            if cursor is None:
+                break
+
+        assert seen == same_millisecond
+
+    def test_malformed_cursor_value_is_not_found(self, same_millisecond):
+        paginator, _ = _paginate(Property.objects.order_by("-created_at"))
+        cursor = paginator.encode_cursor(["yesterday", "x"], reverse=False)
+
+        with pytest.raises(NotFound):
+            _paginate(Property.objects.order_by("-created_at"), cursor)
+
+
+class TestCachedCountPagination:
+    url = "/api/v1/property/"
+
+    def test_default_pagination_counts_exactly(self):
+        assert api_settings.DEFAULT_PAGINATION_CLASS is CustomPagination
+
+    def test_public_list_reports_cached_total(self):
+        PropertyFactory.create_batch(3)
+        client = APIClient()
+
+        first = client.get(self.url)
+        assert first.status_code == 200
+        assert first.data["total"] == 3
+        assert first.data["approximate"] is False
+
+        PropertyFactory()
+        assert client.get(self.url).data["total"] == 3
+        assert client.get(self.url, {"limit": 1}).data["total"] == 3
+        assert client.get(self.url, {"min_bedrooms": 2, "ordering": "price"}).data["total"] == 4
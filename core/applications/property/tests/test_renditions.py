@@ -0,0 +1,114 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from core.applications.property import renditions
+from core.applications.property.models import Property
+from core.applications.property.models import PropertyImage
+from core.applications.property.tests.factories import PropertyFactory
+from core.applications.property.tests.factories import PropertyImageFactory
+from core.applications.property.tests.factories import image_upload
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+def _size(storage, name: str) -> tuple[int, int]:
+    with storage.open(name) as fh:
+        return Image.open(fh).size
+
+
+class TestAvailableFormats:
+    def test_formats_without_an_encoder_are_skipped(self, monkeypatch):
+        Image.init()
+        monkeypatch.delitem(Image.SAVE, "AVIF", raising=False)
+
+        assert renditions.available_formats() == ("webp",)
+
+    def test_avif_comes_first_when_pillow_can_encode_it(self, monkeypatch):
+        Image.init()
+        monkeypatch.setitem(Image.SAVE, "AVIF", Image.SAVE["WEBP"])
+
+        assert renditions.available_formats() == ("avif", "webp")
+
+
+class TestRender:
+    def test_sizes_never_upscale(self):
+        image = PropertyImageFactory(image=image_upload(size=(500, 300)))
+
+        result = renditions.render(image.image)
+
+        assert list(result) == ["card", "gallery"]
+        assert result["card"]["width"] == 400
+        assert result["gallery"]["width"] == 500
+        storage = image.image.storage
+        assert _size(storage, result["card"]["webp"]) == (400, 240)
+        assert _size(storage, result["gallery"]["webp"]) == (500, 300)
+        assert result["card"]["webp"].endswith("-card.webp")
+
+    def test_rerender_replaces_the_files(self):
+        image = PropertyImageFactory()
+
+        first = renditions.render(image.image)
+        second = renditions.render(image.image)
+
+        assert first == second
+
+    def test_srcset_and_urls(self):
+        stored = {
+            "gallery": {"width": 1024, "webp": "g.webp"},
+            "card": {"width": 400, "webp": "c.webp"},
+        }
+
+        assert renditions.srcset(stored, "/m/{}".format) == {"webp": "/m/c.webp 400w, /m/g.webp 1024w"}
+        assert renditions.rendition_urls(stored, "/m/{}".format)["card"] == {"width": 400, "webp": "/m/c.webp"}
+
+
+class TestRenderTasks:
+    def test_uploads_are_rendered_after_commit(self, commit):
+        with commit():
+            prop = PropertyFactory(cover_image=image_upload("cover.png"))
+            image = PropertyImageFactory(property=prop)
+
+        image.refresh_from_db()
+        prop.refresh_from_db()
+        assert image.renditions["card"]["width"] == 64
+        assert prop.cover_renditions["card"]["width"] == 64
+
+    def test_replaced_file_drops_the_old_map(self, commit):
+        with commit():
+            image = PropertyImageFactory()
+        image.refresh_from_db()
+        assert image.renditions
+
+        image.image = image_upload("other.png")
+        image.save()
+
+        assert PropertyImage.objects.get(pk=image.pk).renditions == {}
+
+    def test_file_replaced_while_rendering_keeps_its_cleared_map(self, monkeypatch):
+        image = PropertyImageFactory()
+        written = []
+        render = renditions.render
+
+        def racing(field_file):
+            result = render(field_file)
+            written.extend(entry["webp"] for entry in result.values())
+            PropertyImage.objects.filter(pk=image.pk).update(image="elsewhere.png")
+            return result
+
+        monkeypatch.setattr(renditions, "render", racing)
+
+        assert renditions.render_images([image.pk]) == set()
+        assert PropertyImage.objects.get(pk=image.pk).renditions == {}
+        assert not any(image.image.storage.exists(name) for name in written)
+
+    def test_undecodable_file_is_skipped(self):
+        prop = PropertyFactory(cover_image=SimpleUploadedFile("cover.png", b"not an image"))
+
+        assert renditions.render_covers([prop.pk]) == set()
+        assert Property.objects.get(pk=prop.pk).cover_renditions == {}
@@ -0,0 +1,52 @@
+import pytest
+
+from core.applications.property import services
+from core.applications.property.models import Property
+from core.applications.property.querysets.property_queryset import SEARCH_MODE_CONTAINS
+from core.applications.property.tests.factories import PropertyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _titles(qs):
+    return [prop.title for prop in qs]
+
+
+class TestFullTextSearch:
+    def test_search_vector_is_maintained_on_save(self):
+        prop = PropertyFactory(title="Garden cottage")
+        assert _titles(Property.objects.search("cottage")) == ["Garden cottage"]
+
+        prop.title = "Penthouse suite"
+        prop.save()
+        assert not Property.objects.search("cottage").exists()
+        assert _titles(Property.objects.search("penthouse")) == ["Penthouse suite"]
+
+    def test_matches_stemmed_words(self):
+        PropertyFactory(title="Furnished apartment")
+        assert _titles(Property.objects.search("apartments")) == ["Furnished apartment"]
+
+    def test_websearch_syntax_excludes_terms(self):
+        PropertyFactory(title="Pool villa", description="Quiet street.")
+        PropertyFactory(title="Pool house", description="Shared gym.")
+        assert _titles(Property.objects.search("pool -gym")) == ["Pool villa"]
+
+    def test_title_hits_rank_above_description_hits(self):
+        PropertyFactory(title="Modern flat", description="Close to the beach.")
+        PropertyFactory(title="Beach house", description="Sea views.")
+        ranked = Property.objects.search("beach").order_by_relevance()
+        assert _titles(ranked) == ["Beach house", "Modern flat"]
+
+    def test_property_list_is_relevance_ordered_without_explicit_ordering(self):
+        PropertyFactory(title="Modern flat", description="Close to the beach.")
+        PropertyFactory(title="Beach house", description="Sea views.")
+        assert _titles(services.get_property_list(search="beach")) == ["Beach house", "Modern flat"]
+        assert _titles(services.get_property_list(search="beach", ordering="title")) == [
+            "Beach house",
+            "Modern flat",
+        ]
+
+    def test_contains_mode_matches_prefixes(self):
+        PropertyFactory(title="Lekki townhouse")
+        assert not Property.objects.search("Lek").exists()
+        assert _titles(Property.objects.search("Lek", mode=SEARCH_MODE_CONTAINS)) == ["Lekki townhouse"]
@@ -0,0 +1,113 @@
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from core.applications.property import services
+from core.applications.property.models import PropertySearchDocument
+from core.applications.property.search_documents import rebuild_documents
+from core.applications.property.tests.factories import AmenityFactory
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.enums import PropertyListingType
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    """Run on_commit callbacks (document syncs) as the block exits."""
+    return lambda: django_capture_on_commit_callbacks(execute=True)
+
+
+class TestSearchDocuments:
+    def test_saved_property_gets_flattened_document(self, commit):
+        pool = AmenityFactory()
+        with commit():
+            prop = PropertyFactory(price=Decimal("1800.00"), sqft=900)
+            prop.amenities.add(pool)
+
+        doc = PropertySearchDocument.objects.get(property_id=prop.pk)
+        assert doc.title == prop.title
+        assert doc.price_per_sqft == Decimal("2.00")
+        assert doc.agent_name == prop.agent.user.get_full_name()
+        assert doc.amenity_ids == [UUID(str(pool.pk))]
+
+    def test_hidden_property_loses_its_document(self, commit):
+        with commit():
+            prop = PropertyFactory()
+        with commit():
+            prop.visible = False
+            prop.save()
+
+        assert not PropertySearchDocument.objects.filter(property_id=prop.pk).exists()
+
+    def test_agent_rename_reaches_documents(self, commit):
+        with commit():
+            prop = PropertyFactory()
+        user = prop.agent.user
+        with commit():
+            user.name = "Renamed Agent"
+            user.save()
+
+        doc = PropertySearchDocument.objects.get(property_id=prop.pk)
+        assert doc.agent_name == user.get_full_name()
+
+    def test_document_listing_applies_filters(self, commit):
+        with commit():
+            PropertyFactory(title="Rental", property_listing=PropertyListingType.RENT)
+            PropertyFactory(title="For sale", property_listing=PropertyListingType.FOR_SALE)
+
+        qs = services.get_property_list(
+            user=None,
+            source="document",
+            listing_type=PropertyListingType.FOR_SALE,
+        )
+
+        assert [doc.title for doc in qs] == ["For sale"]
+
+    @pytest.mark.parametrize("mode", ["contains", "fts"])
+    def test_search_matches_the_same_listings_on_both_sources(self, commit, mode):
+        with commit():
+            PropertyFactory(title="Garden flat", description="Quiet street.")
+            PropertyFactory(title="Loft", description="Rooftop garden and gym.")
+            PropertyFactory(title="Studio", description="Close to the mall.")
+
+        titles = {
+            source: sorted(
+                item.title
+                for item in services.get_property_list(
+                    user=None,
+                    source=source,
+                    search="garden",
+                    search_mode=mode,
+                )
+            )
+            for source in ("property", "document")
+        }
+
+        assert titles["document"] == titles["property"] == ["Garden flat", "Loft"]
+
+    def test_description_edit_reaches_the_document(self, commit):
+        with commit():
+            prop = PropertyFactory(description="Quiet street.")
+        with commit():
+            prop.description = "Now with a rooftop garden."
+            prop.save()
+
+        qs = services.get_property_list(user=None, source="document", search="rooft", search_mode="contains")
+
+        assert [doc.title for doc in qs] == [prop.title]
+
+    def test_rebuild_repairs_drift(self, commit):
+        with commit():
+            kept = PropertyFactory()
+            hidden = PropertyFactory()
+        PropertySearchDocument.objects.filter(property_id=kept.pk).delete()
+        hidden.__class__.objects.filter(pk=hidden.pk).update(visible=False)
+
+        written = rebuild_documents(batch_size=1)
+
+        assert written == 1
+        assert list(
+            PropertySearchDocument.objects.values_list("title", flat=True),
+        ) == [kept.title]
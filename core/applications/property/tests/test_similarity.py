@@ -0,0 +1,107 @@
+from decimal import Decimal
+
+import pytest
+
+from core.applications.property import services
+from core.applications.property.models import Property
+from core.applications.property.models import SimilarProperty
+from core.applications.property.similarity import rebuild_similar
+from core.applications.property.similarity import refresh_similar
+from core.applications.property.tests.factories import PropertyFactory
+from core.helpers.enums import PropertyListingType
+from core.helpers.enums import PropertyTypeChoices
+
+pytestmark = pytest.mark.django_db
+
+
+def _flat(title, **kwargs):
+    return PropertyFactory(
+        title=title,
+        location="Lekki Phase 1, Lagos",
+        description="Bright two bedroom flat with a balcony and sea view.",
+        **kwargs,
+    )
+
+
+def _neighbours(prop) -> list[str]:
+    return list(
+        SimilarProperty.objects.filter(property_id=prop.pk)
+        .order_by("rank")
+        .values_list("similar__title", flat=True),
+    )
+
+
+@pytest.fixture
+def pool():
+    flat = _flat("Flat")
+    _flat("Twin flat", price=Decimal("1600.00"))
+    PropertyFactory(
+        title="Mansion",
+        property_type=PropertyTypeChoices.HOUSE,
+        location="Airport Residential, Accra",
+        description="Detached family home with garden, pool and staff quarters.",
+        bedrooms=6,
+        bathrooms=5,
+        sqft=6000,
+        price=Decimal("30000.00"),
+    )
+    _flat("Flat for sale", property_listing=PropertyListingType.FOR_SALE)
+    return flat
+
+
+class TestSimilarProperties:
+    def test_rebuild_ranks_within_listing_type(self, pool):
+        rebuild_similar(k=5)
+
+        assert _neighbours(pool) == ["Twin flat", "Mansion"]
+        sale = Property.objects.get(title="Flat for sale")
+        assert _neighbours(sale) == []
+
+    def test_scores_are_ranked_and_bounded(self, pool):
+        rebuild_similar(k=5)
+
+        scores = list(
+            SimilarProperty.objects.filter(property_id=pool.pk)
+            .order_by("rank")
+            .values_list("score", flat=True),
+        )
+        assert scores == sorted(scores, reverse=True)
+        assert all(0 <= score <= 1 + 1e-6 for score in scores)
+
+    def test_refresh_slots_a_new_listing_in(self, pool):
+        rebuild_similar(k=1)
+        assert _neighbours(pool) == ["Twin flat"]
+        twin = _flat("Closer twin", price=pool.price)
+
+        refresh_similar(twin.pk, k=1)
+
+        assert _neighbours(twin) == ["Flat"]
+        assert _neighbours(pool) == ["Closer twin"]
+
+    def test_new_listing_joins_an_empty_list(self):
+        first = _flat("First")
+        refresh_similar(first.pk, k=5)
+        assert _neighbours(first) == []
+
+        second = _flat("Second")
+        refresh_similar(second.pk, k=5)
+
+        assert _neighbours(second) == ["First"]
+        assert _neighbours(first) == ["Second"]
+
+    def test_hidden_listing_drops_out(self, pool):
+        rebuild_similar(k=5)
+        twin = Property.objects.get(title="Twin flat")
+        Property.objects.filter(pk=twin.pk).update(visible=False)
+
+        refresh_similar(twin.pk)
+
+        assert "Twin flat" not in _neighbours(pool)
+        assert _neighbours(twin) == []
+
+    def test_detail_reads_precomputed_neighbours(self, pool):
+        rebuild_similar(k=5)
+
+        _, similar = services.get_property_detail(slug=pool.slug)
+
+        assert [p.title for p in similar] == ["Twin flat", "Mansion"]
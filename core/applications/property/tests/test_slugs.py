@@ -0,0 +1,121 @@
+import pytest
+from django.db import IntegrityError
+
+from core.applications.property import models as property_models
+from core.applications.property.models import Property
+from core.applications.property.slugs import SLUG_ATTEMPTS
+from core.applications.property.slugs import allocate_slug
+from core.applications.property.slugs import allocate_slugs
+from core.applications.property.slugs import base_slug
+from core.applications.property.tests.factories import AgentProfileFactory
+from core.applications.property.tests.factories import PropertyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _rename(prop, slug: str) -> None:
+    Property.objects.filter(pk=prop.pk).update(slug=slug)
+
+
+class TestAllocateSlugs:
+    def test_free_base_is_used_bare(self):
+        assert allocate_slug(Property.objects, "Flat in Lekki") == "flat-in-lekki"
+
+    def test_taken_base_gets_the_next_suffix(self):
+        PropertyFactory(title="Flat in Lekki")
+        _rename(PropertyFactory(), "flat-in-lekki-4")
+
+        assert allocate_slug(Property.objects, "Flat in Lekki") == "flat-in-lekki-5"
+
+    def test_first_suffix_after_the_bare_base(self):
+        PropertyFactory(title="Flat")
+
+        assert allocate_slug(Property.objects, "Flat") == "flat-1"
+
+    def test_longer_slugs_sharing_the_prefix_are_ignored(self):
+        _rename(PropertyFactory(), "flat-in-lekki")
+        _rename(PropertyFactory(), "flat-in-lekki-9")
+        _rename(PropertyFactory(), "flat-2b")
+
+        assert allocate_slug(Property.objects, "Flat") == "flat"
+
+    def test_suffixed_slug_of_a_prefix_base_is_not_a_suffix(self):
+        # "flat-2" is the bare slug of "Flat 2", and suffix 2 of "Flat".
+        PropertyFactory(title="Flat")
+        PropertyFactory(title="Flat 2")
+
+        assert allocate_slugs(Property.objects, ["Flat", "Flat 2"]) == ["flat-3", "flat-2-1"]
+
+    def test_batch_hands_out_distinct_slugs(self):
+        PropertyFactory(title="Villa")
+
+        slugs = allocate_slugs(Property.objects, ["Villa", "Villa", "Loft", "Loft"])
+
+        assert slugs == ["villa-1", "villa-2", "loft", "loft-1"]
+
+    def test_excluded_slugs_are_skipped(self):
+        PropertyFactory(title="Villa")
+
+        slugs = allocate_slugs(Property.objects, ["Villa", "Loft"], exclude=["villa-1", "loft"])
+
+        assert slugs == ["villa-2", "loft-1"]
+
+    def test_base_leaves_room_for_a_suffix(self):
+        base = base_slug("x" * 300, max_length=255)
+
+        assert len(base) == 255 - 10
+        assert base_slug("!!!", max_length=255) == "listing"
+
+
+class TestSaveWithNewSlug:
+    def test_collision_is_retried_with_the_lost_slug_excluded(self, monkeypatch):
+        rival = PropertyFactory(title="Rival")
+        calls = []
+
+        def racing(queryset, title, *, exclude=()):
+            slug = allocate_slug(queryset, title, exclude=exclude)
+            calls.append((slug, list(exclude)))
+            if len(calls) == 1:
+                # A concurrent create claims the slug before our insert.
+                _rename(rival, slug)
+            return slug
+
+        monkeypatch.setattr(property_models, "allocate_slug", racing)
+
+        prop = PropertyFactory(title="Flat")
+
+        assert calls == [("flat", []), ("flat-1", ["flat"])]
+        assert prop.slug == "flat-1"
+        assert Property.objects.filter(slug="flat-1", pk=prop.pk).exists()
+
+    def test_gives_up_after_the_last_attempt(self, monkeypatch):
+        _rename(PropertyFactory(), "taken")
+        prop = PropertyFactory.build(agent=AgentProfileFactory())
+        attempts = []
+        monkeypatch.setattr(
+            property_models,
+            "allocate_slug",
+            lambda *args, **kwargs: attempts.append(kwargs["exclude"][:]) or "taken",
+        )
+
+        with pytest.raises(IntegrityError):
+            prop.save()
+
+        assert len(attempts) == SLUG_ATTEMPTS
+        assert prop.slug == ""
+
+    def test_other_integrity_errors_are_not_retried(self, monkeypatch):
+        prop = PropertyFactory.build(agent=AgentProfileFactory(), bedrooms=None)
+        attempts = []
+
+        def allocate(*args, **kwargs):
+            attempts.append(1)
+            return "fresh"
+
+        monkeypatch.setattr(property_models, "allocate_slug", allocate)
+
+        with pytest.raises(IntegrityError):
+            prop.save()
+
+        assert attempts == [1]
+        assert prop.slug == ""
@@ -0,0 +1,59 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.applications.property.tests.factories import AmenityFactory
+from core.applications.property.tests.factories import PropertyFactory
+
+pytestmark = pytest.mark.django_db
+
+LIST_URL = "/api/v1/property/"
+
+
+@pytest.fixture
+def listing():
+    prop = PropertyFactory()
+    prop.amenities.add(AmenityFactory())
+    return prop
+
+
+class TestSparseFieldsets:
+    def test_fields_keeps_only_the_named_fields(self, listing):
+        response = APIClient().get(LIST_URL, {"fields": "id,title,price"})
+
+        assert response.status_code == 200
+        assert set(response.data["results"][0]) == {"id", "title", "price"}
+
+    def test_omit_drops_fields(self, listing):
+        full = APIClient().get(LIST_URL).data["results"][0]
+        trimmed = APIClient().get(LIST_URL, {"omit": "agent,title"}).data["results"][0]
+
+        assert set(trimmed) == set(full) - {"agent", "title"}
+
+    def test_unknown_names_are_ignored(self, listing):
+        response = APIClient().get(LIST_URL, {"fields": "id,nonsense"})
+
+        assert set(response.data["results"][0]) == {"id"}
+
+    def test_unrequested_relations_and_columns_are_not_loaded(self, listing):
+        with CaptureQueriesContext(connection) as queries:
+            APIClient().get(LIST_URL, {"omit": "is_favorited"})
+        sql = " ".join(q["sql"] for q in queries)
+        assert "users_agentprofile" in sql
+        assert "property_propertyimage" in sql
+
+        with CaptureQueriesContext(connection) as queries:
+            APIClient().get(LIST_URL, {"fields": "id,title"})
+
+        sql = " ".join(q["sql"] for q in queries)
+        assert "users_agentprofile" not in sql
+        assert "property_propertyimage" not in sql
+        assert '"property_property"."description"' not in sql
+
+    def test_detail_accepts_fields(self, listing):
+        response = APIClient().get(f"{LIST_URL}{listing.slug}/", {"fields": "title,amenities"})
+
+        assert response.status_code == 200
+        assert set(response.data) == {"title", "amenities"}
+        assert len(response.data["amenities"]) == 1
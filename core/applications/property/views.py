@@ -27,6 +27,9 @@ from django.views.generic import UpdateView
 
 # from core.applications.notifications.utils.notifications import notify_new_property_listing, notify_price_change
 from core.applications.property.forms import LeadCreateForm
+from core.applications.property.gallery import add_gallery_images
+from core.applications.property.gallery import check_gallery_limit
+from core.applications.property.home_page import invalidate_home_page
 from core.applications.property.forms import LeadStatusForm
 from core.applications.property.forms import PropertyForm
 from core.applications.property.forms import PropertyImageForm
@@ -41,11 +44,13 @@ from core.applications.property.models import PropertyType
 from core.applications.property.models import PropertyViewing
 from core.applications.subscriptions.features import FEATURE_LIMITS
 from core.applications.subscriptions.models import FeaturedListing
+from core.applications.subscriptions.services.boost import sync_featured_flags
 from core.helpers.enums import Lead_Status_Choices, SubscriptionPlan
 from core.helpers.enums import LeadStatus
 from core.helpers.enums import PropertyListingType
 from core.helpers.enums import UserRoleChoice
 from core.helpers.mixins import AgentApprovalRequiredMixin
+from core.helpers.service_errors import SubscriptionLimitError
 from core.utils.notifications import notify_new_property_listing
 from core.utils.notifications import notify_price_change
 from core.utils.utils import process_new_lead
@@ -123,8 +128,10 @@ class PropertyCreateView(
             notify_new_property_listing(self.object)
 
         # ✅ Handle image uploads
-        for image in self.request.FILES.getlist("images"):
-            PropertyImage.objects.create(property=self.object, image=image)
+        try:
+            add_gallery_images(self.object, self.request.FILES.getlist("images"))
+        except SubscriptionLimitError as e:
+            messages.error(self.request, str(e))
 
         messages.success(self.request, "✅ Property created successfully!")
         return response
@@ -193,8 +200,10 @@ class PropertyUpdateView(
             notify_price_change(self.object, old_price)
 
         # ✅ Handle image uploads
-        for image in self.request.FILES.getlist("images"):
-            PropertyImage.objects.create(property=self.object, image=image)
+        try:
+            add_gallery_images(self.object, self.request.FILES.getlist("images"))
+        except SubscriptionLimitError as e:
+            messages.error(self.request, str(e))
 
         messages.success(self.request, "✅ Property updated successfully!")
         return response
@@ -260,6 +269,11 @@ class PropertyImageCreateView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         """Ensure images are associated with the correct property."""
         property_obj = get_object_or_404(Property, id=self.kwargs["property_id"])
+        try:
+            check_gallery_limit(property_obj, current_count=property_obj.images.count(), adding=1)
+        except SubscriptionLimitError as e:
+            messages.error(self.request, str(e))
+            return self.form_invalid(form)
         form.instance.property = property_obj
         response = super().form_valid(form)
         messages.success(self.request, "Image uploaded successfully!")
@@ -290,8 +304,10 @@ def upload_property_images(request, property_id):
         property_obj = get_object_or_404(Property, id=property_id)
 
         images = request.FILES.getlist("images")
-        for image in images:
-            PropertyImage.objects.create(property=property_obj, image=image)
+        try:
+            add_gallery_images(property_obj, images)
+        except SubscriptionLimitError as e:
+            return JsonResponse({"error": str(e)}, status=400)
 
         return JsonResponse({"message": "Images uploaded successfully!"}, status=200)
 
@@ -401,6 +417,9 @@ class UnfeaturePropertyView(LoginRequiredMixin, UserPassesTestMixin, View):
         ).update(is_active=False)
 
         if updated:
+            # Bulk update() sends no post_save.
+            sync_featured_flags([property_obj.pk])
+            invalidate_home_page()
             messages.success(
                 request,
                 f"✅ '{property_obj.title}' has been unfeatured successfully.",
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property', '0019_property_featured_until'),
+        ('subscriptions', '0004_alter_featuredlisting_property'),
+        ('users', '0007_agentprofile_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='featuredlisting',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['end_date'], name='featured_active_end_idx'),
+        ),
+    ]
@@ -287,6 +287,14 @@ class FeaturedListing(UIDTimeBasedModel):
         ordering = ["-start_date"]
         verbose_name = "Featured Listing"
         verbose_name_plural = "Featured Listings"
+        indexes = [
+            # The expiry sweeper's scan (services.boost.deactivate_expired_boosts).
+            models.Index(
+                fields=["end_date"],
+                condition=models.Q(is_active=True),
+                name="featured_active_end_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Boosted: {self.property} by {self.agent.user.get_full_name()}"
@@ -307,8 +315,6 @@ class FeaturedListing(UIDTimeBasedModel):
 
         super().save(*args, **kwargs)
 
-        super().save(*args, **kwargs)
-
     def is_currently_active(self):
         return self.is_active and (
             self.end_date is None or self.end_date >= timezone.now()
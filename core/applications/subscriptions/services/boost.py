@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import transaction as db_transaction
+from django.db.models import Exists
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models.functions import Now
 from django.utils import timezone
 from rest_framework.exceptions import NotFound
 
+from core.applications.property.home_page import invalidate_home_page
 from core.applications.property.models import Property
+from core.applications.property.search_documents import schedule_document_sync
 from core.applications.subscriptions.models import FeaturedListing
 
 
@@ -27,30 +38,63 @@ def boost_property(*, agent, property_id: str, transaction_id: str, amount: floa
             transaction_id=transaction_id,
             amount_paid=amount,
         )
+        featured.end_date = timezone.now() + timedelta(days=featured.boost_duration)
         featured.full_clean()
+        # The post_save handler syncs Property.is_featured / featured_until.
         featured.save()
 
-        Property.objects.filter(pk=prop.pk).update(is_featured=True)
-
     return featured
 
 
-def deactivate_expired_boosts() -> int:
+def sync_featured_flags(property_ids) -> int:
+    """
+    Recompute ``Property.is_featured`` / ``featured_until`` for
+    ``property_ids`` from their active boosts.  ``featured_until`` is the
+    latest end date, or NULL when a boost is open-ended (or there is none).
+    Returns the number of properties updated.
+    """
+    active = FeaturedListing.objects.filter(property=OuterRef("pk"), is_active=True).filter(
+        Q(end_date__isnull=True) | Q(end_date__gt=Now()),
+    )
+    return Property.objects.filter(pk__in=property_ids).update(
+        is_featured=Exists(active),
+        featured_until=Subquery(
+            active.order_by(F("end_date").desc(nulls_first=True)).values("end_date")[:1],
+        ),
+        updated_at=Now(),
+    )
+
+
+def deactivate_expired_boosts(*, batch_size: int | None = None) -> int:
     """
     Called by a periodic task (Celery beat) to expire stale boosts.
+
+    Works through the expired boosts ``batch_size`` rows at a time, each
+    batch in its own short transaction: the boosts are flipped to inactive
+    and their properties' featured columns resynced.  Rows locked by a
+    concurrent sweep are skipped rather than waited on.
     Returns count of deactivated listings.
     """
+    batch_size = batch_size or settings.FEATURED_EXPIRY_BATCH_SIZE
+    expired = FeaturedListing.objects.filter(is_active=True, end_date__lte=Now())
+    count = 0
 
-    expired = FeaturedListing.objects.filter(
-        is_active=True,
-        end_date__lt=timezone.now(),
-    )
-    count = expired.count()
-
-    # Capture IDs before update — queryset won't match after is_active flips
-    expired_property_ids = list(expired.values_list("property_id", flat=True))
-    expired.update(is_active=False)
+    while True:
+        with db_transaction.atomic():
+            batch = list(
+                expired.order_by("end_date")
+                .select_for_update(skip_locked=True)
+                .values_list("pk", "property_id")[:batch_size],
+            )
+            if not batch:
+                break
+            FeaturedListing.objects.filter(pk__in=[pk for pk, _ in batch]).update(is_active=False)
+            property_ids = {property_id for _, property_id in batch}
+            sync_featured_flags(property_ids)
+            schedule_document_sync(property_ids)
+        count += len(batch)
 
-    Property.objects.filter(pk__in=expired_property_ids).update(is_featured=False)
+    if count:
+        invalidate_home_page()
 
     return count
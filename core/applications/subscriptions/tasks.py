@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from core.applications.subscriptions.services.boost import deactivate_expired_boosts
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def expire_featured_listings() -> None:
+    """Every few minutes (CELERY_BEAT_SCHEDULE): expire lapsed boosts in batches."""
+    expired = deactivate_expired_boosts()
+    if expired:
+        logger.info("Expired %s featured listings", expired)
@@ -4,6 +4,8 @@ from django.contrib import admin
 from django.contrib.auth import admin as auth_admin
 from django.utils.translation import gettext_lazy as _
 
+from core.applications.property.home_page import invalidate_home_page
+
 from .forms import UserAdminChangeForm
 from .forms import UserAdminCreationForm
 from .models import AgentProfile
@@ -74,6 +76,7 @@ class AgentProfileAdmin(admin.ModelAdmin):
     )
     def approve_agents(self, request, queryset):
         queryset.update(verified=True)
+        invalidate_home_page()
         self.message_user(request, "Selected agents have been approved.")
 
 
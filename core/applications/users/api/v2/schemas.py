@@ -5,6 +5,8 @@ from drf_spectacular.utils import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from drf_spectacular.utils import extend_schema_view
 
+from core.applications.property.api.schema.property_schemas import EXPORT_PARAMETERS
+from core.applications.property.api.schema.property_schemas import EXPORT_RESPONSES
 from core.applications.users.api.v2.serializers import AdminAgentDetailSerializer
 from core.applications.users.api.v2.serializers import AdminAgentListSerializer
 from core.applications.users.api.v2.serializers import AdminAgentVerificationSerializer
@@ -72,6 +74,33 @@ Admin-only. Soft-removes an agent:
         responses={200: AdminPropertyListSerializer(many=True)},
         tags=["Admin — Agents"],
     ),
+    export=extend_schema(
+        summary="Export Agents",
+        description="""
+Admin-only. Every agent matching the list filters, streamed as CSV or
+NDJSON instead of one JSON document. Columns include contact details,
+verification state and the listing / lead / viewing counters.
+        """,
+        parameters=[
+            OpenApiParameter("verification_status", OpenApiTypes.STR),
+            OpenApiParameter("agent_type", OpenApiTypes.STR),
+            OpenApiParameter("search", OpenApiTypes.STR),
+            OpenApiParameter("ordering", OpenApiTypes.STR),
+            *EXPORT_PARAMETERS,
+        ],
+        responses=EXPORT_RESPONSES,
+        tags=["Admin — Agents"],
+    ),
+    properties_export=extend_schema(
+        summary="Export Agent Properties",
+        description="Admin-only. A specific agent's properties, streamed as CSV or NDJSON.",
+        parameters=[
+            OpenApiParameter("visible", OpenApiTypes.BOOL),
+            *EXPORT_PARAMETERS,
+        ],
+        responses=EXPORT_RESPONSES,
+        tags=["Admin — Agents"],
+    ),
 )
 
 AdminPropertyViewSetSchema = extend_schema_view(
@@ -13,7 +13,7 @@ class AdminAgentListSerializer(serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
     email = serializers.SerializerMethodField()
     phone_number = serializers.SerializerMethodField()
-    total_listings = serializers.SerializerMethodField()
+    total_listings = serializers.IntegerField(read_only=True)
     profile_picture = serializers.SerializerMethodField()
 
     class Meta:
@@ -47,9 +47,6 @@ class AdminAgentListSerializer(serializers.ModelSerializer):
     def get_profile_picture(self, obj) -> str:
         return obj.get_profile_picture
 
-    def get_total_listings(self, obj) -> int:
-        return obj.properties.count()
-
 
 class AdminAgentDetailSerializer(AdminAgentListSerializer):
     """
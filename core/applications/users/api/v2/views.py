@@ -2,10 +2,13 @@
 
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
+from core.applications.property.api.serializers import SparseFieldset
+from core.applications.property.exports import PROPERTY_EXPORT_COLUMNS
 from core.applications.users.api.v2.schemas import AdminAgentViewSetSchema
 from core.applications.users.api.v2.schemas import AdminPropertyViewSetSchema
 from core.applications.users.api.v2.serializers import AdminAgentDetailSerializer
@@ -16,6 +19,8 @@ from core.applications.users.api.v2.serializers import AdminPropertyListSerializ
 from core.applications.users.api.v2.serializers import AdminPropertyModerationSerializer
 from core.applications.users.permissions import IsAdminUser
 from core.applications.users.services import admin_services as services
+from core.helpers.exports import select_columns
+from core.helpers.exports import streaming_export
 
 
 def _parse_bool(value: str | None) -> bool | None:
@@ -23,6 +28,22 @@ def _parse_bool(value: str | None) -> bool | None:
         return None
     return value.lower() in ("true", "1", "yes")
 
+
+def _export(request: Request, queryset, columns: dict, *, name: str):
+    """
+    Streams ``queryset`` as CSV, or NDJSON with ``?file_format=ndjson``,
+    limited to the ``?fields=`` / ``?omit=`` columns.
+    """
+    try:
+        return streaming_export(
+            queryset,
+            select_columns(columns, SparseFieldset.from_request(request)),
+            file_format=request.query_params.get("file_format", "csv"),
+            name=name,
+        )
+    except ValueError as exc:
+        raise ValidationError({"detail": str(exc)})
+
 @AdminAgentViewSetSchema
 class AdminAgentViewSet(ViewSet):
     """
@@ -45,6 +66,21 @@ class AdminAgentViewSet(ViewSet):
         serializer = AdminAgentListSerializer(qs, many=True)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request):
+        """
+        Every agent matching the list filters, streamed as CSV / NDJSON.
+        GET /admin/agents/export/
+        """
+        params = request.query_params
+        qs = services.get_all_agents(
+            verification_status=params.get("verification_status"),
+            agent_type=params.get("agent_type"),
+            search=params.get("search"),
+            ordering=params.get("ordering", "-created_at"),
+        )
+        return _export(request, qs, services.AGENT_EXPORT_COLUMNS, name="agents")
+
     def retrieve(self, request: Request, pk=None) -> Response:
         """Full agent detail including sensitive fields."""
         agent = services.get_agent_detail(agent_id=pk)
@@ -95,6 +131,18 @@ class AdminAgentViewSet(ViewSet):
         serializer = AdminPropertyListSerializer(qs, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=["get"], url_path="properties/export")
+    def properties_export(self, request: Request, pk=None):
+        """
+        A specific agent's properties, streamed as CSV / NDJSON.
+        GET /admin/agents/{id}/properties/export/
+        """
+        qs = services.get_agent_properties(
+            agent_id=pk,
+            visible=_parse_bool(request.query_params.get("visible")),
+        )
+        return _export(request, qs, PROPERTY_EXPORT_COLUMNS, name="agent-properties")
+
 @AdminPropertyViewSetSchema
 class AdminPropertyViewSet(ViewSet):
     """
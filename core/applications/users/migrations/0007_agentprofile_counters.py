@@ -0,0 +1,69 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count_for_agent(queryset, agent_path):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{agent_path: OuterRef("pk")})
+            .order_by()
+            .values(agent_path)
+            .annotate(total=Count("pk"))
+            .values("total"),
+        ),
+        0,
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    AgentProfile = apps.get_model("users", "AgentProfile")
+    Property = apps.get_model("property", "Property")
+    Lead = apps.get_model("property", "Lead")
+    PropertyViewing = apps.get_model("property", "PropertyViewing")
+    AgentProfile.objects.update(
+        total_listings=_count_for_agent(Property.objects.all(), "agent"),
+        active_listings=_count_for_agent(Property.objects.filter(is_available=True), "agent"),
+        total_leads=_count_for_agent(Lead.objects.all(), "agent"),
+        closed_deals=_count_for_agent(Lead.objects.filter(status="Closed"), "agent"),
+        total_viewings=_count_for_agent(PropertyViewing.objects.all(), "property__agent"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_alter_agentprofile_verification_status_and_more'),
+        ('property', '0017_listing_category_counter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agentprofile',
+            name='active_listings',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='agentprofile',
+            name='closed_deals',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='agentprofile',
+            name='total_leads',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='agentprofile',
+            name='total_listings',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='agentprofile',
+            name='total_viewings',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -13,6 +13,7 @@ from django.db.models import DecimalField
 from django.db.models import EmailField
 from django.db.models import FileField
 from django.db.models import ImageField
+from django.db.models import IntegerField
 from django.db.models import JSONField
 from django.db.models import PositiveIntegerField
 from django.db.models import TextField
@@ -27,6 +28,7 @@ from core.helpers.enums import UserRoleChoice
 from core.helpers.enums import VerificationStatusChoices
 from core.helpers.media import MediaHelper
 from core.helpers.models import UIDTimeBasedModel
+from core.helpers.models import save_fields_except
 
 from .managers import UserManager
 
@@ -277,6 +279,16 @@ class SocialMediaLinks(UIDTimeBasedModel):
 # ---------------------------------------------------------------------------
 
 
+# AgentProfile counter columns, moved by core.applications.property.counters.
+AGENT_COUNTER_FIELDS = (
+    "total_listings",
+    "active_listings",
+    "total_leads",
+    "closed_deals",
+    "total_viewings",
+)
+
+
 class AgentProfile(BaseProfile):
     """
     Extended profile for Agent / Landlord accounts.
@@ -337,6 +349,17 @@ class AgentProfile(BaseProfile):
         null=True,
     )
 
+    # ------------------------------------------------------------------
+    # Counters — kept current with F() updates by
+    # core.applications.property.counters; ``manage.py
+    # rebuild_agent_counters`` recounts them.
+    # ------------------------------------------------------------------
+    total_listings = IntegerField(default=0, editable=False)
+    active_listings = IntegerField(default=0, editable=False)
+    total_leads = IntegerField(default=0, editable=False)
+    closed_deals = IntegerField(default=0, editable=False)
+    total_viewings = IntegerField(default=0, editable=False)
+
     # ------------------------------------------------------------------
     # Verification documents
     # ------------------------------------------------------------------
@@ -378,6 +401,25 @@ class AgentProfile(BaseProfile):
         verbose_name_plural = "Agent Profiles"
         ordering = ["-id"]
 
+    def save(self, *args, **kwargs):
+        """
+        A full save of an existing profile leaves the counter columns out:
+        they only move through ``F()`` updates, and the in-memory values
+        may predate the latest one.  Name a counter in ``update_fields`` to
+        write it deliberately.
+
+        Because such a save pins ``update_fields``, saving an instance whose
+        row has been deleted raises ``DatabaseError`` rather than inserting
+        it again; use ``save(force_insert=True)`` to recreate a row.
+        """
+        if (
+            kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not self._state.adding
+        ):
+            kwargs["update_fields"] = save_fields_except(self, AGENT_COUNTER_FIELDS)
+        super().save(*args, **kwargs)
+
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
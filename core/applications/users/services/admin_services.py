@@ -8,6 +8,33 @@ from core.applications.users.models import AgentProfile
 from core.helpers.enums import VerificationStatusChoices
 
 
+# Columns for the streaming agent export (core.helpers.exports).
+AGENT_EXPORT_COLUMNS = {
+    "id": "id",
+    "name": "user__name",
+    "first_name": "user__first_name_field",
+    "last_name": "user__last_name_field",
+    "email": "user__email",
+    "phone_number": "user__phone_number",
+    "is_active": "user__is_active",
+    "agent_type": "agent_type",
+    "company_name": "company_name",
+    "license_number": "license_number",
+    "office_location": "office_location",
+    "office_phone_no": "office_phone_no",
+    "rating": "rating",
+    "years_of_experience": "years_of_experience",
+    "verified": "verified",
+    "verification_status": "verification_status",
+    "total_listings": "total_listings",
+    "active_listings": "active_listings",
+    "total_leads": "total_leads",
+    "closed_deals": "closed_deals",
+    "total_viewings": "total_viewings",
+    "created_at": "created_at",
+}
+
+
 def get_all_agents(
     *,
     verification_status: str | None = None,
@@ -19,7 +46,7 @@ def get_all_agents(
     Returns a queryset of all agents for the admin management table.
     Supports filtering by verification status, agent type, and search.
     """
-    from django.db.models import Count, Q
+    from django.db.models import Q
 
     allowed_ordering = {
         "created_at", "-created_at",
@@ -27,12 +54,8 @@ def get_all_agents(
         "verified", "-verified",
     }
 
-    qs = (
-        AgentProfile.objects
-        .select_related("user")
-        .prefetch_related("properties")
-        .annotate(property_count=Count("properties", distinct=True))
-    )
+    # Listing totals come from the AgentProfile counter columns.
+    qs = AgentProfile.objects.select_related("user")
 
     if verification_status:
         qs = qs.filter(verification_status=verification_status)
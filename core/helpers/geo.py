@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+
+from django.db.models import F
+from django.db.models import FloatField
+from django.db.models import Value
+from django.db.models.functions import ASin
+from django.db.models.functions import Cast
+from django.db.models.functions import Cos
+from django.db.models.functions import Least
+from django.db.models.functions import Power
+from django.db.models.functions import Radians
+from django.db.models.functions import Sin
+from django.db.models.functions import Sqrt
+
+# Mean Earth radius (IUGG).
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> tuple[float, float, float, float]:
+    """
+    Returns ``(min_lat, min_lng, max_lat, max_lng)`` enclosing a circle of
+    ``radius_km`` around the point.  Used as an index-friendly pre-filter
+    before the exact haversine check.  Longitude spread is widened to the
+    full range near the poles, where degrees of longitude collapse.
+    """
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    cos_lat = math.cos(math.radians(lat))
+    dlng = 180.0 if cos_lat < 1e-6 else min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+    return (
+        max(lat - dlat, -90.0),
+        max(lng - dlng, -180.0),
+        min(lat + dlat, 90.0),
+        min(lng + dlng, 180.0),
+    )
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points, in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def distance_km_expression(lat: float, lng: float, lat_field: str = "latitude", lng_field: str = "longitude"):
+    """
+    Haversine distance from ``(lat, lng)`` to each row, as a SQL expression
+    (``FloatField``).  Pair with a bounding-box filter so the lat/lng index
+    narrows the rows first.
+    """
+    row_lat = Radians(Cast(F(lat_field), FloatField()))
+    row_lng = Radians(Cast(F(lng_field), FloatField()))
+    point_lat = Value(math.radians(lat), output_field=FloatField())
+    point_lng = Value(math.radians(lng), output_field=FloatField())
+
+    a = Power(Sin((row_lat - point_lat) / 2), 2) + (
+        Cos(point_lat) * Cos(row_lat) * Power(Sin((row_lng - point_lng) / 2), 2)
+    )
+    # LEAST(…, 1) guards ASIN against rounding just past 1 near antipodes.
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(
+        Least(Sqrt(a), Value(1.0, output_field=FloatField())),
+    )
+
+
+def parse_bbox(raw: str) -> tuple[float, float, float, float]:
+    """
+    Parses a ``"west,south,east,north"`` viewport string (Leaflet's
+    ``LatLngBounds.toBBoxString()`` order) into
+    ``(min_lat, min_lng, max_lat, max_lng)``.
+
+    Raises ``ValueError`` for anything malformed or out of range.
+    """
+    parts = [float(part) for part in raw.split(",")]
+    if len(parts) != 4:
+        msg = "bbox must be 'west,south,east,north'."
+        raise ValueError(msg)
+    west, south, east, north = parts
+    if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+        msg = "bbox coordinates are out of range or inverted."
+        raise ValueError(msg)
+    return south, west, north, east
+
+
+# ---------------------------------------------------------------------------
+# Geohash
+# ---------------------------------------------------------------------------
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+_GEOHASH_INDEX = {char: i for i, char in enumerate(_GEOHASH_ALPHABET)}
+GEOHASH_MAX_PRECISION = 12
+
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_MAX_PRECISION) -> str:
+    """Standard base-32 geohash of the point (interleaved lng/lat bits)."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            value = (value << 1) | (lng >= mid)
+            lng_lo, lng_hi = (mid, lng_hi) if lng >= mid else (lng_lo, mid)
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            value = (value << 1) | (lat >= mid)
+            lat_lo, lat_hi = (mid, lat_hi) if lat >= mid else (lat_lo, mid)
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return "".join(chars)
+
+
+def geohash_bounds(geohash: str) -> tuple[float, float, float, float]:
+    """Returns the cell's ``(min_lat, min_lng, max_lat, max_lng)``."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    even = True
+    for char in geohash:
+        value = _GEOHASH_INDEX[char]
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if even:
+                mid = (lng_lo + lng_hi) / 2
+                lng_lo, lng_hi = (mid, lng_hi) if bit else (lng_lo, mid)
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                lat_lo, lat_hi = (mid, lat_hi) if bit else (lat_lo, mid)
+            even = not even
+    return lat_lo, lng_lo, lat_hi, lng_hi
+
+
+def geohash_cell_size(precision: int) -> tuple[float, float]:
+    """``(height, width)`` in degrees of a cell at ``precision``."""
+    bits = 5 * precision
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def geohash_cells(
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    precision: int,
+) -> list[str]:
+    """Every cell at ``precision`` that intersects the bounding box."""
+    height, width = geohash_cell_size(precision)
+    # Snap to the cell grid so each step lands inside a new cell.
+    lat = math.floor((min_lat + 90) / height) * height - 90 + height / 2
+    start_lng = math.floor((min_lng + 180) / width) * width - 180 + width / 2
+    cells = []
+    while lat - height / 2 <= max_lat and lat < 90:
+        lng = start_lng
+        while lng - width / 2 <= max_lng and lng < 180:
+            cells.append(geohash_encode(lat, lng, precision))
+            lng += width
+        lat += height
+    return cells
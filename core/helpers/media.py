@@ -1,3 +1,4 @@
+import hashlib
 from time import time
 
 from django.template.defaultfilters import slugify
@@ -24,6 +25,15 @@ class MediaHelper:
 
         return f"{path}/{filename}"
 
+    @staticmethod
+    def content_hash(file) -> str:
+        """SHA-256 hex digest of a file's bytes; leaves it rewound."""
+        digest = hashlib.sha256()
+        for chunk in file.chunks():
+            digest.update(chunk)
+        file.seek(0)
+        return digest.hexdigest()
+
     @staticmethod
     def get_image_upload_path(model, filename):
         """Generate upload path for images to prevent duplicate"""
@@ -1,10 +1,10 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.db.models import Q
 from django.shortcuts import redirect
 
 from core.applications.property.forms import PropertySearchForm
+from core.applications.property.querysets.property_queryset import AMENITY_MATCH_ALL
 
 
 class RoleRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
@@ -71,18 +71,19 @@ class PropertySearchMixin:
         form = PropertySearchForm(self.request.GET)
 
         self.search_form = form  # Store the form for access in context
+        ordering = ("-created_at",)
 
         if form.is_valid():
             cd = form.cleaned_data
 
             q = cd.get("q")
             if q:
-                base_queryset = base_queryset.filter(
-                    Q(title__icontains=q) | Q(description__icontains=q),
-                )
+                # Full-text match on the indexed search_vector, best hits first.
+                base_queryset = base_queryset.search(q)
+                ordering = ("-search_rank", "-created_at")
 
             if cd.get("location"):
-                base_queryset = base_queryset.filter(location__icontains=cd["location"])
+                base_queryset = base_queryset.by_location(cd["location"], fuzzy=True)
 
             if cd.get("property_type"):
                 base_queryset = base_queryset.filter(property_type=cd["property_type"])
@@ -100,10 +101,13 @@ class PropertySearchMixin:
                 base_queryset = base_queryset.filter(bathrooms__gte=cd["min_bathrooms"])
 
             if cd.get("amenities"):
-                for amenity in cd["amenities"]:
-                    base_queryset = base_queryset.filter(amenities=amenity)
+                # One GIN containment lookup instead of a join per amenity.
+                base_queryset = base_queryset.by_amenities(
+                    [amenity.pk for amenity in cd["amenities"]],
+                    match=AMENITY_MATCH_ALL,
+                )
 
-        return base_queryset.order_by("-created_at").distinct()
+        return base_queryset.order_by(*ordering)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
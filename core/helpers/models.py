@@ -24,6 +24,25 @@ def generate_uuid() -> str:
     return uuid.uuid4().hex
 
 
+def save_fields_except(instance: models.Model, excluded) -> list[str]:
+    """
+    ``update_fields`` for a full save of ``instance`` that leaves the
+    ``excluded`` columns as they are in the database — for counter caches
+    moved only by ``F()`` updates, which a stale in-memory copy would
+    otherwise overwrite.  Deferred fields are skipped, as ``save()`` does.
+
+    A save with ``update_fields`` never falls back to an INSERT: if the row
+    has been deleted, Django raises ``DatabaseError`` ("Save with
+    update_fields did not affect any rows") instead of recreating it.
+    """
+    deferred = instance.get_deferred_fields()
+    return [
+        field.name
+        for field in instance._meta.concrete_fields
+        if not field.primary_key and field.name not in excluded and field.attname not in deferred
+    ]
+
+
 class ChoiceArrayField(ArrayField):
     def formfield(self, **kwargs):
         defaults = {
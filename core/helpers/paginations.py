@@ -1,5 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+import datetime
+import json
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage
+from django.core.paginator import PageNotAnInteger
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import BooleanField
+from django.db.models import Expression
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import Value
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomPagination(PageNumberPagination):
@@ -20,6 +47,146 @@ class CustomPagination(PageNumberPagination):
         )
 
 
+class CachedCountPaginator(DjangoPaginator):
+    """
+    Django paginator whose ``count`` avoids a full ``COUNT(*)`` when it can.
+
+    - Counts are cached per normalised query (ordering stripped, so
+      ``?ordering=`` variants share one entry) for
+      ``PAGINATION_COUNT_CACHE_TIMEOUT`` seconds.
+    - An unfiltered queryset reads the table's ``pg_class.reltuples``
+      estimate once the table is larger than
+      ``PAGINATION_COUNT_ESTIMATE_THRESHOLD`` rows.
+    - A filtered queryset is counted exactly up to that threshold; past it,
+      the planner's row estimate is used instead.
+
+    ``approximate`` is True whenever the count came from an estimate.  In
+    that case page numbers are not clipped to ``num_pages``, since the real
+    result set may be a little larger than the estimate.
+    """
+
+    cache_prefix = "paginator-count"
+
+    @cached_property
+    def _count(self) -> tuple[int, bool]:
+        queryset = self.object_list
+        if not hasattr(queryset, "query"):
+            return len(queryset), False
+
+        key = self._cache_key(queryset)
+        cached = cache.get(key)
+        if cached is not None:
+            return tuple(cached)
+
+        result = self._compute(queryset)
+        cache.set(key, result, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return result
+
+    @property
+    def count(self) -> int:
+        return self._count[0]
+
+    @property
+    def approximate(self) -> bool:
+        return self._count[1]
+
+    def validate_number(self, number):
+        if not self.approximate:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise InvalidPage("That page number is less than 1")
+        return number
+
+    def page(self, number):
+        if not self.approximate:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom : bottom + self.per_page], number, self
+        )
+
+    # ------------------------------------------------------------------
+    # Counting strategies
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, queryset) -> str:
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        digest = hashlib.sha1(f"{sql}|{params!r}".encode()).hexdigest()
+        return f"{self.cache_prefix}:{queryset.db}:{digest}"
+
+    def _compute(self, queryset) -> tuple[int, bool]:
+        threshold = settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+        query = queryset.query
+
+        if not query.where and not query.distinct:
+            estimate = self._table_estimate(queryset)
+            if estimate > threshold:
+                return estimate, True
+            return queryset.count(), False
+
+        capped = queryset.order_by().values("pk")[: threshold + 1].count()
+        if capped <= threshold:
+            return capped, False
+        return max(self._planner_estimate(queryset), capped), True
+
+    @staticmethod
+    def _table_estimate(queryset) -> int:
+        """``reltuples`` is -1 until the table is first analysed."""
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return int(row[0]) if row else -1
+
+    @staticmethod
+    def _planner_estimate(queryset) -> int:
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CachedCountPagination(CustomPagination):
+    """
+    ``CustomPagination`` backed by ``CachedCountPaginator``.
+
+    The response shape is unchanged apart from an ``approximate`` flag;
+    when it is true, ``total`` / ``pages`` are estimates.
+    """
+
+    django_paginator_class = CachedCountPaginator
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data["approximate"] = self.page.paginator.approximate
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["total", "pages", "current", "approximate", "results"],
+            "properties": {
+                "total": {"type": "integer"},
+                "pages": {"type": "integer"},
+                "current": {"type": "integer"},
+                "approximate": {"type": "boolean"},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
 class MyCustomPagination(PageNumberPagination):
     """
     Custom pagination class to handle pagination for log entries.
@@ -29,3 +196,249 @@ class MyCustomPagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 100
     page_size = 10
+
+
+class RowComparison(Expression):
+    """
+    ``(a, b, …) < (x, y, …)`` — a row-value comparison, which Postgres can
+    answer with a single seek on a matching composite index.
+    """
+
+    output_field = BooleanField()
+    conditional = True
+
+    def __init__(self, lhs: list, operator: str, rhs: list):
+        super().__init__()
+        self.lhs, self.operator, self.rhs = list(lhs), operator, list(rhs)
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs, self.rhs = list(exprs[: len(self.lhs)]), list(exprs[len(self.lhs) :])
+
+    def as_sql(self, compiler, connection):
+        sides, params = [], []
+        for exprs in (self.lhs, self.rhs):
+            sqls = []
+            for expr in exprs:
+                sql, expr_params = compiler.compile(expr)
+                sqls.append(sql)
+                params.extend(expr_params)
+            sides.append(f"({', '.join(sqls)})")
+        return f"{sides[0]} {self.operator} {sides[1]}", params
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination for infinite scroll.
+
+    The queryset's own ordering — plus ``id`` as a tie-breaker when it is
+    missing — becomes the key.  Each page is fetched with a
+    ``WHERE (sort columns) beyond (last row seen)`` predicate instead of an
+    ``OFFSET``, and no ``COUNT(*)`` runs, so page 500 costs the same as
+    page 1.
+
+    Cursors are opaque base64 tokens carrying the boundary row's key values,
+    the direction, and the ordering they were issued for; a cursor replayed
+    against a different ``?ordering=`` is rejected with 404.
+
+    Datetimes are carried at full (microsecond) precision, so rows created
+    within the same millisecond are neither skipped nor repeated.
+
+    Only plain field / annotation names are supported in the ordering;
+    ``values()`` querysets work as long as every sort column is selected.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "limit"
+    page_size = 25
+    max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self._get_ordering(queryset)
+
+        position, reverse = self.decode_cursor(request)
+        keys = self._flip(self.ordering) if reverse else self.ordering
+
+        queryset = queryset.order_by(*keys)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self._beyond(queryset.model, keys, position))
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = (position is not None) if reverse else has_more
+        self.has_previous = has_more if reverse else position is not None
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Links
+    # ------------------------------------------------------------------
+
+    def get_next_link(self) -> str | None:
+        if not (self.has_next and self.page):
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def _link(self, row, *, reverse: bool) -> str:
+        values = [self._value(row, name) for name, _ in self._split(self.ordering)]
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            self.encode_cursor(values, reverse=reverse),
+        )
+
+    # ------------------------------------------------------------------
+    # Cursor encoding
+    # ------------------------------------------------------------------
+
+    def encode_cursor(self, values: list, *, reverse: bool) -> str:
+        # DjangoJSONEncoder truncates datetimes and times to milliseconds.
+        values = [
+            value.isoformat() if isinstance(value, datetime.datetime | datetime.time) else value
+            for value in values
+        ]
+        payload = {"o": self.ordering, "v": values, "r": int(reverse)}
+        raw = json.dumps(payload, cls=DjangoJSONEncoder, separators=(",", ":"))
+        return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request) -> tuple[list | None, bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(urlsafe_b64decode(padded.encode()))
+            ordering, values = payload["o"], payload["v"]
+            reverse = bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if ordering != self.ordering or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    # ------------------------------------------------------------------
+    # Ordering / predicate helpers
+    # ------------------------------------------------------------------
+
+    def _get_ordering(self, queryset) -> list[str]:
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(key, str) for key in ordering):
+            msg = "KeysetPagination only supports field-name orderings."
+            raise TypeError(msg)
+        names = {key.lstrip("-") for key in ordering}
+        if not names & {"id", "pk"}:
+            last_desc = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append("-id" if last_desc else "id")
+        return ordering
+
+    @staticmethod
+    def _split(ordering: list[str]) -> list[tuple[str, bool]]:
+        return [(key.lstrip("-"), key.startswith("-")) for key in ordering]
+
+    def _flip(self, ordering: list[str]) -> list[str]:
+        return [name if desc else f"-{name}" for name, desc in self._split(ordering)]
+
+    @staticmethod
+    def _value(row, name: str):
+        if isinstance(row, dict):  # values() rows
+            return row["id" if name == "pk" else name]
+        return row.pk if name == "pk" else getattr(row, name)
+
+    @staticmethod
+    def _field(model, name: str):
+        try:
+            return model._meta.pk if name == "pk" else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None  # annotation
+
+    def _beyond(self, model, keys: list[str], values: list) -> Q | RowComparison:
+        """
+        Lexicographic "strictly after this row" predicate for ``keys``.
+
+        When every key sorts the same way and none can be NULL this is a
+        row-value comparison, ``(created_at, id) < (%s, %s)``, which seeks
+        the composite index directly; otherwise an OR chain that honours
+        Postgres' NULLS LAST (asc) / NULLS FIRST (desc) defaults.
+        """
+        split = self._split(keys)
+        fields = [self._field(model, name) for name, _ in split]
+        # Cursor values come back as JSON; parse them with the column's type.
+        values = [
+            field.to_python(value) if field is not None and value is not None else value
+            for field, value in zip(fields, values)
+        ]
+
+        directions = {desc for _, desc in split}
+        if (
+            len(directions) == 1
+            and None not in values
+            and not any(field is not None and field.null for field in fields)
+        ):
+            return RowComparison(
+                [F(name) for name, _ in split],
+                "<" if directions.pop() else ">",
+                [Value(value, output_field=field) for field, value in zip(fields, values)],
+            )
+
+        predicate = Q(pk__in=[])
+        prefix = Q()
+        for (name, desc), field, value in zip(split, fields, values):
+            nullable = field is not None and field.null
+            if value is None:
+                after = Q(**{f"{name}__isnull": False}) if desc else Q(pk__in=[])
+                equal = Q(**{f"{name}__isnull": True})
+            else:
+                after = Q(**{f"{name}__{'lt' if desc else 'gt'}": value})
+                if nullable and not desc:
+                    after |= Q(**{f"{name}__isnull": True})
+                equal = Q(**{name: value})
+            predicate |= prefix & after
+            prefix &= equal
+        return predicate
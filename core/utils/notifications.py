@@ -1,5 +1,3 @@
-from django.db.models import Q
-
 from core.applications.property.models import PropertySubscription
 from core.helpers.enums import NotificationType
 from core.utils.utils import create_notification
@@ -10,24 +8,21 @@ def notify_new_property_listing(property_instance):
     """
     Notify users who are subscribed to the location or type of a new property.
     """
-    subscriptions = PropertySubscription.objects.filter(
-        Q(property_type=property_instance.property_type)
-        | Q(property_type__isnull=True),
+    subscriptions = PropertySubscription.objects.matching(
+        property_instance.location,
+        property_instance.property_type,
+        fuzzy=True,
     )
 
-    property_location = (property_instance.location or "").lower()
-
     for sub in subscriptions:
-        sub_location = (sub.location or "").lower()
-        if not sub_location or sub_location in property_location:
-            create_notification(
-                user=sub.user,
-                notification_type=NotificationType.NEW_LISTING,
-                title="New Property Listing",
-                message=f"A new {property_instance.property_type} is available in {property_instance.location}.",
-                property=property_instance,
-                metadata={"property_id": property_instance.id},
-            )
+        create_notification(
+            user=sub.user,
+            notification_type=NotificationType.NEW_LISTING,
+            title="New Property Listing",
+            message=f"A new {property_instance.property_type} is available in {property_instance.location}.",
+            property=property_instance,
+            metadata={"property_id": property_instance.id},
+        )
 
 
 def notify_price_change(property_instance, old_price):
@@ -2,7 +2,6 @@ import logging
 
 from django.conf import settings
 from django.core.mail import send_mail
-from django.db import models
 from django.template.loader import render_to_string
 from django.urls import reverse
 
@@ -16,24 +15,15 @@ logger = logging.getLogger(__name__)
 
 def is_user_subscribed_for_property(user, property_obj):
     """
-    Check if a user is subscribed to a property based on location containment and property type.
+    Check if a user is subscribed to a property based on location and property type
+    (see ``PropertySubscriptionQuerySet.matching``).
     """
-    subscriptions = PropertySubscription.objects.filter(
-        user=user,
-    ).filter(
-        models.Q(property_type=property_obj.property_type)
-        | models.Q(property_type__isnull=True),
+    return (
+        PropertySubscription.objects.for_user(user)
+        .matching(property_obj.location, property_obj.property_type, fuzzy=True)
+        .exists()
     )
 
-    property_location = (property_obj.location or "").lower()
-
-    for sub in subscriptions:
-        sub_location = (sub.location or "").lower()
-        if not sub_location or sub_location in property_location:
-            return True
-
-    return False
-
 
 def create_notification(user, notification_type, title, message, **kwargs):
     """